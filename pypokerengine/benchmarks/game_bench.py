@@ -0,0 +1,41 @@
+"""Hands per second of start_poker in the normal and the fast mode.
+
+Six FishPlayers (which always call) play with deep stacks, so every round
+goes to the showdown and the game lasts max_round rounds. The normal mode
+prints every dealt hole card; its output is discarded.
+
+Usage: python -m benchmarks.game_bench [nb_hands]
+"""
+import contextlib
+import io
+import random
+import sys
+import time
+
+import pypokerengine.api.game as G
+from examples.players.fish_player import FishPlayer
+
+SEED = 2026
+NB_HANDS = 300
+NB_PLAYER = 6
+
+def play_game(nb_hands, mode, seed=SEED):
+    random.seed(seed)
+    config = G.setup_config(nb_hands, 100000, 5)
+    for i in range(NB_PLAYER):
+        config.register_player("fish%d" % i, FishPlayer())
+    with contextlib.redirect_stdout(io.StringIO()):
+        return G.start_poker(config, verbose=0, mode=mode)
+
+def run(nb_hands=NB_HANDS):
+    results = {}
+    for mode in ["normal", "fast"]:
+        start = time.perf_counter()
+        play_game(nb_hands, mode)
+        results["start_poker hands/%s" % mode] = nb_hands / (time.perf_counter() - start)
+    for name, hands_per_sec in results.items():
+        print("%-30s %10.0f hands/sec" % (name, hands_per_sec))
+    return results
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NB_HANDS)
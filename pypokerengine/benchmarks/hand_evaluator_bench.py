@@ -0,0 +1,47 @@
+"""Throughput of HandEvaluator.eval_hand against the string based phevaluator path.
+
+Usage: python -m benchmarks.hand_evaluator_bench
+"""
+import random
+import time
+
+import numpy as np
+from phevaluator.evaluator import evaluate_cards
+
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+
+NB_HANDS = 20000
+SEED = 2026
+
+def gen_hands(nb_hands, nb_cards=7, seed=SEED):
+    rng = random.Random(seed)
+    return [rng.sample(range(1, 53), nb_cards) for _ in range(nb_hands)]
+
+def string_eval_hand(hole, community):
+    cards = [HandEvaluator.convert_to_ph_card(card) for card in hole + community]
+    return 7515 - evaluate_cards(*cards)
+
+def measure(func, args_list):
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    elapsed = time.perf_counter() - start
+    return len(args_list) / elapsed
+
+def run(nb_hands=NB_HANDS):
+    hands = gen_hands(nb_hands)
+    card_hands = [[Card.from_id(cid) for cid in hand] for hand in hands]
+    results = {
+        "string eval_hand": measure(string_eval_hand, [(h[:2], h[2:]) for h in card_hands]),
+        "eval_hand": measure(HandEvaluator.eval_hand, [(h[:2], h[2:]) for h in card_hands]),
+        "eval_card_ids": measure(HandEvaluator.eval_card_ids, [(h,) for h in hands]),
+        "gen_hand_rank_info": measure(HandEvaluator.gen_hand_rank_info, [(h[:2], h[2:]) for h in card_hands]),
+        "eval_hand_batch": nb_hands * measure(HandEvaluator.eval_hand_batch, [(np.array(hands),)]),
+    }
+    for name, evals_per_sec in results.items():
+        print("%-20s %12.0f evals/sec" % (name, evals_per_sec))
+    return results
+
+if __name__ == "__main__":
+    run()
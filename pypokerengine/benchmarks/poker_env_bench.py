@@ -0,0 +1,72 @@
+"""Hero decisions per second of PokerEnv, against the same loop on Emulator.
+
+The hero picks a random legal discrete action and the opponents always
+call, heads-up and six-handed with 1000 chips. The Emulator loop plays the
+same policy through Emulator.apply_action, which builds the round_state
+and event dicts for every action. Decisions per hour are per core.
+
+Usage: python -m benchmarks.poker_env_bench [nb_decisions]
+"""
+import contextlib
+import io
+import random
+import sys
+import time
+
+from pypokerengine.api.emulator import Emulator
+from pypokerengine.api.poker_env import PokerEnv
+from pypokerengine.engine.poker_constants import PokerConstants as Const
+
+SEED = 2026
+NB_DECISIONS = 5000
+INITIAL_STACK = 1000
+SB_AMOUNT = 5
+
+def play_env(nb_decisions, nb_player, seed=SEED):
+    rng = random.Random(seed)
+    env = PokerEnv(nb_player=nb_player, initial_stack=INITIAL_STACK, small_blind_amount=SB_AMOUNT, seed=seed)
+    obs, done = env.reset(), False
+    for _ in range(nb_decisions):
+        if done:
+            obs = env.reset()
+        action = rng.choice([a for a, legal in enumerate(obs["legal_actions"]) if legal])
+        obs, _, done, _ = env.step(action)
+
+def play_emulator(nb_decisions, nb_player, seed=SEED):
+    random.seed(seed)
+    rng = random.Random(seed)
+    emulator = Emulator()
+    emulator.set_game_rule(nb_player, 10 ** 9, SB_AMOUNT, 0)
+    players_info = { "uuid%d" % i: { "name": "p%d" % i, "stack": INITIAL_STACK } for i in range(nb_player) }
+    state = emulator.generate_initial_game_state(players_info)
+    decisions = 0
+    # RoundManager.start_new_round prints every dealt hole card
+    with contextlib.redirect_stdout(io.StringIO()):
+        while decisions < nb_decisions:
+            for player in state["table"].seats.players:
+                player.stack = INITIAL_STACK
+            state, _ = emulator.start_new_round(state)
+            while state["street"] != Const.Street.FINISHED:
+                valid_actions = emulator.generate_possible_actions(state)
+                if state["next_player"] == 0:
+                    choices = valid_actions[:2] if valid_actions[2]["amount"]["min"] == -1 else valid_actions
+                    choice = rng.choice(choices)
+                    amount = choice["amount"]["min"] if choice["action"] == "raise" else choice["amount"]
+                    decisions += 1
+                else:
+                    choice, amount = valid_actions[1], valid_actions[1]["amount"]
+                state, _ = emulator.apply_action(state, choice["action"], amount)
+
+def run(nb_decisions=NB_DECISIONS):
+    results = {}
+    for nb_player in [2, 6]:
+        for name, play in [("PokerEnv", play_env), ("Emulator", play_emulator)]:
+            start = time.perf_counter()
+            play(nb_decisions, nb_player)
+            results["%s decisions/%dp" % (name, nb_player)] = nb_decisions / (time.perf_counter() - start)
+    for name, per_sec in results.items():
+        print("%-30s %10.0f /sec %12.0f /hour" % (name, per_sec, per_sec * 3600))
+    return results
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NB_DECISIONS)
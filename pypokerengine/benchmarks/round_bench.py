@@ -0,0 +1,81 @@
+"""Hands per second of RoundManager with copied and in-place states.
+
+Six (and nine) players with 1000 chips play rounds driven directly through
+RoundManager (no player threads or message publishing), choosing between
+fold, call and min raise with a seeded random policy. Stacks are refilled
+after every round so the game never ends. Every message RoundManager
+returns is built, so the timings include round_state encoding (only at
+street starts and round results in delta mode).
+
+Usage: python -m benchmarks.round_bench [nb_hands]
+"""
+import contextlib
+import io
+import random
+import sys
+import time
+
+from pypokerengine.engine.player import Player
+from pypokerengine.engine.poker_constants import PokerConstants as Const
+from pypokerengine.engine.round_manager import RoundManager
+from pypokerengine.engine.table import Table
+from pypokerengine.engine.action_checker import ActionChecker
+
+SEED = 2026
+NB_HANDS = 500
+NB_PLAYER = 6
+INITIAL_STACK = 1000
+SB_AMOUNT = 5
+
+def gen_table(nb_player=NB_PLAYER):
+    table = Table()
+    for i in range(nb_player):
+        table.seats.sitdown(Player("uuid%d" % i, INITIAL_STACK, "p%d" % i))
+    table.set_blind_pos(0, 1)
+    return table
+
+def choose_action(state, rng):
+    players = state["table"].seats.players
+    valid_actions = ActionChecker.legal_actions(players, state["next_player"], state["small_blind_amount"], state["ledger"])
+    r = rng.random()
+    if r < 0.15:
+        return "fold", 0
+    raise_amount = valid_actions[2]["amount"]["min"]
+    if r < 0.8 or raise_amount == -1:
+        return "call", valid_actions[1]["amount"]
+    return "raise", raise_amount
+
+def play_hands(nb_hands, inplace, seed=SEED, nb_player=NB_PLAYER, delta=False):
+    """Play nb_hands rounds and return the final table"""
+    random.seed(seed)
+    rng = random.Random(seed)
+    table = gen_table(nb_player)
+    # start_new_round prints every dealt hole card
+    with contextlib.redirect_stdout(io.StringIO()):
+        for round_count in range(1, nb_hands + 1):
+            state, _ = RoundManager.start_new_round(round_count, SB_AMOUNT, 0, table, inplace=inplace, delta=delta)
+            while state["street"] != Const.Street.FINISHED:
+                action, amount = choose_action(state, rng)
+                state, _ = RoundManager.apply_action(state, action, amount, inplace=inplace)
+            table = state["table"]
+            for player in table.seats.players:
+                player.stack = INITIAL_STACK
+            table.shift_dealer_btn()
+    return table
+
+def run(nb_hands=NB_HANDS):
+    results = {}
+    for name, inplace in [("copy", False), ("inplace", True)]:
+        start = time.perf_counter()
+        play_hands(nb_hands, inplace)
+        results["RoundManager hands/%s" % name] = nb_hands / (time.perf_counter() - start)
+    for name, delta in [("inplace_9max", False), ("inplace_delta_9max", True)]:
+        start = time.perf_counter()
+        play_hands(nb_hands, True, nb_player=9, delta=delta)
+        results["RoundManager hands/%s" % name] = nb_hands / (time.perf_counter() - start)
+    for name, hands_per_sec in results.items():
+        print("%-40s %10.0f hands/sec" % (name, hands_per_sec))
+    return results
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else NB_HANDS)
@@ -0,0 +1,57 @@
+"""Throughput of GameEvaluator.judge on showdowns with side pots.
+
+The pay situations are those of tests/pypokerengine/engine/sidepot_test.py
+plus a 9 seat table with several all-in players.
+
+Usage: python -m benchmarks.showdown_bench
+"""
+import random
+
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.game_evaluator import GameEvaluator
+from pypokerengine.engine.pay_info import PayInfo
+from pypokerengine.engine.player import Player
+from pypokerengine.engine.table import Table
+from benchmarks.hand_evaluator_bench import measure
+
+SEED = 2026
+NB_SHOWDOWN = 2000
+
+ALLIN, PAY_TILL_END, FOLDED = PayInfo.ALLIN, PayInfo.PAY_TILL_END, PayInfo.FOLDED
+
+# name => [(paid amount, pay status)] of each seat
+SCENARIOS = {
+    "sidepot_case1": [(50, PAY_TILL_END), (20, ALLIN), (30, ALLIN)],
+    "sidepot_case2": [(10, PAY_TILL_END), (10, PAY_TILL_END), (7, ALLIN)],
+    "sidepot_case3": [(20, FOLDED), (30, PAY_TILL_END), (7, ALLIN), (30, PAY_TILL_END)],
+    "sidepot_case4": [(12, ALLIN), (30, PAY_TILL_END), (7, ALLIN), (30, PAY_TILL_END)],
+    "sidepot_case5": [(5, ALLIN), (10, PAY_TILL_END), (8, ALLIN), (10, PAY_TILL_END), (2, FOLDED)],
+    "9max_allins": [(5, ALLIN), (60, PAY_TILL_END), (8, ALLIN), (60, PAY_TILL_END), (2, FOLDED),
+        (20, ALLIN), (35, ALLIN), (60, PAY_TILL_END), (10, FOLDED)],
+}
+
+def gen_table(pay_situation, rng):
+    card_ids = rng.sample(range(1, 53), 5 + 2 * len(pay_situation))
+    table = Table()
+    for i, (amount, status) in enumerate(pay_situation):
+        player = Player("uuid%d" % i, 100, "p%d" % i)
+        player.add_holecard([Card.from_id(cid) for cid in card_ids[5+2*i:7+2*i]])
+        player.pay_info.amount = amount
+        player.pay_info.status = status
+        table.seats.sitdown(player)
+    for cid in card_ids[:5]:
+        table.add_community_card(Card.from_id(cid))
+    return table
+
+def run(nb_showdown=NB_SHOWDOWN, seed=SEED, nb_repeat=3):
+    """Return { "GameEvaluator.judge/<scenario>" : showdowns per second }"""
+    rng = random.Random(seed)
+    results = {}
+    for name, pay_situation in SCENARIOS.items():
+        tables = [(gen_table(pay_situation, rng),) for _ in range(nb_showdown)]
+        results["GameEvaluator.judge/%s" % name] = max([measure(GameEvaluator.judge, tables) for _ in range(nb_repeat)])
+    return results
+
+if __name__ == "__main__":
+    for name, showdowns_per_sec in run().items():
+        print("%-40s %10.0f showdowns/sec" % (name, showdowns_per_sec))
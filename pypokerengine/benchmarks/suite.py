@@ -0,0 +1,127 @@
+"""Micro-benchmark suite for card parsing, hand evaluation, equity estimation and showdowns.
+
+Usage: python -m benchmarks.suite [-o results.json] [-b baseline.json] [-t max_regression_percent]
+
+Equity queries are measured on the flop, the turn and the river, and draw
+odds on the flop and the turn (1 / ops/sec is the latency of a query). Every
+input is generated from a fixed seed so that results of different
+commits can be compared. Throughput is the best of a few repeats. When a
+baseline JSON file is given, the run fails (exit code 1) if any benchmark is
+slower than the baseline by more than max_regression_percent.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+from pypokerengine.utils.card_utils import estimate_hole_card_win_rate
+from pypokerengine.utils.draw_utils import calc_draw_odds
+from benchmarks import showdown_bench
+from benchmarks.hand_evaluator_bench import gen_hands
+
+SEED = 2026
+NB_HANDS = 5000
+NB_EQUITY_QUERY = 20
+NB_EQUITY_SIMULATION = 200
+NB_REPEAT = 3
+CARD_NUMS = [5, 6, 7]
+PLAYER_NUMS = list(range(2, 10))
+EQUITY_STREETS = [("flop", 5), ("turn", 6), ("river", 7)]
+NB_DRAW_QUERY = 200
+MAX_REGRESSION_PERCENT = 10.0
+
+def best_throughput(func, args_list, nb_repeat=NB_REPEAT):
+    """Calls per second of func over args_list, best of nb_repeat runs"""
+    best = float("inf")
+    for _ in range(nb_repeat):
+        start = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        best = min(best, time.perf_counter() - start)
+    return len(args_list) / best
+
+def run(nb_hands=NB_HANDS, nb_equity_query=NB_EQUITY_QUERY, seed=SEED, nb_repeat=NB_REPEAT):
+    """Return { benchmark name : operations per second }"""
+    results = {}
+
+    card_ids = [cid for hand in gen_hands(nb_hands // 7 + 1, seed=seed) for cid in hand]
+    card_strs = [str(Card.from_id(cid)) for cid in card_ids]
+    cards = [Card.from_id(cid) for cid in card_ids]
+    results["Card.from_str"] = best_throughput(Card.from_str, [(s,) for s in card_strs], nb_repeat)
+    results["Card.to_id"] = best_throughput(Card.to_id, [(c,) for c in cards], nb_repeat)
+
+    for card_num in CARD_NUMS:
+        hands = gen_hands(nb_hands, card_num, seed)
+        card_hands = [([Card.from_id(cid) for cid in h[:2]], [Card.from_id(cid) for cid in h[2:]]) for h in hands]
+        results["eval_hand/%d" % card_num] = best_throughput(HandEvaluator.eval_hand, card_hands, nb_repeat)
+        results["old_eval_hand/%d" % card_num] = best_throughput(HandEvaluator.old_eval_hand, card_hands, nb_repeat)
+        results["gen_hand_rank_info/%d" % card_num] = \
+                best_throughput(HandEvaluator.gen_hand_rank_info, card_hands, nb_repeat)
+        results["eval_hand_batch/%d" % card_num] = \
+                nb_hands * best_throughput(HandEvaluator.eval_hand_batch, [(np.array(hands),)], nb_repeat)
+
+    # flop queries keep the names of earlier results; heads-up turn and river
+    # queries take the exact enumeration path
+    for street, card_num in EQUITY_STREETS:
+        street_hands = gen_hands(nb_equity_query, card_num, seed)
+        for nb_player in PLAYER_NUMS:
+            queries = [(NB_EQUITY_SIMULATION, nb_player,
+                [Card.from_id(cid) for cid in h[:2]], [Card.from_id(cid) for cid in h[2:]], seed) for h in street_hands]
+            name = "estimate_hole_card_win_rate/%s%dp" % ("" if street == "flop" else street + "/", nb_player)
+            results[name] = best_throughput(estimate_hole_card_win_rate, queries, nb_repeat)
+
+    for street, card_num in EQUITY_STREETS[:2]:
+        queries = [([Card.from_id(cid) for cid in h[:2]], [Card.from_id(cid) for cid in h[2:]])
+                for h in gen_hands(NB_DRAW_QUERY, card_num, seed)]
+        results["calc_draw_odds/%s" % street] = best_throughput(calc_draw_odds, queries, nb_repeat)
+
+    results.update(showdown_bench.run(nb_hands // 5, seed, nb_repeat))
+    return results
+
+def compare(results, baseline, max_regression_percent=MAX_REGRESSION_PERCENT):
+    """Return [(name, baseline ops/sec, current ops/sec)] of the benchmarks which regressed"""
+    regressions = []
+    for name, base in baseline.items():
+        if name in results and results[name] < base * (1 - max_regression_percent / 100.0):
+            regressions.append((name, base, results[name]))
+    return regressions
+
+def save_results(path, results):
+    with open(path, "w") as f:
+        json.dump({ "python": platform.python_version(), "seed": SEED, "results": results }, f, indent=2, sort_keys=True)
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PyPokerEngine micro-benchmarks")
+    parser.add_argument("-o", "--output", help="save results to this JSON file")
+    parser.add_argument("-b", "--baseline", help="compare against results saved by an earlier run")
+    parser.add_argument("-t", "--max-regression", type=float, default=MAX_REGRESSION_PERCENT,
+            help="allowed throughput drop against the baseline in percent (default: %(default)s)")
+    parser.add_argument("-n", "--nb-hands", type=int, default=NB_HANDS)
+    args = parser.parse_args(argv)
+
+    results = run(nb_hands=args.nb_hands)
+    baseline = load_results(args.baseline) if args.baseline else {}
+    for name in sorted(results):
+        line = "%-34s %14.0f ops/sec" % (name, results[name])
+        if name in baseline:
+            line += "  (%+6.1f%%)" % (100.0 * (results[name] / baseline[name] - 1))
+        print(line)
+    if args.output:
+        save_results(args.output, results)
+
+    regressions = compare(results, baseline, args.max_regression)
+    for name, base, current in regressions:
+        print("REGRESSION %s: %.0f -> %.0f ops/sec" % (name, base, current))
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
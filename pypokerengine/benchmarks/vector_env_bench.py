@@ -0,0 +1,56 @@
+"""Hands and decisions per second of VectorPokerEnv.
+
+nb_table tables of six players with 1000 chips play with the same random
+policy as round_bench (fold 15%, call 65%, min raise 20%), chosen for all
+tables at once with NumPy. Compare with the RoundManager numbers of
+round_bench, which play one table at a time.
+
+Usage: python -m benchmarks.vector_env_bench [nb_step] [nb_table]
+"""
+import sys
+import time
+
+import numpy as np
+
+from pypokerengine.api.vector_env import VectorPokerEnv
+from pypokerengine.engine.poker_constants import PokerConstants as Const
+
+SEED = 2026
+NB_STEP = 500
+NB_TABLE = 4096
+NB_PLAYER = 6
+INITIAL_STACK = 1000
+SB_AMOUNT = 5
+
+def choose_actions(obs, rng):
+    r = rng.random(len(obs["player"]))
+    raise_amount = obs["min_raise"]
+    actions = np.where(r < 0.15, Const.Action.FOLD,
+            np.where((r < 0.8) | (raise_amount == -1), Const.Action.CALL, Const.Action.RAISE))
+    return actions, raise_amount
+
+def play_steps(nb_step, nb_table, seed=SEED, nb_player=NB_PLAYER):
+    """Take nb_step steps at every table and return the number of finished hands"""
+    rng = np.random.default_rng(seed)
+    env = VectorPokerEnv(nb_table, nb_player, INITIAL_STACK, SB_AMOUNT, seed=seed)
+    obs = env.reset()
+    nb_hands = 0
+    for _ in range(nb_step):
+        obs, _, dones = env.step(*choose_actions(obs, rng))
+        nb_hands += int(dones.sum())
+    return nb_hands
+
+def run(nb_step=NB_STEP, nb_table=NB_TABLE):
+    start = time.perf_counter()
+    nb_hands = play_steps(nb_step, nb_table)
+    elapsed = time.perf_counter() - start
+    results = {
+        "VectorPokerEnv hands/%d tables" % nb_table: nb_hands / elapsed,
+        "VectorPokerEnv decisions/%d tables" % nb_table: nb_step * nb_table / elapsed
+    }
+    for name, per_sec in results.items():
+        print("%-40s %10.0f /sec" % (name, per_sec))
+    return results
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:3]])
@@ -2,9 +2,9 @@ from distutils.dir_util import copy_tree
 from lib2to3.pgen2.token import OP
 from pypokerengine.players import BasePokerPlayer
 from pypokerengine.utils.card_utils import gen_cards, estimate_hole_card_win_rate, Card
+from pypokerengine.utils.draw_utils import calc_draw_odds
 from typing import Dict, Sequence
 import random
-from collections import Counter
 import os.path
 
 ACTION_FOLD = 0
@@ -190,62 +190,15 @@ class HandEvaluate:
 
 
     def update(self, street, hole_card:Sequence[Card], community_card:Sequence[Card]):
-        all_rank = []
-        all_suit = []
-        for card in hole_card:
-            all_rank.append(card.rank)
-            all_suit.append(card.suit)
-        for card in community_card:
-            all_rank.append(card.rank)
-            all_suit.append(card.suit)
-        all_rank = sorted(all_rank)
-        all_suit = sorted(all_suit)
-        rank_cnt = Counter(all_rank)
-        suit_cnt = Counter(all_suit)
-        succ_rate = 0
-        if street == 'turn':
-            succ_rate = 2
-        elif street == 'flop':
-            succ_rate = 4
-
-        for rank, cnt in rank_cnt.most_common():
-            if cnt == 4:
-                self.rate_four_kind = 1
-            elif cnt == 3:
-                self.rate_three_kind = 1
-                self.rate_four_kind = 0.01 * succ_rate
-                self.rate_full_house = max(self.rate_pair, self.rate_full_house)
-            elif cnt == 2:
-                self.rate_pair = 1  # todo two pair
-                self.rate_three_kind = max(0.02 * succ_rate, self.rate_three_kind)
-                self.rate_full_house = max(self.rate_three_kind,self.rate_full_house)
-        for suit, cnt in suit_cnt.most_common():
-            if cnt >= 5:
-                self.rate_flush = 1
-            elif cnt == 4:
-                self.rate_flush = 0.09 * succ_rate
-        self.check_straight(all_rank, succ_rate)
-        if 14 in all_rank:
-            for i in range(len(all_rank)):
-                if all_rank[i] == 14:
-                    all_rank[i] = 1
-            all_rank = sorted(all_rank)
-        self.check_straight(all_rank, succ_rate)
-
-    # todo fixme
-    def check_straight(self, all_rank, succ_rate):
-        for i in range(4, len(all_rank)):
-            diff5 = all_rank[i] - all_rank[i-4]
-            if diff5 == 4:
-                self.rate_straight = 1
-                break
-            elif (diff5 == 3 or diff5 == 5) and len(all_rank) <= 6:
-                self.rate_straight = max(self.rate_straight, 0.04 * succ_rate)
-        for i in range(3, len(all_rank)):
-            diff4 = all_rank[i] - all_rank[i-3]
-            if diff4 == 3 and len(all_rank) <= 6:  # 4 continuos card
-                self.rate_straight = max(self.rate_straight, 0.08 * succ_rate)
-
+        # exact probability of each hand category at the river
+        odds = calc_draw_odds(hole_card, community_card)["probabilities"]
+        self.rate_pair = odds["ONEPAIR"]
+        self.rate_two_pair = odds["TWOPAIR"]
+        self.rate_three_kind = odds["THREECARD"]
+        self.rate_four_kind = odds["FOURCARD"]
+        self.rate_full_house = odds["FULLHOUSE"]
+        self.rate_flush = odds["FLASH"]
+        self.rate_straight = odds["STRAIGHT"] + odds["STRAIGHTFLASH"]
 
     def nuts_rate(self):
         return self.rate_flush+self.rate_four_kind+self.rate_full_house+self.rate_straight
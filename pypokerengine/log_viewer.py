@@ -1,8 +1,8 @@
 import os
-import random
 import sys
 import multiprocessing
 from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
@@ -39,31 +39,32 @@ def calc_global_win_rate(players: dict, community_cards: list, folded_player_nam
     all_cards -= set([Card.from_str(c).to_id() for c in community_cards])
 
     simulation_round = 1000
+    active_names = []
     for name, p in players.items():
         if name in folded_player_names:
             continue
         p['win_rate'] = 0
         all_cards -= set([Card.from_str(c).to_id() for c in p['hole_cards']])
-
-
-    for _ in range(simulation_round):
-        generated_remaining_community_cards = [
-            str(Card.from_id(c_id))
-            for c_id in random.sample(list(all_cards), k=5 - len(community_cards))
-        ]
-        player_hand_score = dict()
-        for name, player in players.items():
-            if name in folded_player_names:
-                continue
-
-            score = HandEvaluator.eval_hand(
-                gen_cards(player['hole_cards']),
-                gen_cards(community_cards + generated_remaining_community_cards))
-            player_hand_score[name] = score
-        max_score = max(player_hand_score.values())
-        for name, score in player_hand_score.items():
-            if score == max_score:
-                players[name]['win_rate'] += 1 / simulation_round
+        active_names.append(name)
+
+    # draw the missing community cards of every simulation at once
+    remaining_cards = np.array(sorted(all_cards))
+    need_num = 5 - len(community_cards)
+    shuffled = np.argsort(np.random.random((simulation_round, len(remaining_cards))), axis=1)
+    generated_remaining_community_cards = remaining_cards[shuffled[:, :need_num]]
+    community_ids = np.array([Card.from_str(c).to_id() for c in community_cards], dtype=np.int64)
+    community_ids = np.tile(community_ids, (simulation_round, 1))
+
+    player_hand_score = []
+    for name in active_names:
+        hole_ids = np.tile([Card.from_str(c).to_id() for c in players[name]['hole_cards']], (simulation_round, 1))
+        hands = np.hstack([hole_ids, community_ids, generated_remaining_community_cards])
+        player_hand_score.append(HandEvaluator.eval_hand_batch(hands))
+    player_hand_score = np.array(player_hand_score)
+    max_score = player_hand_score.max(axis=0)
+    win_count = (player_hand_score == max_score).sum(axis=1)
+    for name, count in zip(active_names, win_count):
+        players[name]['win_rate'] = int(count) / simulation_round
 
 
 def format_game_log(log_content, set_num):
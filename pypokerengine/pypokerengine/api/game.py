@@ -1,12 +1,15 @@
-from pypokerengine.engine.dealer import Dealer
+from pypokerengine.engine.dealer import Dealer, FastDealer
 from pypokerengine.players import BasePokerPlayer
 
 def setup_config(max_round, initial_stack, small_blind_amount, ante=0):
     return Config(max_round, initial_stack, small_blind_amount, ante)
 
-def start_poker(config, verbose=2):
+def start_poker(config, verbose=2, mode="normal"):
+    """Play a game. mode="fast" uses FastDealer: no printing and no time limit on players."""
     config.validation()
-    dealer = Dealer(config.sb_amount, config.initial_stack, config.ante)
+    if mode not in _DEALERS:
+        raise ValueError('Unknown mode "%s" (expected one of %s)' % (mode, sorted(_DEALERS)))
+    dealer = _DEALERS[mode](config.sb_amount, config.initial_stack, config.ante)
     dealer.set_verbose(verbose)
     dealer.set_blind_structure(config.blind_structure)
     for info in config.players_info:
@@ -14,6 +17,8 @@ def start_poker(config, verbose=2):
     result_message = dealer.start_game(config.max_round)
     return _format_result(result_message)
 
+_DEALERS = { "normal": Dealer, "fast": FastDealer }
+
 def _format_result(result_message):
     return {
             "rule": result_message["message"]["game_information"]["rule"],
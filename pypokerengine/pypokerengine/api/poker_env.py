@@ -0,0 +1,180 @@
+import random
+
+from pypokerengine.engine.table import Table
+from pypokerengine.engine.deck import Deck
+from pypokerengine.engine.player import Player
+from pypokerengine.engine.poker_constants import PokerConstants as Const
+from pypokerengine.engine.round_manager import RoundManager
+from pypokerengine.engine.action_checker import ActionChecker
+from pypokerengine.engine.message_builder import MessageBuilder
+from pypokerengine.players import BasePokerPlayer
+
+ALLIN = float("inf")
+
+def call_policy(obs):
+    """Opponent policy which always calls (or checks)"""
+    return PokerEnv.CALL
+
+class PokerEnv(object):
+    """Reinforcement learning environment of one seat (hero_pos) against in-process opponents.
+
+    An episode is one hand. reset() starts a hand with initial_stack for
+    every seat, moving the dealer button one seat per hand, and lets the
+    opponents act until the hero has to. step(action) applies the hero's
+    action and the opponents' answers, and returns (obs, reward, done, info)
+    where reward is the hero's stack change when the hand is over (0 before).
+    reset(seed) also moves the button back, so the same seed deals the same
+    hands from the same positions.
+
+    Actions are discrete: FOLD, CALL and 2 + i for raise_sizes[i], a raise of
+    raise_sizes[i] times the pot after calling, clipped to the legal raise
+    amounts (ALLIN raises the whole stack). Raises become calls when the
+    player cannot raise. obs["legal_actions"] flags the actions which are
+    not changed that way.
+
+    Each opponent is a callable which takes the observation of its seat and
+    returns a discrete action, or a BasePokerPlayer which is asked by
+    declare_action as Emulator.run_until_round_finish does (other messages
+    are not sent). The hand runs on RoundManager in place with delta
+    messages, so no events or per-action round_state dicts are built.
+    Hands where the hero does not act (everyone folds to the big blind)
+    are played out by reset() and are not episodes. reset() leaves the
+    hero's total stack change in them in skipped_reward and their number in
+    nb_skipped_hands. The reward of step() is only about the current hand.
+    """
+
+    FOLD, CALL = 0, 1
+    RAISE_SIZES = (0.5, 1.0, 2.0, ALLIN)
+
+    def __init__(self, opponents=None, nb_player=2, initial_stack=100, small_blind_amount=5, ante_amount=0,
+            raise_sizes=RAISE_SIZES, hero_pos=0, seed=None):
+        if not 2 <= nb_player <= 10:
+            raise ValueError("nb_player must be in 2..10 but got %d" % nb_player)
+        if initial_stack <= small_blind_amount * 2 + ante_amount:
+            raise ValueError("initial_stack must be larger than the big blind plus the ante")
+        opponents = [call_policy] * (nb_player - 1) if opponents is None else list(opponents)
+        if len(opponents) != nb_player - 1:
+            raise ValueError("%d opponents are needed but got %d" % (nb_player - 1, len(opponents)))
+        if not 0 <= hero_pos < nb_player:
+            raise ValueError("hero_pos must be in 0..%d but got %d" % (nb_player - 1, hero_pos))
+        for opponent in opponents:
+            if not (isinstance(opponent, BasePokerPlayer) or callable(opponent)):
+                raise TypeError("opponent must be callable or inherit %s class." % BasePokerPlayer)
+        self.nb_player = nb_player
+        self.initial_stack = initial_stack
+        self.sb_amount = small_blind_amount
+        self.ante_amount = ante_amount
+        self.raise_sizes = tuple(raise_sizes)
+        self.nb_action = 2 + len(self.raise_sizes)
+        self.hero_pos = hero_pos
+        self.opponents = opponents[:hero_pos] + [None] + opponents[hero_pos:]
+        self._rng = random.Random(seed)
+        self.table = self.__gen_table()
+        self.state = None
+        self.round_count = 0
+        self.skipped_reward, self.nb_skipped_hands = 0, 0
+
+    def reset(self, seed=None):
+        """Start the next hand where the hero acts and return the hero's first observation"""
+        if seed is not None:
+            self._rng.seed(seed)
+            self.table.dealer_btn = self.nb_player - 1
+            self.round_count = 0
+        self.skipped_reward, self.nb_skipped_hands = 0, 0
+        while True:
+            self.__start_hand()
+            self.__play_opponents()
+            if not self.__is_finished():
+                return self.observation()
+            self.skipped_reward += self.table.seats.players[self.hero_pos].stack - self.initial_stack
+            self.nb_skipped_hands += 1
+
+    def step(self, action):
+        if self.state is None or self.__is_finished():
+            raise ValueError("The hand is over. Call reset() to start the next one.")
+        if not 0 <= action < self.nb_action:
+            raise ValueError("action must be in 0..%d but got %s" % (self.nb_action - 1, action))
+        engine_action, amount = self.decode_action(action)
+        self.state, _ = RoundManager.apply_action(self.state, engine_action, amount, inplace=True)
+        self.__play_opponents()
+        info = { "action": engine_action, "amount": amount }
+        if not self.__is_finished():
+            return self.observation(), 0, False, info
+        stacks = [player.stack for player in self.table.seats.players]
+        info["stacks"] = stacks
+        return self.observation(), stacks[self.hero_pos] - self.initial_stack, True, info
+
+    def observation(self, pos=None):
+        """What the player at pos (the hero by default) can see now.
+
+        Cards are card ids (Card.to_id). After the hand is over the table is
+        cleared, so only the stacks are meaningful.
+        """
+        pos = self.hero_pos if pos is None else pos
+        players, ledger = self.table.seats.players, self.state["ledger"]
+        valid_actions = ActionChecker.legal_actions(players, pos, self.state["small_blind_amount"], ledger)
+        min_raise, max_raise = valid_actions[2]["amount"]["min"], valid_actions[2]["amount"]["max"]
+        return {
+            "player": pos,
+            "hole_card": [card.to_id() for card in players[pos].hole_card],
+            "community_card": [card.to_id() for card in self.table.get_community_card()],
+            "street": self.state["street"],
+            "dealer_btn": self.table.dealer_btn,
+            "stacks": [player.stack for player in players],
+            "bets": ledger.contributions[::],
+            "pot": sum(player.pay_info.amount for player in players),
+            "active": [player.is_active() for player in players],
+            "call_amount": ledger.current_bet,
+            "min_raise": min_raise,
+            "max_raise": max_raise,
+            "legal_actions": [True, True] + [min_raise != -1] * len(self.raise_sizes)
+        }
+
+    def decode_action(self, action, pos=None):
+        """(action, amount) for RoundManager of the discrete action of the player at pos"""
+        pos = self.hero_pos if pos is None else pos
+        players, ledger = self.table.seats.players, self.state["ledger"]
+        if action == self.FOLD:
+            return "fold", 0
+        max_raise = players[pos].stack + ledger.contributions[pos]
+        if action == self.CALL or max_raise < ledger.min_raise:
+            return "call", ledger.current_bet
+        pot = sum(player.pay_info.amount for player in players)
+        pot_after_call = pot + ledger.current_bet - ledger.contributions[pos]
+        amount = ledger.current_bet + self.raise_sizes[action - 2] * pot_after_call
+        return "raise", int(min(max(amount, ledger.min_raise), max_raise))
+
+    def __gen_table(self):
+        table = Table()
+        for i in range(self.nb_player):
+            table.seats.sitdown(Player("uuid%d" % i, self.initial_stack, "p%d" % i))
+        table.dealer_btn = self.nb_player - 1
+        return table
+
+    def __start_hand(self):
+        table = self.table
+        table.reset()
+        table.dealer_btn = (table.dealer_btn + 1) % self.nb_player
+        table.set_blind_pos((table.dealer_btn + 1) % self.nb_player, (table.dealer_btn + 2) % self.nb_player)
+        for player in table.seats.players:
+            player.stack = self.initial_stack
+        # the cheat deck deals the cards in the order drawn by our own rng
+        table.deck = Deck(cheat=True, cheat_card_ids=self._rng.sample(range(1, 53), 52))
+        self.round_count += 1
+        self.state, _ = RoundManager.start_new_round(
+                self.round_count, self.sb_amount, self.ante_amount, table, inplace=True, delta=True, quiet=True)
+
+    def __play_opponents(self):
+        while not self.__is_finished() and self.state["next_player"] != self.hero_pos:
+            action, amount = self.__ask_opponent(self.state["next_player"])
+            self.state, _ = RoundManager.apply_action(self.state, action, amount, inplace=True)
+
+    def __ask_opponent(self, pos):
+        opponent = self.opponents[pos]
+        if isinstance(opponent, BasePokerPlayer):
+            message = MessageBuilder.build_ask_message(pos, self.state)["message"]
+            return opponent.declare_action(message["valid_actions"], message["hole_card"], message["round_state"])
+        return self.decode_action(opponent(self.observation(pos)), pos)
+
+    def __is_finished(self):
+        return self.state["street"] == Const.Street.FINISHED
@@ -0,0 +1,235 @@
+import numpy as np
+
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+from pypokerengine.engine.poker_constants import PokerConstants as Const
+
+class VectorPokerEnv(object):
+    """nb_table independent tables which play one hand after another in lockstep.
+
+    The state of every table lives in NumPy arrays of shape (nb_table,) or
+    (nb_table, nb_player), and step() applies one action at every table at
+    once. Each hand starts from initial_stack (an int, or an array which
+    broadcasts to (nb_table, nb_player) for different stacks per seat) and
+    the dealer button moves one seat per hand.
+
+    The betting follows RoundManager and ActionChecker: blinds (and antes),
+    calls that are all-in when short, raises between the minimum raise and
+    the stack, illegal actions turned into folds, the same rules to close a
+    street, side pots as GameEvaluator.create_pot and prizes split with the
+    same rounding. The only difference is that the big blind always gets an
+    option preflop, also when antes are played.
+
+    Actions are Const.Action.FOLD, CALL or RAISE with the raise amount (the
+    total bet of the street, as valid_actions of the engine) in amounts.
+    """
+
+    def __init__(self, nb_table, nb_player=2, initial_stack=100, small_blind_amount=5, ante_amount=0, seed=None):
+        if not 2 <= nb_player <= 10:
+            raise ValueError("nb_player must be in 2..10 but got %d" % nb_player)
+        shape = (nb_table, nb_player)
+        initial_stack = np.broadcast_to(np.asarray(initial_stack, dtype=np.int64), shape).copy()
+        if (initial_stack <= small_blind_amount * 2 + ante_amount).any():
+            raise ValueError("initial_stack must be larger than the big blind plus the ante")
+        self.nb_table = nb_table
+        self.nb_player = nb_player
+        self.initial_stack = initial_stack
+        self.sb_amount = small_blind_amount
+        self.ante_amount = ante_amount
+        self._rng = np.random.default_rng(seed)
+        self._tables = np.arange(nb_table)
+
+        self.hole_card = np.zeros(shape + (2,), dtype=np.int64)
+        self.board = np.zeros((nb_table, 5), dtype=np.int64)
+        self.stacks = np.zeros(shape, dtype=np.int64)
+        self.bets = np.zeros(shape, dtype=np.int64)     # this street, as Player.paid_sum
+        self.paid = np.zeros(shape, dtype=np.int64)     # this hand, as PayInfo.amount
+        self.folded = np.zeros(shape, dtype=bool)
+        self.allin = np.zeros(shape, dtype=bool)
+        self.acted = np.zeros(shape, dtype=bool)
+        # BettingLedger of every table
+        self.current_bet = np.zeros(nb_table, dtype=np.int64)
+        self.last_raise = np.zeros(nb_table, dtype=np.int64)
+        self.min_raise = np.zeros(nb_table, dtype=np.int64)
+        self._raise_pos = np.zeros(nb_table, dtype=np.int64)
+        self.street = np.zeros(nb_table, dtype=np.int64)
+        self.next_player = np.zeros(nb_table, dtype=np.int64)
+        self.dealer_btn = np.zeros(nb_table, dtype=np.int64)
+        self.sb_pos = np.zeros(nb_table, dtype=np.int64)
+        self.bb_pos = np.zeros(nb_table, dtype=np.int64)
+
+    def reset(self, seed=None):
+        """Start a new hand at every table and return the observation"""
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+        self.dealer_btn[:] = 0
+        self.__start_hands(self._tables)
+        return self.observation()
+
+    def step(self, actions, amounts=None):
+        """Apply actions[i] (with amounts[i] for a raise) of the next player at table i.
+
+        Returns (observation, rewards, dones). rewards is (nb_table, nb_player)
+        chips won or lost by the hands which finished in this step, dones
+        flags those tables. They have already started their next hand.
+        """
+        actions = np.broadcast_to(np.asarray(actions, dtype=np.int64), (self.nb_table,))
+        amounts = np.zeros(self.nb_table, dtype=np.int64) if amounts is None else \
+                np.broadcast_to(np.asarray(amounts, dtype=np.int64), (self.nb_table,))
+        if not np.isin(actions, [Const.Action.FOLD, Const.Action.CALL, Const.Action.RAISE]).all():
+            raise ValueError("actions must be Const.Action.FOLD, CALL or RAISE")
+
+        self.__apply_actions(actions, amounts)
+        street_end = self.__is_street_end()
+        self.__forward(street_end)
+
+        rewards = np.zeros((self.nb_table, self.nb_player), dtype=np.int64)
+        dones = self.street == Const.Street.SHOWDOWN
+        finished = np.flatnonzero(dones)
+        if len(finished) != 0:
+            self.__showdown(finished)
+            rewards[finished] = self.stacks[finished] - self.initial_stack[finished]
+            self.dealer_btn[finished] = (self.dealer_btn[finished] + 1) % self.nb_player
+            self.__start_hands(finished)
+        return self.observation(), rewards, dones
+
+    def observation(self):
+        """Arrays seen by the next player to act at each table"""
+        t, p = self._tables, self.next_player
+        max_raise = self.stacks[t, p] + self.bets[t, p]
+        can_raise = max_raise >= self.min_raise
+        dealt = np.array([0, 3, 4, 5, 5])[self.street]
+        return {
+            "player": p.copy(),
+            "hole_card": self.hole_card[t, p],
+            "community_card": np.where(np.arange(5) < dealt[:, None], self.board, 0),
+            "street": self.street.copy(),
+            "dealer_btn": self.dealer_btn.copy(),
+            "stacks": self.stacks.copy(),
+            "bets": self.bets.copy(),
+            "pot": self.paid.sum(axis=1),
+            "folded": self.folded.copy(),
+            "allin": self.allin.copy(),
+            "call_amount": self.current_bet.copy(),
+            "min_raise": np.where(can_raise, self.min_raise, -1),
+            "max_raise": np.where(can_raise, max_raise, -1)
+        }
+
+    def __start_hands(self, t):
+        P, sb_amount = self.nb_player, self.sb_amount
+        cards = np.argsort(self._rng.random((len(t), 52)), axis=1)[:, :2 * P + 5] + 1
+        # same order as RoundManager draws from a deck: two cards per seat, then the board
+        self.hole_card[t] = cards[:, :2 * P].reshape(len(t), P, 2)
+        self.board[t] = cards[:, 2 * P:]
+        self.stacks[t] = self.initial_stack[t] - self.ante_amount
+        self.paid[t] = self.ante_amount
+        self.bets[t] = 0
+        self.folded[t] = self.allin[t] = self.acted[t] = False
+        self.street[t] = Const.Street.PREFLOP
+
+        sb, bb = (self.dealer_btn[t] + 1) % P, (self.dealer_btn[t] + 2) % P
+        self.sb_pos[t], self.bb_pos[t] = sb, bb
+        for pos, blind in [(sb, sb_amount), (bb, sb_amount * 2)]:
+            self.stacks[t, pos] -= blind
+            self.paid[t, pos] += blind
+            self.bets[t, pos] = blind
+        self.current_bet[t] = sb_amount * 2
+        self.last_raise[t] = sb_amount
+        self.min_raise[t] = sb_amount * 3
+        self._raise_pos[t] = bb
+        # everyone can still act, so the first is the seat after the big blind
+        self.next_player[t] = (bb + 1) % P
+
+    def __apply_actions(self, actions, amounts):
+        t, p = self._tables, self.next_player
+        stack, bet = self.stacks[t, p], self.bets[t, p]
+        current_bet = self.current_bet
+        all_chips = stack + bet
+
+        allin_call = current_bet >= all_chips
+        allin_raise = amounts == all_chips
+        illegal_raise = ~allin_raise & ((amounts - bet > stack) | (amounts < self.min_raise))
+        is_call = actions == Const.Action.CALL
+        is_raise = (actions == Const.Action.RAISE) & ~illegal_raise
+        is_fold = ~is_call & ~is_raise
+
+        amount = np.where(is_call, np.minimum(current_bet, all_chips), np.where(is_raise, amounts, bet))
+        need = amount - bet
+        self.stacks[t, p] -= need
+        self.paid[t, p] += need
+        self.bets[t, p] = amount
+        self.folded[t, p] |= is_fold
+        self.allin[t, p] |= (is_call & allin_call) | (is_raise & allin_raise)
+        self.acted[t, p] = True
+
+        # BettingLedger.record: ties go to the lower seat
+        new_max = is_raise & ((self._raise_pos < 0) | (amount > current_bet)
+                | ((amount == current_bet) & (p < self._raise_pos)))
+        self.last_raise = np.where(new_max, amount - current_bet, self.last_raise)
+        self.min_raise = np.where(new_max, amount * 2 - current_bet, self.min_raise)
+        self._raise_pos = np.where(new_max, p, self._raise_pos)
+        self.current_bet = np.where(new_max, amount, current_bet)
+
+    def __is_street_end(self):
+        """RoundManager.__is_everyone_agreed of every table. Moves next_player where the street goes on."""
+        t = self._tables
+        max_pay = self.bets.max(axis=1)
+        waiting = ~self.folded & ~self.allin
+        agreed = self.folded | self.allin | (self.acted & (self.bets == max_pay[:, None]))
+        next_pos, found = self.__next_waiting(self.next_player + 1)
+        no_need_to_ask = (waiting.sum(axis=1) == 1) & found & (self.bets[t, next_pos] == max_pay)
+        street_end = agreed.all(axis=1) | ((~self.folded).sum(axis=1) == 1) | no_need_to_ask
+        self.next_player = np.where(street_end, self.next_player, next_pos)
+        return street_end
+
+    def __forward(self, street_end):
+        """Start the next street where street_end, and the ones after while at most one player can act"""
+        t = np.flatnonzero(street_end)
+        self.bets[t] = 0
+        self.acted[t] = False
+        self.current_bet[t] = 0
+        self.last_raise[t] = 0
+        self.min_raise[t] = self.sb_amount * 2
+        self._raise_pos[t] = -1
+        while len(t) != 0:
+            self.street[t] += 1
+            t = t[self.street[t] != Const.Street.SHOWDOWN]
+            waiting = ~self.folded[t] & ~self.allin[t]
+            next_pos, _ = self.__next_waiting(self.sb_pos[t], t)
+            self.next_player[t] = next_pos
+            t = t[waiting.sum(axis=1) <= 1]
+
+    def __next_waiting(self, start, t=None):
+        """First seat from start (cyclic) of each table whose player can act"""
+        t = self._tables if t is None else t
+        seats = (start[:, None] + np.arange(self.nb_player)) % self.nb_player
+        waiting = ~self.folded[t[:, None], seats] & ~self.allin[t[:, None], seats]
+        first = np.argmax(waiting, axis=1)
+        return seats[np.arange(len(t)), first], waiting.any(axis=1)
+
+    def __showdown(self, t):
+        P = self.nb_player
+        hands = np.concatenate([self.hole_card[t], np.repeat(self.board[t][:, None, :], P, axis=1)], axis=2)
+        strength = HandEvaluator.eval_hand_batch(hands.reshape(-1, 7)).reshape(len(t), P)
+        paid, active = self.paid[t], ~self.folded[t]
+        strength = np.where(active, strength, -1)
+
+        # side pots of the all-in amounts in ascending order, then the main pot
+        levels = np.sort(np.where(self.allin[t], paid, np.iinfo(np.int64).max), axis=1)
+        pot_sum = np.zeros(len(t), dtype=np.int64)
+        prizes = np.zeros((len(t), P), dtype=np.int64)
+        for k in range(P):
+            level = levels[:, k]
+            valid = level != np.iinfo(np.int64).max
+            pot = np.where(valid, np.minimum(paid, level[:, None]).sum(axis=1) - pot_sum, 0)
+            prizes += self.__split_pot(pot, active & (paid >= level[:, None]), strength)
+            pot_sum += pot
+        main_pot = paid.sum(axis=1) - pot_sum
+        prizes += self.__split_pot(main_pot, active & (paid == paid.max(axis=1)[:, None]), strength)
+        self.stacks[t] += prizes
+
+    def __split_pot(self, pot, eligible, strength):
+        best = np.where(eligible, strength, -1).max(axis=1)
+        winners = eligible & (strength == best[:, None])
+        nb_winner = winners.sum(axis=1)
+        prize = np.where(nb_winner != 0, pot // np.maximum(nb_winner, 1), 0)
+        return winners * prize[:, None]
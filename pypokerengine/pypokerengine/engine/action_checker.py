@@ -1,12 +1,19 @@
-from functools import reduce
+from pypokerengine.engine.betting_ledger import BettingLedger
 
 class ActionChecker:
+  """Legality of actions in the current street.
+
+  Every method which needs the current bet accepts the BettingLedger of the
+  round state. Without it the ledger is rebuilt from the action histories
+  of players.
+  """
 
   @classmethod
-  def correct_action(self, players, player_pos, sb_amount, action, amount=None):
+  def correct_action(self, players, player_pos, sb_amount, action, amount=None, ledger=None):
+    ledger = self.__ledger(players, sb_amount, ledger)
     if self.is_allin(players[player_pos], action, amount):
-      amount = players[player_pos].stack + players[player_pos].paid_sum()
-    elif self.__is_illegal(players, player_pos, sb_amount, action, amount):
+      amount = players[player_pos].stack + ledger.contributions[player_pos]
+    elif self.__is_illegal(players, player_pos, sb_amount, action, amount, ledger):
       action, amount = "fold", 0
     return action, amount
 
@@ -27,62 +34,44 @@ class ActionChecker:
 
 
   @classmethod
-  def agree_amount(self, players):
-    last_raise = self.__fetch_last_raise(players)
-    return last_raise["amount"] if last_raise else 0
+  def agree_amount(self, players, ledger=None):
+    return self.__ledger(players, 0, ledger).current_bet
 
 
   @classmethod
-  def legal_actions(self, players, player_pos, sb_amount):
-    min_raise = self.__min_raise_amount(players, sb_amount)
-    max_raise = players[player_pos].stack + players[player_pos].paid_sum()
+  def legal_actions(self, players, player_pos, sb_amount, ledger=None):
+    ledger = self.__ledger(players, sb_amount, ledger)
+    min_raise = ledger.min_raise
+    max_raise = players[player_pos].stack + ledger.contributions[player_pos]
     if max_raise < min_raise:
       min_raise = max_raise = -1
     return [
         { "action" : "fold" , "amount" : 0 },
-        { "action" : "call" , "amount" : self.agree_amount(players) },
+        { "action" : "call" , "amount" : ledger.current_bet },
         { "action" : "raise", "amount" : { "min": min_raise, "max": max_raise } }
     ]
 
   @classmethod
-  def _is_legal(self, players, player_pos, sb_amount, action, amount=None):
-    return not self.__is_illegal(players, player_pos, sb_amount, action, amount)
+  def _is_legal(self, players, player_pos, sb_amount, action, amount=None, ledger=None):
+    return not self.__is_illegal(players, player_pos, sb_amount, action, amount, ledger)
 
   @classmethod
-  def __is_illegal(self, players, player_pos, sb_amount, action, amount=None):
+  def __is_illegal(self, players, player_pos, sb_amount, action, amount=None, ledger=None):
     if action == 'fold':
       return False
-    elif action == 'call':
-      return self.__is_short_of_money(players[player_pos], amount)\
-          or self.__is_illegal_call(players, amount)
+    ledger = self.__ledger(players, sb_amount, ledger)
+    if action == 'call':
+      return self.__is_short_of_money(players[player_pos], ledger.contributions[player_pos], amount)\
+          or amount != ledger.current_bet
     elif action == 'raise':
-      return self.__is_short_of_money(players[player_pos], amount) \
-          or self.__is_illegal_raise(players, amount, sb_amount)
+      return self.__is_short_of_money(players[player_pos], ledger.contributions[player_pos], amount) \
+          or ledger.min_raise > amount
 
   @classmethod
-  def __is_illegal_call(self, players, amount):
-    return amount != self.agree_amount(players)
+  def __is_short_of_money(self, player, paid, amount):
+    return player.stack < amount - paid
 
   @classmethod
-  def __is_illegal_raise(self, players, amount, sb_amount):
-    return self.__min_raise_amount(players, sb_amount) > amount
-
-  @classmethod
-  def __min_raise_amount(self, players, sb_amount):
-    raise_ = self.__fetch_last_raise(players)
-    return raise_["amount"] + raise_["add_amount"] if raise_ else sb_amount*2
-
-  @classmethod
-  def __is_short_of_money(self, player, amount):
-    return player.stack < amount - player.paid_sum()
-
-  @classmethod
-  def __fetch_last_raise(self, players):
-    all_histories = [p.action_histories for p in players]
-    all_histories = reduce(lambda acc, e: acc + e, all_histories)  # flatten
-    raise_histories = [h for h in all_histories if h["action"] in ["RAISE", "SMALLBLIND", "BIGBLIND"]]
-    if len(raise_histories) == 0:
-      return None
-    else:
-      return max(raise_histories, key=lambda h: h["amount"])  # maxby
+  def __ledger(self, players, sb_amount, ledger):
+    return ledger if ledger is not None else BettingLedger.from_players(players, sb_amount)
 
@@ -0,0 +1,59 @@
+class ActionHistory:
+  """One action of a player kept as a small slotted record.
+
+  Fields which the action does not have (e.g. "paid" of a FOLD) are None.
+  The record reads like the dict form of DataEncoder (history["amount"],
+  "paid" in history, history.get("add_amount")) and compares equal to it,
+  but to_dict() is only called when a round state is encoded.
+  """
+
+  __slots__ = ["action", "amount", "paid", "add_amount", "uuid"]
+
+  def __init__(self, action, amount=None, paid=None, add_amount=None, uuid=None):
+    self.action = action
+    self.amount = amount
+    self.paid = paid
+    self.add_amount = add_amount
+    self.uuid = uuid
+
+  def __getitem__(self, key):
+    value = getattr(self, key, None) if key in self.__slots__ else None
+    if value is None:
+      raise KeyError(key)
+    return value
+
+  def __contains__(self, key):
+    return key in self.__slots__ and getattr(self, key) is not None
+
+  def get(self, key, default=None):
+    return self[key] if key in self else default
+
+  def keys(self):
+    return [key for key in self.__slots__ if getattr(self, key) is not None]
+
+  def to_dict(self):
+    return { key: getattr(self, key) for key in self.keys() }
+
+  @classmethod
+  def from_dict(self, hsh):
+    return self(hsh["action"], hsh.get("amount"), hsh.get("paid"), hsh.get("add_amount"), hsh.get("uuid"))
+
+  def __eq__(self, other):
+    if isinstance(other, ActionHistory):
+      return self.__fields() == other.__fields()
+    if isinstance(other, dict):
+      return self.to_dict() == other
+    return NotImplemented
+
+  def __ne__(self, other):
+    eq = self.__eq__(other)
+    return eq if eq is NotImplemented else not eq
+
+  __hash__ = None
+
+  def __repr__(self):
+    return repr(self.to_dict())
+
+  def __fields(self):
+    return (self.action, self.amount, self.paid, self.add_amount, self.uuid)
+
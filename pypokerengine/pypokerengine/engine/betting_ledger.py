@@ -0,0 +1,68 @@
+from pypokerengine.engine.player import Player
+
+class BettingLedger:
+  """Betting amounts of the current street, updated in O(1) per action.
+
+  current_bet   : amount to call (the largest blind or raise amount)
+  last_raise    : add_amount of that blind or raise (0 before any)
+  min_raise     : smallest legal raise amount
+  contributions : amount each seat has put in this street (Player.paid_sum)
+
+  The values are the same as those ActionChecker used to derive from the
+  action histories of the street. When two raises have the same amount the
+  one of the lower seat counts, as max() over the histories in seat order did.
+  """
+
+  __slots__ = ["sb_amount", "current_bet", "last_raise", "min_raise", "contributions", "_raise_pos"]
+
+  def __init__(self, nb_player, sb_amount):
+    self.sb_amount = sb_amount
+    self.contributions = [0] * nb_player
+    self.new_street()
+
+  def new_street(self):
+    self.current_bet = 0
+    self.last_raise = 0
+    self.min_raise = self.sb_amount * 2
+    self.contributions = [0] * len(self.contributions)
+    self._raise_pos = None
+
+  def record(self, pos, history):
+    """Update the ledger by history, which seat pos has just added"""
+    if history.action in self.__no_bet_actions:
+      return
+    self.contributions[pos] = history.amount
+    if history.action in self.__raise_actions and self.__is_new_max_raise(pos, history.amount):
+      self.current_bet = history.amount
+      self.last_raise = history.add_amount
+      self.min_raise = history.amount + history.add_amount
+      self._raise_pos = pos
+
+  def max_contribution(self):
+    return max(self.contributions)
+
+  def copy(self):
+    ledger = BettingLedger(len(self.contributions), self.sb_amount)
+    ledger.current_bet = self.current_bet
+    ledger.last_raise = self.last_raise
+    ledger.min_raise = self.min_raise
+    ledger.contributions = self.contributions[::]
+    ledger._raise_pos = self._raise_pos
+    return ledger
+
+  @classmethod
+  def from_players(self, players, sb_amount):
+    """Build the ledger of the current street from the action histories of players"""
+    ledger = self(len(players), sb_amount)
+    for pos, player in enumerate(players):
+      for history in player.action_histories:
+        ledger.record(pos, history)
+    return ledger
+
+  def __is_new_max_raise(self, pos, amount):
+    return self._raise_pos is None or amount > self.current_bet \
+        or (amount == self.current_bet and pos < self._raise_pos)
+
+  __no_bet_actions = [Player.ACTION_FOLD_STR, Player.ACTION_ANTE]
+  __raise_actions = [Player.ACTION_RAISE_STR, Player.ACTION_SMALL_BLIND, Player.ACTION_BIG_BLIND]
+
@@ -1,4 +1,10 @@
 class Card:
+  """Immutable playing card.
+
+  There are only 52 Card instances. Card(suit, rank), Card.from_id and
+  Card.from_str all return the interned instance of the registry, whose id,
+  string and phevaluator id are computed once when this module is loaded.
+  """
 
   CLUB = 2
   DIAMOND = 4
@@ -28,43 +34,80 @@ class Card:
       14 : 'A'
   }
 
+  __slots__ = ("suit", "rank", "id", "ph_id", "_str")
+
+  def __new__(cls, suit, rank):
+    try:
+      return cls._REGISTRY[(suit, rank)]
+    except KeyError:
+      raise ValueError(cls.__invalid_card_msg % (suit, rank)) from None
 
-  def __init__(self, suit, rank):
-    self.suit = suit
-    self.rank = 14 if rank == 1 else rank
+  def __setattr__(self, name, value):
+    raise AttributeError(self.__immutable_msg)
+
+  def __delattr__(self, name):
+    raise AttributeError(self.__immutable_msg)
 
   def __eq__(self, other):
-    return self.suit == other.suit and self.rank == other.rank
+    return self is other or \
+        (isinstance(other, Card) and self.suit == other.suit and self.rank == other.rank)
+
+  def __hash__(self):
+    return self.id
 
   def __str__(self):
-    suit = self.SUIT_MAP[self.suit]
-    rank = self.RANK_MAP[self.rank]
-    return "{0}{1}".format(suit, rank)
+    return self._str
 
-  def to_id(self):
-    rank = 1 if self.rank == 14 else self.rank
-    num = 0
-    tmp = self.suit >> 1
-    while tmp&1 != 1:
-      num += 1
-      tmp >>= 1
+  def __repr__(self):
+    return "Card(%s)" % self._str
+
+  def __reduce__(self):
+    return (Card.from_id, (self.id,))
 
-    return rank + 13 * num
+  def __copy__(self):
+    return self
+
+  def __deepcopy__(self, memo):
+    return self
+
+  def to_id(self):
+    return self.id
 
   @classmethod
   def from_id(cls, card_id):
-    suit, rank = 2, card_id
-    while rank > 13:
-      suit <<= 1
-      rank -= 13
-
-    return cls(suit, rank)
+    return cls._REGISTRY_BY_ID[card_id]
 
   @classmethod
   def from_str(cls, str_card):
     assert(len(str_card)==2)
-    inverse = lambda hsh: {v:k for k,v in hsh.items()}
-    suit = inverse(cls.SUIT_MAP)[str_card[0].upper()]
-    rank = inverse(cls.RANK_MAP)[str_card[1]]
-    return cls(suit, rank)
+    return cls._REGISTRY_BY_STR[str_card[0].upper() + str_card[1]]
+
+  @classmethod
+  def all_cards(cls):
+    """Return the 52 interned cards ordered by card id."""
+    return cls._REGISTRY_BY_ID[1:]
+
+  @classmethod
+  def _build_registry(cls):
+    registry, by_id, by_str = {}, [None], {}
+    for suit_idx, suit in enumerate([cls.CLUB, cls.DIAMOND, cls.HEART, cls.SPADE]):
+      for rank in [14] + list(range(2, 14)):
+        card = object.__new__(cls)
+        set_slot = lambda name, value: object.__setattr__(card, name, value)
+        set_slot("suit", suit)
+        set_slot("rank", rank)
+        set_slot("id", (1 if rank == 14 else rank) + 13 * suit_idx)
+        set_slot("ph_id", (rank - 2) * 4 + suit_idx)
+        set_slot("_str", cls.SUIT_MAP[suit] + cls.RANK_MAP[rank])
+        registry[(suit, rank)] = card
+        by_id.append(card)
+        by_str[card._str] = card
+      registry[(suit, 1)] = registry[(suit, 14)]
+    cls._REGISTRY = registry
+    cls._REGISTRY_BY_ID = by_id
+    cls._REGISTRY_BY_STR = by_str
+
+  __invalid_card_msg = "Invalid card (suit=%s, rank=%s)"
+  __immutable_msg = "Card is immutable"
 
+Card._build_registry()
@@ -1,4 +1,4 @@
-from functools import reduce
+from itertools import chain, zip_longest
 
 from pypokerengine.engine.pay_info import PayInfo
 from pypokerengine.engine.poker_constants import PokerConstants as Const
@@ -88,6 +88,17 @@ class DataEncoder:
     action_histories = { name:histories for name, histories in zip(street_name, street_histories) }
     return { "action_histories": action_histories }
 
+  @classmethod
+  def encode_update_delta(self, player_pos, state):
+    """Fields of encode_round_state changed by the last action of player_pos"""
+    player = state["table"].seats.players[player_pos]
+    return {
+        "history": player.action_histories[-1].to_dict(),
+        "seat": self.encode_player(player),
+        "pot": self.encode_pot(state["table"].seats.players),
+        "next_player": player_pos
+        }
+
   @classmethod
   def encode_winners(self, winners):
     return { "winners": self.__encode_players(winners) }
@@ -138,17 +149,9 @@ class DataEncoder:
 
   @classmethod
   def __order_histories(self, start_pos, player_histories):
-    ordered_player_histories = [player_histories[(start_pos+i)%len(player_histories)] for i in range(len(player_histories))]
-    all_player_histories = [histories[::] for histories in ordered_player_histories]
-    max_len = max([len(h) for h in all_player_histories])
-    unified_histories = [self.__unify_length(max_len, l) for l in all_player_histories]
-    ordered_histories = reduce(lambda acc, zp: acc + list(zp), zip(*unified_histories), [])
-    return [history for history in ordered_histories if not history is None]
-
-  @classmethod
-  def __unify_length(self, max_len, lst):
-    for _ in range(max_len-len(lst)):
-      lst.append(None)
-    return lst
+    ordered_player_histories = player_histories[start_pos:] + player_histories[:start_pos]
+    # i-th action of every player from the small blind, then the (i+1)-th, ...
+    ordered_histories = chain.from_iterable(zip_longest(*ordered_player_histories))
+    return [history.to_dict() for history in ordered_histories if not history is None]
 
 
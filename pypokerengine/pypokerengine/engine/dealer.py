@@ -30,7 +30,8 @@ class Dealer:
       self.message_summarizer.verbose = verbose
 
   def start_game(self, max_round):
-    table = self.table
+    # rounds are played in place on a copy, which keeps self.table as registered
+    table = Table.deserialize(self.table.serialize())
     self.__notify_game_start(max_round)
     ante, sb_amount = self.ante, self.small_blind_amount
     for round_count in range(1, max_round+1):
@@ -42,12 +43,13 @@ class Dealer:
     return self.__generate_game_result(max_round, table.seats)
 
   def play_round(self, round_count, blind_amount, ante, table):
-    state, msgs = RoundManager.start_new_round(round_count, blind_amount, ante, table)
+    delta = self.message_handler.all_receive_delta()
+    state, msgs = RoundManager.start_new_round(round_count, blind_amount, ante, table, inplace=True, delta=delta)
     while True:
       self.__message_check(msgs, state["street"])
       if state["street"] != Const.Street.FINISHED:  # continue the round
         action, bet_amount = self.__publish_messages(msgs)
-        state, msgs = RoundManager.apply_action(state, action, bet_amount)
+        state, msgs = RoundManager.apply_action(state, action, bet_amount, inplace=True)
       else:  # finish the round after publish round result
         self.__publish_messages(msgs)
         break
@@ -177,6 +179,36 @@ class Dealer:
     chars = [chr(code) for code in range(97,123)]
     return "".join([random.choice(chars) for _ in range(uuid_size)])
 
+class FastDealer(Dealer):
+  """Dealer for bulk simulation.
+
+  The rules and the use of the random module are those of Dealer, so a game
+  with the same seed ends the same, but nothing is printed and players are
+  called without the time limit of BasePokerPlayer (a slow player is not
+  folded). Messages are built as for Dealer, in delta mode when every
+  player has opted in.
+  """
+
+  def __init__(self, small_blind_amount=None, initial_stack=None, ante=None):
+    Dealer.__init__(self, small_blind_amount, initial_stack, ante)
+    self.message_handler = FastMessageHandler()
+    self.message_summarizer = SilentMessageSummarizer()
+
+  def play_round(self, round_count, blind_amount, ante, table):
+    delta = self.message_handler.all_receive_delta()
+    state, msgs = RoundManager.start_new_round(
+        round_count, blind_amount, ante, table, inplace=True, delta=delta, quiet=True)
+    while state["street"] != Const.Street.FINISHED:
+      action, bet_amount = self.__publish_messages(msgs)
+      state, msgs = RoundManager.apply_action(state, action, bet_amount, inplace=True)
+    self.__publish_messages(msgs)
+    return state["table"]
+
+  def __publish_messages(self, msgs):
+    for address, msg in msgs[:-1]:
+      self.message_handler.process_message(address, msg)
+    return self.message_handler.process_message(*msgs[-1])
+
 class MessageHandler:
 
   def __init__(self):
@@ -185,8 +217,12 @@ class MessageHandler:
   def register_algorithm(self, uuid, algorithm):
     self.algo_owner_map[uuid] = algorithm
 
+  def all_receive_delta(self):
+    algorithms = self.algo_owner_map.values()
+    return len(algorithms) != 0 and all([getattr(algo, "receives_delta", False) for algo in algorithms])
+
   def process_message(self, address, msg):
-    receivers = self.__fetch_receivers(address)
+    receivers = self._fetch_receivers(address)
     for receiver in receivers:
       if msg["type"] == 'ask':
         try:
@@ -203,7 +239,7 @@ class MessageHandler:
         raise ValueError("Received unexpected message which type is [%s]" % msg["type"])
 
 
-  def __fetch_receivers(self, address):
+  def _fetch_receivers(self, address):
     if address == -1:
       return self.algo_owner_map.values()
     else:
@@ -211,6 +247,18 @@ class MessageHandler:
         raise ValueError("Received message its address [%s] is unknown" % address)
       return [self.algo_owner_map[address]]
 
+class FastMessageHandler(MessageHandler):
+  """MessageHandler which calls players without the time limit"""
+
+  def process_message(self, address, msg):
+    for receiver in self._fetch_receivers(address):
+      if msg["type"] == 'ask':
+        return receiver._respond_to_ask(msg["message"])
+      elif msg["type"] == 'notification':
+        receiver._receive_notification(msg["message"])
+      else:
+        raise ValueError("Received unexpected message which type is [%s]" % msg["type"])
+
 class MessageSummarizer(object):
 
     def __init__(self, verbose):
@@ -240,6 +288,8 @@ class MessageSummarizer(object):
             return self.summarize_street_start(content)
         if MessageBuilder.GAME_UPDATE_MESSAGE == message_type:
             return self.summarize_player_action(content)
+        if MessageBuilder.GAME_UPDATE_DELTA_MESSAGE == message_type:
+            return self.summarize_player_action_delta(content)
         if MessageBuilder.ROUND_RESULT_MESSAGE == message_type:
             return self.summarize_round_result(content)
         if MessageBuilder.GAME_RESULT_MESSAGE == message_type:
@@ -266,6 +316,11 @@ class MessageSummarizer(object):
         player_name = [player["name"] for player in players if player["uuid"] == action["player_uuid"]][0]
         return base % (player_name, action["action"], action["amount"])
 
+    def summarize_player_action_delta(self, message):
+        base = '"%s" declared "%s:%s"'
+        action = message["action"]
+        return base % (message["seat"]["name"], action["action"], action["amount"])
+
     def summarize_round_result(self, message):
         base = '"%s" won the round %d (stack = %s)'
         winners = [player["name"] for player in message["winners"]]
@@ -281,3 +336,10 @@ class MessageSummarizer(object):
         base = 'Blind level update at round-%d : Ante %s -> %s, SmallBlind %s -> %s'
         return base % (round_count, old_ante, new_ante, old_sb_amount, new_sb_amount)
 
+class SilentMessageSummarizer(MessageSummarizer):
+
+    def __init__(self, verbose=0):
+        MessageSummarizer.__init__(self, verbose)
+
+    def print_message(self, message):
+        pass
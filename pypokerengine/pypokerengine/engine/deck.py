@@ -1,47 +1,156 @@
-from functools import reduce
-
 from pypokerengine.engine.card import Card
 import random
 
 class Deck:
+  """Stack of cards kept as card ids.
+
+  The first size() entries of a preallocated 52 slot id array are the cards
+  left, and cards are drawn from the end. A 64 bit mask of the ids left
+  (bit i is card id i) answers membership in O(1), and the position of each
+  id in the array lets remove() take a dead card out in O(1). The positions
+  are only rebuilt by the first remove() after a shuffle or restore.
+  """
 
   def __init__(self, deck_ids=None, cheat=False, cheat_card_ids=[]):
     self.cheat = cheat
     self.cheat_card_ids = cheat_card_ids
-    self.deck = [Card.from_id(cid) for cid in deck_ids] if deck_ids else self.__setup()
+    self._ids = [0] * 52
+    self._pos = None
+    self._size = 0
+    self.mask = 0
+    self.__set_ids(deck_ids if deck_ids else self.__setup())
+
+  @property
+  def deck(self):
+    return _DeckCards(self)
+
+  @deck.setter
+  def deck(self, cards):
+    self.__set_ids([card.to_id() for card in cards])
 
   def draw_card(self):
-    return self.deck.pop()
+    if self._size == 0:
+      raise IndexError(self.__empty_deck_msg)
+    self._size -= 1
+    cid = self._ids[self._size]
+    if self._pos: self._pos[cid] = -1
+    self.mask ^= 1 << cid
+    return Card.from_id(cid)
 
   def draw_cards(self, num):
-    return reduce(lambda acc, _: acc + [self.draw_card()], range(num), [])
+    return [self.draw_card() for _ in range(num)]
+
+  def put_card(self, card):
+    """Put a card on top of the deck so it is drawn next. A card already in the deck is moved."""
+    cid = card.to_id()
+    if card in self:
+      self.remove(card)
+    self._ids[self._size] = cid
+    if self._pos: self._pos[cid] = self._size
+    self._size += 1
+    self.mask |= 1 << cid
 
   def size(self):
-    return len(self.deck)
+    return self._size
+
+  def __contains__(self, card):
+    return self.mask >> card.to_id() & 1 == 1
+
+  def remove(self, card):
+    """Take a dead card out of the deck in O(1). The last card of the deck fills its place."""
+    if card not in self:
+      raise ValueError(self.__not_in_deck_msg % card)
+    if not self._pos:
+      self.__build_positions()
+    cid = card.to_id()
+    pos = self._pos[cid]
+    self._size -= 1
+    last = self._ids[self._size]
+    self._ids[pos] = last
+    self._pos[last] = pos
+    self._pos[cid] = -1
+    self.mask ^= 1 << cid
+
+  def sample(self, num, rng=random):
+    """Return num distinct cards left in the deck without drawing them"""
+    return [Card.from_id(cid) for cid in rng.sample(self._ids[:self._size], num)]
 
   def restore(self):
-    self.deck = self.__setup()
+    if self.cheat:
+      self.__set_ids(self.__setup_cheat_deck())
+    else:
+      self._ids[:] = _ALL_CARD_IDS
+      self._size = 52
+      self._pos = None
+      self.mask = _ALL_CARD_MASK
 
   def shuffle(self):
     if not self.cheat:
-      random.shuffle(self.deck)
+      ids = self._ids[:self._size]
+      random.shuffle(ids)
+      self._ids[:self._size] = ids
+      self._pos = None
 
   # serialize format : [cheat_flg, chat_card_ids, deck_card_ids]
   def serialize(self):
-    return [self.cheat, self.cheat_card_ids, [card.to_id() for card in self.deck]]
+    return [self.cheat, self.cheat_card_ids, self._ids[:self._size]]
 
   @classmethod
   def deserialize(self, serial):
     cheat, cheat_card_ids, deck_ids = serial
     return self(deck_ids=deck_ids, cheat=cheat, cheat_card_ids=cheat_card_ids)
 
-  def __setup(self):
-    return self.__setup_cheat_deck() if self.cheat else self.__setup_52_cards()
+  def __set_ids(self, deck_ids):
+    self._size = len(deck_ids)
+    self._ids[:self._size] = deck_ids
+    self._pos = None
+    self.mask = 0
+    for cid in deck_ids:
+      self.mask |= 1 << cid
 
-  def __setup_52_cards(self):
-    return [Card.from_id(cid) for cid in range(1,53)]
+  def __build_positions(self):
+    self._pos = [-1] * 53
+    for pos in range(self._size):
+      self._pos[self._ids[pos]] = pos
+
+  def __setup(self):
+    return self.__setup_cheat_deck() if self.cheat else _ALL_CARD_IDS
 
   def __setup_cheat_deck(self):
-    cards = [Card.from_id(cid) for cid in self.cheat_card_ids]
-    return cards[::-1]
+    return self.cheat_card_ids[::-1]
+
+  __not_in_deck_msg = "%s is not in the deck"
+  __empty_deck_msg = "draw from an empty deck"
+
+class _DeckCards:
+  """List like view of the cards left in a Deck. The last card is drawn next."""
+
+  def __init__(self, deck):
+    self._deck = deck
+
+  def __len__(self):
+    return self._deck.size()
+
+  def __iter__(self):
+    return iter(self.__cards())
+
+  def __getitem__(self, index):
+    return self.__cards()[index]
+
+  def __contains__(self, card):
+    return card in self._deck
+
+  def __eq__(self, other):
+    return self.__cards() == list(other)
+
+  def __repr__(self):
+    return repr(self.__cards())
+
+  def append(self, card):
+    self._deck.put_card(card)
+
+  def __cards(self):
+    return [Card.from_id(cid) for cid in self._deck.serialize()[2]]
 
+_ALL_CARD_IDS = list(range(1, 53))
+_ALL_CARD_MASK = sum([1 << cid for cid in _ALL_CARD_IDS])
@@ -8,9 +8,11 @@ class GameEvaluator:
 
   @classmethod
   def judge(self, table):
-    winners = self.__find_winners_from(table.get_community_card(), table.seats.players)
-    hand_info = self.__gen_hand_info_if_needed(table.seats.players, table.get_community_card())
-    prize_map = self.__calc_prize_distribution(table.get_community_card(), table.seats.players)
+    community_card, players = table.get_community_card(), table.seats.players
+    scores = self.__eval_active_players(community_card, players)
+    winners = self.__find_winners_from(community_card, players, scores)
+    hand_info = self.__gen_hand_info_if_needed(players, community_card)
+    prize_map = self.__calc_prize_distribution(community_card, players, scores)
     return winners, hand_info, prize_map
 
   @classmethod
@@ -21,11 +23,11 @@ class GameEvaluator:
 
 
   @classmethod
-  def __calc_prize_distribution(self, community_card, players):
+  def __calc_prize_distribution(self, community_card, players, scores=None):
     prize_map = self.__create_prize_map(len(players))
     pots = self.create_pot(players)
     for pot in pots:
-      winners = self.__find_winners_from(community_card, pot["eligibles"])
+      winners = self.__find_winners_from(community_card, pot["eligibles"], scores)
       prize = int(pot["amount"] / len(winners))
       for winner in winners:
         prize_map[players.index(winner)] += prize
@@ -37,16 +39,22 @@ class GameEvaluator:
     return reduce(update, [{i:0} for i in range(player_num)], {})
 
   @classmethod
-  def __find_winners_from(self, community_card, players):
-    score_player = lambda player: HandEvaluator.eval_hand(player.hole_card, community_card)
+  def __find_winners_from(self, community_card, players, scores=None):
+    if scores is None:
+      scores = self.__eval_active_players(community_card, players)
 
     active_players = [player for player in players if player.is_active()]
-    scores = [score_player(player) for player in active_players]
-    best_score = max(scores)
-    score_with_players = [(score, player) for score, player in zip(scores, active_players)]
-    winners = [s_p[1] for s_p in score_with_players if s_p[0] == best_score]
+    best_score = max([scores[player] for player in active_players])
+    winners = [player for player in active_players if scores[player] == best_score]
     return winners
 
+  # Each active player's hand is scored once per showdown and the scores are
+  # shared by the winners check and every side pot.
+  @classmethod
+  def __eval_active_players(self, community_card, players):
+    score_player = lambda player: HandEvaluator.eval_hand(player.hole_card, community_card)
+    return { player: score_player(player) for player in players if player.is_active() }
+
   @classmethod
   def __gen_hand_info_if_needed(self, players, community):
     active_players = [player for player in players if player.is_active()]
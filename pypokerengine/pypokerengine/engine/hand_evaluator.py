@@ -1,7 +1,42 @@
-from functools import reduce
-from itertools import groupby
-from phevaluator.evaluator import evaluate_cards 
-from phevaluator.tables import NO_FLUSH_7
+import numpy as np
+from phevaluator.tables import NO_FLUSH_5, NO_FLUSH_6, NO_FLUSH_7
+from phevaluator.tables import FLUSH, SUITS, DP, BINARIES_BY_ID, SUITBIT_BY_ID
+
+from pypokerengine.engine.card import Card
+
+# PyPokerEngine card id (Card.to_id, 1-52) => phevaluator card id
+_PH_CARD_ID = [None] + [card.ph_id for card in Card.all_cards()]
+
+_NO_FLUSH_TABLES = { 5: NO_FLUSH_5, 6: NO_FLUSH_6, 7: NO_FLUSH_7 }
+
+# numpy copies of the lookup tables for eval_hand_batch
+_NP_PH_CARD_ID = np.array([0] + _PH_CARD_ID[1:], dtype=np.int64)
+_NP_SUITBIT_BY_ID = np.array(SUITBIT_BY_ID, dtype=np.int64)
+_NP_BINARIES_BY_ID = np.array(BINARIES_BY_ID, dtype=np.int64)
+_NP_SUITS = np.array(SUITS, dtype=np.int64)
+_NP_FLUSH = np.array(FLUSH, dtype=np.int64)
+_NP_DP = np.array(DP, dtype=np.int64)
+_NP_NO_FLUSH_TABLES = { n: np.array(table, dtype=np.int64) for n, table in _NO_FLUSH_TABLES.items() }
+_NP_RANKS = np.arange(13)
+
+def _gen_straight_rank_table():
+  """Map a 13 bit rank mask (bit 0 is rank 2, bit 12 is A) to the rank that
+  old_eval_hand reports for its best straight: the lowest card of the
+  straight, or 5 for A-2-3-4-5. -1 when there is no straight."""
+  table = []
+  for mask in range(1 << 13):
+    rank_mask = mask << 2
+    rank_mask |= (rank_mask >> 14 & 1) << 1  # A also counts as rank 1
+    low_rank = next((low for low in range(10, 0, -1)
+        if rank_mask >> low & 0b11111 == 0b11111), -1)
+    table.append(5 if low_rank == 1 else low_rank)
+  return table
+
+_STRAIGHT_RANK = _gen_straight_rank_table()
+
+# phevaluator ranks hands from 1 (royal flush) to 7462, so strength is flipped
+# to make larger values stronger.
+_STRENGTH_BASE = 7515
 
 class HandEvaluator:
 
@@ -91,21 +126,13 @@ class HandEvaluator:
   def old_eval_hand(self, hole, community): 
     ranks = sorted([card.rank for card in hole]) 
     hole_flg = ranks[1] << 4 | ranks[0] 
-    hand_flg = self.__calc_hand_info_flg(hole, community) << 8
+    hand_info_flg, flash_suit_idx = self.__calc_hand_info_flg(hole, community)
+    hand_flg = hand_info_flg << 8
  
     is_flash = (hand_flg & (self.FLASH << 8)) != 0 
     if is_flash:
-        cards = hole + community
-        fetch_suit = lambda card: card.suit 
-        flash_suit = None
-        for suit, group_obj in groupby(sorted(cards, key=fetch_suit), key=fetch_suit):
-            g = list(group_obj)
-            if len(g) >= 5:
-                flash_suit = suit
-                break
-         
-        hole_cards_same_suit = [card for card in hole if card.suit == flash_suit]
-        hole_cards_diff_suit = [card for card in hole if card.suit != flash_suit]
+        hole_cards_same_suit = [card for card in hole if card.ph_id & 3 == flash_suit_idx]
+        hole_cards_diff_suit = [card for card in hole if card.ph_id & 3 != flash_suit_idx]
         
         if len(hole_cards_same_suit) == 2: 
             ranks = sorted([card.rank for card in hole_cards_same_suit])
@@ -114,24 +141,83 @@ class HandEvaluator:
             same_suit_rank = hole_cards_same_suit[0].rank
             diff_suit_rank = hole_cards_diff_suit[0].rank
             hole_flg = same_suit_rank << 4 | diff_suit_rank
-        else:
-            hole_flg = hole_flg
  
     return hand_flg | hole_flg
     
 
   @classmethod
   def eval_hand(self, hole, community): 
-    ph_hole_cards = [self.convert_to_ph_card(card) for card in hole]  
-    ph_community_cards = [self.convert_to_ph_card(card) for card in community] 
+    ph_ids = [card.ph_id for card in hole]
+    ph_ids += [card.ph_id for card in community]
+    return self.eval_ph_ids(ph_ids)
+
+  @classmethod
+  def eval_card_ids(self, card_ids):
+    """Evaluate 5 to 7 cards given as PyPokerEngine card ids (Card.to_id).
+
+    Returns the same strength as eval_hand for the same cards.
+    """
+    return self.eval_ph_ids([_PH_CARD_ID[cid] for cid in card_ids])
+
+  @classmethod
+  def eval_ph_ids(self, ph_ids):
+    """Evaluate 5 to 7 cards given as phevaluator integer card ids.
+
+    This is phevaluator's evaluate_cards inlined on its own lookup tables,
+    which skips the per-card string parsing of the public API.
+    """
+    suit_hash = 0
+    for ph_id in ph_ids:
+      suit_hash += SUITBIT_BY_ID[ph_id]
+    flush_suit = SUITS[suit_hash] - 1
+
+    if flush_suit != -1:
+      hand_binary = 0
+      for ph_id in ph_ids:
+        if ph_id & 3 == flush_suit:
+          hand_binary |= BINARIES_BY_ID[ph_id]
+      return _STRENGTH_BASE - FLUSH[hand_binary]
+
+    quinary = [0] * 13
+    for ph_id in ph_ids:
+      quinary[ph_id >> 2] += 1
+    num_cards = len(ph_ids)
+    no_flush = _NO_FLUSH_TABLES[num_cards]
+    hash_ = 0
+    for rank in range(13):
+      count = quinary[rank]
+      if count:
+        hash_ += DP[count][12 - rank][num_cards]
+        num_cards -= count
+    return _STRENGTH_BASE - no_flush[hash_]
+
+  @classmethod
+  def eval_hand_batch(self, card_ids):
+    """Evaluate many hands at once.
+
+    card_ids is an (N, k) integer array of PyPokerEngine card ids (Card.to_id)
+    with 5 <= k <= 7. Returns an (N,) int64 array whose i-th value equals
+    eval_card_ids(card_ids[i]).
+    """
+    ph_ids = _NP_PH_CARD_ID[np.asarray(card_ids, dtype=np.int64)]
+    if ph_ids.ndim != 2 or ph_ids.shape[1] not in _NP_NO_FLUSH_TABLES:
+      raise ValueError(self.__batch_shape_err_msg % (ph_ids.shape,))
+    num_cards = ph_ids.shape[1]
+
+    # flush hands: OR of the binaries of the flush suit cards (ranks are distinct)
+    flush_suit = _NP_SUITS[_NP_SUITBIT_BY_ID[ph_ids].sum(axis=1)] - 1
+    in_flush = (ph_ids & 3) == flush_suit[:, None]
+    hand_binary = np.where(in_flush, _NP_BINARIES_BY_ID[ph_ids], 0).sum(axis=1)
+
+    # other hands: quinary hash over the rank counts from 2 to A
+    quinary = (ph_ids[:, :, None] >> 2 == _NP_RANKS).sum(axis=1)
+    remaining = num_cards - np.cumsum(quinary, axis=1) + quinary
+    hash_ = _NP_DP[quinary, 12 - _NP_RANKS, remaining].sum(axis=1)
+
+    rank = np.where(flush_suit != -1,
+        _NP_FLUSH[hand_binary], _NP_NO_FLUSH_TABLES[num_cards][hash_])
+    return _STRENGTH_BASE - rank
 
-    all_cards = ph_hole_cards + ph_community_cards
-   
-    final_hand_value = evaluate_cards(*all_cards)
- 
-    return 7515 - final_hand_value
-        
-  
 
 
   # Return Format
@@ -146,194 +232,61 @@ class HandEvaluator:
   #       FullHouse of rank 3, 4   =>   100000 0011 0100
   #       FourCard of rank 2       =>  1000000 0010 0000
   #       straight flash of rank 7 => 10000000 0111 0000
+  #
+  # Rank and suit histograms are built in one pass over the cards and every
+  # hand category is read from them. Also returns the suit index (c, d, h, s)
+  # of the flash suit, or -1 when there are less than 5 cards of one suit.
   @classmethod
   def __calc_hand_info_flg(self, hole, community):
-    cards = hole + community 
-    if self.__is_straightflash(cards): 
-        return self.STRAIGHTFLASH | self.__eval_straightflash(cards)
-    if self.__is_fourcard(cards): 
-        return self.FOURCARD | self.__eval_fourcard(cards)
-    if self.__is_fullhouse(cards): 
-        return self.FULLHOUSE | self.__eval_fullhouse(cards)
-    if self.__is_flash(cards):  
-        return self.FLASH | self.__eval_flash(cards)
-    if self.__is_straight(cards): 
-        return self.STRAIGHT | self.__eval_straight(cards)
-    if self.__is_threecard(cards): 
-        return self.THREECARD | self.__eval_threecard(cards)
-    if self.__is_twopair(cards): 
-        return self.TWOPAIR | self.__eval_twopair(cards)
-    if self.__is_onepair(cards): 
-        return self.ONEPAIR | self.__eval_onepair(cards) 
-    return self.__eval_holecard(hole)
+    rank_counts = [0] * 15
+    suit_masks = [0, 0, 0, 0]
+    for card in hole + community:
+      rank_counts[card.rank] += 1
+      suit_masks[card.ph_id & 3] |= 1 << card.rank
+
+    flash_suit_idx, flash_mask = -1, 0
+    for suit_idx in range(4):
+      if suit_masks[suit_idx].bit_count() >= 5:
+        flash_suit_idx, flash_mask = suit_idx, suit_masks[suit_idx]
+
+    if flash_mask:
+      straightflash_rank = _STRAIGHT_RANK[flash_mask >> 2]
+      if straightflash_rank != -1:
+        return self.STRAIGHTFLASH | straightflash_rank << 4, flash_suit_idx
+
+    fourcard_rank, threecard_ranks, pair_ranks, rank_mask = 0, [], [], 0
+    for rank in range(14, 1, -1):
+      count = rank_counts[rank]
+      if count == 0: continue
+      rank_mask |= 1 << rank
+      if count == 4: fourcard_rank = rank
+      elif count == 3: threecard_ranks.append(rank)
+      elif count == 2: pair_ranks.append(rank)
+
+    if fourcard_rank:
+      return self.FOURCARD | fourcard_rank << 4, flash_suit_idx
+    if threecard_ranks and (pair_ranks or len(threecard_ranks) == 2):
+      fullhouse_pair_rank = pair_ranks[0] if pair_ranks else threecard_ranks[1]
+      return self.FULLHOUSE | threecard_ranks[0] << 4 | fullhouse_pair_rank, flash_suit_idx
+    if flash_mask:
+      return self.FLASH | (flash_mask.bit_length() - 1) << 4, flash_suit_idx
+    straight_rank = _STRAIGHT_RANK[rank_mask >> 2]
+    if straight_rank != -1:
+      return self.STRAIGHT | straight_rank << 4, flash_suit_idx
+    if threecard_ranks:
+      return self.THREECARD | threecard_ranks[0] << 4, flash_suit_idx
+    if len(pair_ranks) >= 2:
+      return self.TWOPAIR | pair_ranks[0] << 4 | pair_ranks[1], flash_suit_idx
+    if pair_ranks:
+      return self.ONEPAIR | pair_ranks[0] << 4, flash_suit_idx
+    return self.__eval_holecard(hole), flash_suit_idx
 
   @classmethod
   def __eval_holecard(self, hole):
     ranks = sorted([card.rank for card in hole])
     return ranks[1] << 4 | ranks[0]
 
-  @classmethod
-  def __is_onepair(self, cards):
-    return self.__eval_onepair(cards) != 0
-
-  @classmethod
-  def __eval_onepair(self, cards):
-    rank = 0
-    memo = 0  # bit memo
-    for card in cards:
-      mask = 1 << card.rank
-      if memo & mask != 0: rank = max(rank, card.rank)
-      memo |= mask
-    return rank << 4
-
-  @classmethod
-  def __is_twopair(self, cards):
-    return len(self.__search_twopair(cards)) == 2
-
-  @classmethod
-  def __eval_twopair(self, cards):
-    ranks = self.__search_twopair(cards)
-    return ranks[0] << 4 | ranks[1]
-
-  @classmethod
-  def __search_twopair(self, cards):
-    ranks = []
-    memo = 0
-    for card in cards:
-      mask = 1 << card.rank
-      if memo & mask != 0: ranks.append(card.rank)
-      memo |= mask
-    return sorted(ranks)[::-1][:2]
-
-  @classmethod
-  def __is_threecard(self, cards):
-    return self.__search_threecard(cards) != -1
-
-  @classmethod
-  def __eval_threecard(self, cards):
-    return self.__search_threecard(cards) << 4
-
-  @classmethod
-  def __search_threecard(self, cards):
-    rank = -1
-    bit_memo = reduce(lambda memo,card: memo + (1 << (card.rank-1)*3), cards, 0)
-    for r in range(2, 15):
-      bit_memo >>= 3
-      count = bit_memo & 7
-      if count >= 3: rank = r
-    return rank
-
-  @classmethod
-  def __is_straight(self, cards):
-    return self.__search_straight(cards) != -1
-
-  @classmethod
-  def __eval_straight(self, cards):
-    return self.__search_straight(cards) << 4
-
-  @classmethod
-  def __search_straight(self, cards): 
-    bit_memo = reduce(lambda memo, card: memo | 1 << card.rank, cards, 0)
-     
-    # If A(14) exists, also set the position 1 bit
-    bit_memo = bit_memo | ((bit_memo >> 14) & 1) << 1
-    
-    rank = -1
-    straight_check = lambda acc, i: acc & (bit_memo >> (r+i) & 1) == 1
-    
-    # Check normal straight first
-    for r in range(2, 15):
-        if reduce(straight_check, range(5), True):
-            rank = r
-    
-    # If no normal straight is found, check A,2,3,4,5
-    if rank == -1: 
-        r = 1 
-        if reduce(straight_check, range(5), True):
-          rank = 5  # A,2,3,4,5，5 is the highest rank 
-    return rank 
-
-  @classmethod
-  def __is_flash(self, cards):
-    return self.__search_flash(cards) != -1
-
-  @classmethod
-  def __eval_flash(self, cards):
-    return self.__search_flash(cards) << 4
-
-  @classmethod
-  def __search_flash(self, cards):
-    best_suit_rank = -1
-    fetch_suit = lambda card: card.suit
-    fetch_rank = lambda card: card.rank
-    for suit, group_obj in groupby(sorted(cards, key=fetch_suit), key=fetch_suit): 
-      g = list(group_obj)
-      if len(g) >= 5:
-        max_rank_card = max(g, key=fetch_rank)  
-        best_suit_rank = max(best_suit_rank, max_rank_card.rank)
-        
-    return best_suit_rank
-
-  @classmethod
-  def __is_fullhouse(self, cards):
-    r1, r2 = self.__search_fullhouse(cards)
-    return r1 and r2
-
-  @classmethod
-  def __eval_fullhouse(self, cards):
-    r1, r2 = self.__search_fullhouse(cards)
-    return r1 << 4 | r2
-
-  @classmethod
-  def __search_fullhouse(self, cards):
-    fetch_rank = lambda card: card.rank
-    three_card_ranks, two_pair_ranks = [], []
-    for rank, group_obj in groupby(sorted(cards, key=fetch_rank), key=fetch_rank):
-      g = list(group_obj)
-      if len(g) >= 3:
-        three_card_ranks.append(rank)
-      if len(g) >= 2:
-        two_pair_ranks.append(rank)
-    two_pair_ranks = [rank for rank in two_pair_ranks if not rank in three_card_ranks]
-    if len(three_card_ranks) == 2:
-      two_pair_ranks.append(min(three_card_ranks))
-    max_ = lambda l: None if len(l)==0 else max(l)
-    return max_(three_card_ranks), max_(two_pair_ranks)
-
-  @classmethod
-  def __is_fourcard(self, cards):
-    return self.__eval_fourcard(cards) != 0
-
-  @classmethod
-  def __eval_fourcard(self, cards):
-    rank = self.__search_fourcard(cards)
-    return rank << 4
-
-  @classmethod
-  def __search_fourcard(self, cards):
-    fetch_rank = lambda card: card.rank
-    for rank, group_obj in groupby(sorted(cards, key=fetch_rank), key=fetch_rank):
-      g = list(group_obj)
-      if len(g) >= 4:
-        return rank
-    return 0
-
-  @classmethod
-  def __is_straightflash(self, cards):
-    return self.__search_straightflash(cards) != -1
-
-  @classmethod
-  def __eval_straightflash(self, cards):
-    return self.__search_straightflash(cards) << 4
-
-  @classmethod
-  def __search_straightflash(self, cards):
-    flash_cards = []
-    fetch_suit = lambda card: card.suit
-    for suit, group_obj in groupby(sorted(cards, key=fetch_suit), key=fetch_suit):
-      g = list(group_obj)
-      if len(g) >= 5: flash_cards = g
-    return self.__search_straight(flash_cards)
+  __batch_shape_err_msg = "card_ids must be an (N, 5-7) array of card ids but got shape %s"
 
   @classmethod
   def __mask_hand_strength(self, bit):
@@ -360,3 +313,86 @@ class HandEvaluator:
     mask = 15
     return bit & mask
 
+
+
+class BoardEvaluator:
+  """Scores many 2 card holdings on one board of 3 to 5 cards.
+
+  The suit hash, flush binaries and rank counts of the board are computed
+  once. A holding is then scored with a flush check and a lookup of the
+  no-flush rank of its two ranks, which is computed on first use. The score
+  of a holding equals HandEvaluator.eval_hand(holding, board).
+  """
+
+  def __init__(self, community):
+    ph_ids = [card.ph_id for card in community]
+    if not 3 <= len(ph_ids) <= 5:
+      raise ValueError(self.__board_size_err_msg % len(ph_ids))
+    self.community = list(community)
+    self.num_cards = len(ph_ids) + 2
+    self.suit_hash = sum([SUITBIT_BY_ID[ph_id] for ph_id in ph_ids])
+    self.flush_binaries = [0, 0, 0, 0]
+    self.quinary = [0] * 13
+    for ph_id in ph_ids:
+      self.flush_binaries[ph_id & 3] |= BINARIES_BY_ID[ph_id]
+      self.quinary[ph_id >> 2] += 1
+    self.__no_flush_scores = [None] * 169
+    self.__np_no_flush_scores = None
+
+  def eval_hole(self, hole):
+    return self.eval_ph_pair(hole[0].ph_id, hole[1].ph_id)
+
+  def eval_ph_pair(self, ph_id1, ph_id2):
+    flush_suit = SUITS[self.suit_hash + SUITBIT_BY_ID[ph_id1] + SUITBIT_BY_ID[ph_id2]] - 1
+    if flush_suit != -1:
+      hand_binary = self.flush_binaries[flush_suit]
+      if ph_id1 & 3 == flush_suit: hand_binary |= BINARIES_BY_ID[ph_id1]
+      if ph_id2 & 3 == flush_suit: hand_binary |= BINARIES_BY_ID[ph_id2]
+      return _STRENGTH_BASE - FLUSH[hand_binary]
+
+    key = (ph_id1 >> 2) * 13 + (ph_id2 >> 2)
+    score = self.__no_flush_scores[key]
+    if score is None:
+      score = self.__calc_no_flush_score(ph_id1 >> 2, ph_id2 >> 2)
+      self.__no_flush_scores[key] = score
+    return score
+
+  def eval_card_ids_batch(self, hole_ids):
+    """Score an (N, 2) array of hole card ids (Card.to_id) => (N,) int64 array"""
+    ph_ids = _NP_PH_CARD_ID[np.asarray(hole_ids, dtype=np.int64)]
+    if ph_ids.ndim != 2 or ph_ids.shape[1] != 2:
+      raise ValueError(self.__hole_shape_err_msg % (ph_ids.shape,))
+    if self.__np_no_flush_scores is None:
+      self.__np_no_flush_scores = self.__calc_all_no_flush_scores()
+
+    flush_suit = _NP_SUITS[self.suit_hash + _NP_SUITBIT_BY_ID[ph_ids].sum(axis=1)] - 1
+    in_flush = (ph_ids & 3) == flush_suit[:, None]
+    hand_binary = np.array(self.flush_binaries, dtype=np.int64)[flush_suit] | \
+        np.where(in_flush, _NP_BINARIES_BY_ID[ph_ids], 0).sum(axis=1)
+    return np.where(flush_suit != -1, _STRENGTH_BASE - _NP_FLUSH[hand_binary],
+        self.__np_no_flush_scores[ph_ids[:, 0] >> 2, ph_ids[:, 1] >> 2])
+
+  def __calc_no_flush_score(self, rank1, rank2):
+    quinary = list(self.quinary)
+    quinary[rank1] += 1
+    quinary[rank2] += 1
+    num_cards = self.num_cards
+    hash_ = 0
+    for rank in range(13):
+      count = quinary[rank]
+      if count:
+        hash_ += DP[count][12 - rank][num_cards]
+        num_cards -= count
+    return _STRENGTH_BASE - _NO_FLUSH_TABLES[self.num_cards][hash_]
+
+  def __calc_all_no_flush_scores(self):
+    """13 x 13 table of the no-flush score of every rank pair (0 where impossible)"""
+    scores = np.zeros((13, 13), dtype=np.int64)
+    for rank1 in range(13):
+      for rank2 in range(rank1, 13):
+        if self.quinary[rank1] + 1 + (rank1 == rank2) <= 4 and self.quinary[rank2] < 4:
+          scores[rank1, rank2] = scores[rank2, rank1] = self.__calc_no_flush_score(rank1, rank2)
+    return scores
+
+  __board_size_err_msg = "Board must have 3 to 5 cards but got %d"
+  __hole_shape_err_msg = "hole_ids must be an (N, 2) array of card ids but got shape %s"
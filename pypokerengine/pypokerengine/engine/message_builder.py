@@ -2,12 +2,20 @@ from pypokerengine.engine.data_encoder import DataEncoder
 from pypokerengine.engine.action_checker import ActionChecker
 
 class MessageBuilder:
+  """Builds the messages sent to players.
+
+  Messages with a round_state accept one already encoded from the same
+  state, so RoundManager encodes each state once however many messages it
+  builds from it. The action_histories of ask and update messages are
+  those of their round_state.
+  """
 
   GAME_START_MESSAGE = "game_start_message"
   ROUND_START_MESSAGE = "round_start_message"
   STREET_START_MESSAGE = "street_start_message"
   ASK_MESSAGE = "ask_message"
   GAME_UPDATE_MESSAGE = "game_update_message"
+  GAME_UPDATE_DELTA_MESSAGE = "game_update_delta_message"
   ROUND_RESULT_MESSAGE = "round_result_message"
   GAME_RESULT_MESSAGE = "game_result_message"
 
@@ -32,38 +40,65 @@ class MessageBuilder:
     return self.__build_notification_message(message)
 
   @classmethod
-  def build_street_start_message(self, state):
+  def build_street_start_message(self, state, round_state=None):
     message = {
         "message_type": self.STREET_START_MESSAGE,
-        "round_state": DataEncoder.encode_round_state(state)
+        "round_state": round_state or DataEncoder.encode_round_state(state)
         }
     message.update(DataEncoder.encode_street(state["street"]))
     return self.__build_notification_message(message)
 
   @classmethod
-  def build_ask_message(self, player_pos, state):
+  def build_ask_message(self, player_pos, state, round_state=None):
     players = state["table"].seats.players
     player = players[player_pos]
     hole_card = DataEncoder.encode_player(player, holecard=True)["hole_card"]
-    valid_actions = ActionChecker.legal_actions(players, player_pos, state["small_blind_amount"])
+    valid_actions = ActionChecker.legal_actions(players, player_pos, state["small_blind_amount"], state.get("ledger"))
+    round_state = round_state or DataEncoder.encode_round_state(state)
     message = {
         "message_type" : self.ASK_MESSAGE,
         "hole_card": hole_card,
         "valid_actions": valid_actions,
-        "round_state": DataEncoder.encode_round_state(state),
-        "action_histories": DataEncoder.encode_action_histories(state["table"])
+        "round_state": round_state,
+        "action_histories": { "action_histories": round_state["action_histories"] }
     }
     return self.__build_ask_message(message)
 
   @classmethod
-  def build_game_update_message(self, player_pos, action, amount, state):
+  def build_game_update_message(self, player_pos, action, amount, state, round_state=None):
     player = state["table"].seats.players[player_pos]
+    round_state = round_state or DataEncoder.encode_round_state(state)
     message = {
         "message_type": self.GAME_UPDATE_MESSAGE,
         "action": DataEncoder.encode_action(player, action, amount),
-        "round_state": DataEncoder.encode_round_state(state),
-        "action_histories": DataEncoder.encode_action_histories(state["table"])
+        "round_state": round_state,
+        "action_histories": { "action_histories": round_state["action_histories"] }
+    }
+    return self.__build_notification_message(message)
+
+  @classmethod
+  def build_ask_delta_message(self, player_pos, state):
+    """Ask message without round_state for players which track it from deltas"""
+    players = state["table"].seats.players
+    hole_card = DataEncoder.encode_player(players[player_pos], holecard=True)["hole_card"]
+    valid_actions = ActionChecker.legal_actions(players, player_pos, state["small_blind_amount"], state.get("ledger"))
+    message = {
+        "message_type" : self.ASK_MESSAGE,
+        "hole_card": hole_card,
+        "valid_actions": valid_actions,
+        "next_player": player_pos
+    }
+    return self.__build_ask_message(message)
+
+  @classmethod
+  def build_game_update_delta_message(self, player_pos, action, amount, state):
+    """What build_game_update_message's round_state changed by the action of player_pos"""
+    player = state["table"].seats.players[player_pos]
+    message = {
+        "message_type": self.GAME_UPDATE_DELTA_MESSAGE,
+        "action": DataEncoder.encode_action(player, action, amount)
     }
+    message.update(DataEncoder.encode_update_delta(player_pos, state))
     return self.__build_notification_message(message)
 
   @classmethod
@@ -4,6 +4,8 @@ class PayInfo:
   ALLIN  = 1
   FOLDED = 2
 
+  __slots__ = ["amount", "status"]
+
   def __init__(self, amount=0, status=0):
     self.amount = amount
     self.status = status
@@ -1,4 +1,5 @@
 from pypokerengine.engine.pay_info import PayInfo
+from pypokerengine.engine.action_history import ActionHistory
 from pypokerengine.engine.card import Card
 from pypokerengine.engine.poker_constants import PokerConstants as Const
 
@@ -12,6 +13,8 @@ class Player:
   ACTION_BIG_BLIND = "BIGBLIND"
   ACTION_ANTE = "ANTE"
 
+  __slots__ = ["name", "uuid", "hole_card", "stack", "round_action_histories", "action_histories", "pay_info"]
+
   def __init__(self, uuid, initial_stack, name="No Name"):
     self.name = name
     self.uuid = uuid
@@ -63,7 +66,6 @@ class Player:
       history = self.__ante_history(chip_amount)
     else:
       raise "UnKnown action history is added (kind = %s)" % kind
-    history = self.__add_uuid_on_history(history)
     self.action_histories.append(history)
 
   def save_street_action_histories(self, street_flg):
@@ -78,15 +80,17 @@ class Player:
     self.pay_info = PayInfo()
 
   def paid_sum(self):
-    pay_history = [h for h in self.action_histories if h["action"] not in ["FOLD", "ANTE"]]
-    last_pay_history = pay_history[-1] if len(pay_history)!=0 else None
-    return last_pay_history["amount"] if last_pay_history else 0
+    for history in reversed(self.action_histories):
+      if history.action not in ["FOLD", "ANTE"]:
+        return history.amount
+    return 0
 
   def serialize(self):
     hole = [card.to_id() for card in self.hole_card]
+    round_histories = [self.__serialize_histories(h) for h in self.round_action_histories]
     return [
         self.name, self.uuid, self.stack, hole,\
-            self.action_histories[::], self.pay_info.serialize(), self.round_action_histories[::]
+            self.__serialize_histories(self.action_histories), self.pay_info.serialize(), round_histories
     ]
 
   @classmethod
@@ -94,9 +98,9 @@ class Player:
     hole = [Card.from_id(cid) for cid in serial[3]]
     player = self(serial[1], serial[2], serial[0])
     if len(hole)!=0: player.add_holecard(hole)
-    player.action_histories = serial[4]
+    player.action_histories = self.__restore_histories(serial[4])
     player.pay_info = PayInfo.deserialize(serial[5])
-    player.round_action_histories = serial[6]
+    player.round_action_histories = [self.__restore_histories(h) for h in serial[6]]
     return player
 
   """ private """
@@ -110,42 +114,30 @@ class Player:
     return [None for _ in range(4)]  # 4 == len(["preflop", "flop", "turn", "river"])
 
   def __fold_history(self):
-    return { "action" : self.ACTION_FOLD_STR }
+    return ActionHistory(self.ACTION_FOLD_STR, uuid=self.uuid)
 
   def __call_history(self, bet_amount):
-    return {
-        "action" : self.ACTION_CALL_STR,
-        "amount" : bet_amount,
-        "paid" : bet_amount - self.paid_sum()
-    }
+    return ActionHistory(self.ACTION_CALL_STR, bet_amount, bet_amount - self.paid_sum(), uuid=self.uuid)
 
   def __raise_history(self, bet_amount, add_amount):
-    return {
-        "action" : self.ACTION_RAISE_STR,
-        "amount" : bet_amount,
-        "paid" : bet_amount - self.paid_sum(),
-        "add_amount" : add_amount
-        }
+    return ActionHistory(self.ACTION_RAISE_STR, bet_amount, bet_amount - self.paid_sum(), add_amount, self.uuid)
 
   def __blind_history(self, small_blind, sb_amount):
     assert(sb_amount is not None)
     action = self.ACTION_SMALL_BLIND if small_blind else self.ACTION_BIG_BLIND
     amount = sb_amount if small_blind else sb_amount*2
     add_amount = sb_amount
-    return {
-        "action" : action,
-        "amount" : amount,
-        "add_amount" : add_amount
-        }
+    return ActionHistory(action, amount, add_amount=add_amount, uuid=self.uuid)
 
   def __ante_history(self, pay_amount):
     assert(pay_amount > 0)
-    return {
-        "action" : self.ACTION_ANTE,
-        "amount" : pay_amount
-        }
+    return ActionHistory(self.ACTION_ANTE, pay_amount, uuid=self.uuid)
 
-  def __add_uuid_on_history(self, history):
-    history["uuid"] = self.uuid
-    return history
+  def __serialize_histories(self, histories):
+    if histories is None: return None
+    return [h.to_dict() for h in histories]
 
+  @classmethod
+  def __restore_histories(self, histories):
+    if histories is None: return None
+    return [ActionHistory.from_dict(h) for h in histories]
@@ -5,23 +5,47 @@ from pypokerengine.engine.player import Player
 from pypokerengine.engine.pay_info import PayInfo
 from pypokerengine.engine.poker_constants import PokerConstants as Const
 from pypokerengine.engine.action_checker import ActionChecker
+from pypokerengine.engine.betting_ledger import BettingLedger
 from pypokerengine.engine.game_evaluator import GameEvaluator
 from pypokerengine.engine.message_builder import MessageBuilder
+from pypokerengine.engine.data_encoder import DataEncoder
 
 
 class RoundManager:
+    """Drives one round of poker as a sequence of states.
+
+    By default start_new_round and apply_action leave the given table and
+    state untouched and return a copy, so callers like the Emulator can keep
+    old states around. With inplace=True the state (and its table) is
+    mutated and returned, which skips copying the whole table on every
+    action. Use it only when old states are never looked at again.
+
+    state["ledger"] is the BettingLedger of the current street. States
+    without it (e.g. restored by game_state_utils) get one built from the
+    action histories on their first apply_action.
+
+    With delta=True (kept as state["delta"]) players are told about actions
+    by game_update_delta_messages and asked without a round_state, so the
+    state is only encoded for street start and round result messages. See
+    utils.round_state_utils.RoundStateTracker for the receiving side.
+    quiet=True skips printing the dealt hole cards.
+    """
+
     @classmethod
-    def start_new_round(self, round_count, small_blind_amount, ante_amount, table):
+    def start_new_round(self, round_count, small_blind_amount, ante_amount, table, inplace=False, delta=False, quiet=False):
         _state = self.__gen_initial_state(round_count, small_blind_amount, table)
-        state = self.__deep_copy_state(_state)
+        state = _state if inplace else self.__deep_copy_state(_state)
         table = state["table"]
+        if delta:
+            state["delta"] = True
 
         table.deck.shuffle()
         self.__correct_ante(ante_amount, table.seats.players)
         self.__correct_blind(small_blind_amount, table)
+        state["ledger"] = BettingLedger.from_players(table.seats.players, small_blind_amount)
         self.__deal_holecard(table.deck, table.seats.players)
         for player in table.seats.players:
-            if player.is_active() == False:
+            if quiet or player.is_active() == False:
                 continue
             print(
                 "player [{}] gets hole card {}, current stack {}".format(
@@ -33,15 +57,18 @@ class RoundManager:
         return state, start_msg + street_msgs
 
     @classmethod
-    def apply_action(self, original_state, action, bet_amount):
-        state = self.__deep_copy_state(original_state)
+    def apply_action(self, original_state, action, bet_amount, inplace=False):
+        state = original_state if inplace else self.__deep_copy_state(original_state)
+        self.__fetch_ledger(state)
         state = self.__update_state_by_action(state, action, bet_amount)
-        update_msg = self.__update_message(state, action, bet_amount)
+        round_state = None if state.get("delta") else DataEncoder.encode_round_state(state)
+        update_msg = self.__update_message(state, action, bet_amount, round_state)
         if self.__is_everyone_agreed(state):
             [
                 player.save_street_action_histories(state["street"])
                 for player in state["table"].seats.players
             ]
+            state["ledger"].new_street()
             state["street"] += 1
             state, street_msgs = self.__start_street(state)
             return state, [update_msg] + street_msgs
@@ -49,13 +76,10 @@ class RoundManager:
             state["next_player"] = state["table"].next_ask_waiting_player_pos(
                 state["next_player"]
             )
-            next_player_pos = state["next_player"]
-            next_player = state["table"].seats.players[next_player_pos]
-            ask_message = (
-                next_player.uuid,
-                MessageBuilder.build_ask_message(next_player_pos, state),
-            )
-            return state, [update_msg, ask_message]
+            # the state only differs from that of update_msg by next_player
+            if round_state is not None:
+                round_state = dict(round_state, next_player=state["next_player"])
+            return state, [update_msg, self.__ask_message(state, round_state)]
 
     @classmethod
     def __correct_ante(self, ante_amount, players):
@@ -157,23 +181,18 @@ class RoundManager:
     @classmethod
     def __forward_street(self, state):
         table = state["table"]
-        street_start_msg = [(-1, MessageBuilder.build_street_start_message(state))]
-        if table.seats.count_active_players() == 1:
-            street_start_msg = []
+        street_start_msg, round_state = [], None
+        if table.seats.count_active_players() != 1:
+            round_state = DataEncoder.encode_round_state(state)
+            street_start_msg = [
+                (-1, MessageBuilder.build_street_start_message(state, round_state))
+            ]
         if table.seats.count_ask_wait_players() <= 1:
             state["street"] += 1
             state, messages = self.__start_street(state)
             return state, street_start_msg + messages
         else:
-            next_player_pos = state["next_player"]
-            next_player = table.seats.players[next_player_pos]
-            ask_message = [
-                (
-                    next_player.uuid,
-                    MessageBuilder.build_ask_message(next_player_pos, state),
-                )
-            ]
-            return state, street_start_msg + ask_message
+            return state, street_start_msg + [self.__ask_message(state, round_state)]
 
     @classmethod
     def __update_state_by_action(self, state, action, bet_amount):
@@ -184,6 +203,7 @@ class RoundManager:
             state["small_blind_amount"],
             action,
             bet_amount,
+            state["ledger"],
         )
         next_player = table.seats.players[state["next_player"]]
         if ActionChecker.is_allin(next_player, action, bet_amount):
@@ -193,20 +213,20 @@ class RoundManager:
     @classmethod
     def __accept_action(self, state, action, bet_amount):
         player = state["table"].seats.players[state["next_player"]]
+        ledger = state["ledger"]
         if action == "call":
             self.__chip_transaction(player, bet_amount)
             player.add_action_history(Const.Action.CALL, bet_amount)
         elif action == "raise":
             self.__chip_transaction(player, bet_amount)
-            add_amount = bet_amount - ActionChecker.agree_amount(
-                state["table"].seats.players
-            )
+            add_amount = bet_amount - ledger.current_bet
             player.add_action_history(Const.Action.RAISE, bet_amount, add_amount)
         elif action == "fold":
             player.add_action_history(Const.Action.FOLD)
             player.pay_info.update_to_fold()
         else:
             raise ValueError("Unexpected action %s received" % action)
+        ledger.record(state["next_player"], player.action_histories[-1])
         return state
 
     @classmethod
@@ -216,34 +236,52 @@ class RoundManager:
         player.pay_info.update_by_pay(need_amount)
 
     @classmethod
-    def __update_message(self, state, action, bet_amount):
+    def __update_message(self, state, action, bet_amount, round_state):
+        if state.get("delta"):
+            return (
+                -1,
+                MessageBuilder.build_game_update_delta_message(
+                    state["next_player"], action, bet_amount, state
+                ),
+            )
         return (
             -1,
             MessageBuilder.build_game_update_message(
-                state["next_player"], action, bet_amount, state
+                state["next_player"], action, bet_amount, state, round_state
             ),
         )
 
+    @classmethod
+    def __ask_message(self, state, round_state):
+        next_player_pos = state["next_player"]
+        next_player = state["table"].seats.players[next_player_pos]
+        if state.get("delta"):
+            message = MessageBuilder.build_ask_delta_message(next_player_pos, state)
+        else:
+            message = MessageBuilder.build_ask_message(next_player_pos, state, round_state)
+        return (next_player.uuid, message)
+
     @classmethod
     def __is_everyone_agreed(self, state):
         self.__agree_logic_bug_catch(state)
         players = state["table"].seats.players
+        paid = state["ledger"].contributions
         next_player_pos = state["table"].next_ask_waiting_player_pos(
             state["next_player"]
         )
         next_player = (
             players[next_player_pos] if next_player_pos != "not_found" else None
         )
-        max_pay = max([p.paid_sum() for p in players])
-        everyone_agreed = len(players) == len(
-            [p for p in players if self.__is_agreed(max_pay, p)]
+        max_pay = max(paid)
+        everyone_agreed = all(
+            self.__is_agreed(max_pay, p, paid[pos]) for pos, p in enumerate(players)
         )
         lonely_player = state["table"].seats.count_active_players() == 1
         no_need_to_ask = (
             state["table"].seats.count_ask_wait_players() == 1
             and next_player
             and next_player.is_waiting_ask()
-            and next_player.paid_sum() == max_pay
+            and paid[next_player_pos] == max_pay
         )
         return everyone_agreed or lonely_player or no_need_to_ask
 
@@ -253,7 +291,7 @@ class RoundManager:
             raise "[__is_everyone_agreed] no-active-players!!"
 
     @classmethod
-    def __is_agreed(self, max_pay, player):
+    def __is_agreed(self, max_pay, player, paid):
         # BigBlind should be asked action at least once
         is_preflop = player.round_action_histories[0] == None
         bb_ask_once = (
@@ -263,7 +301,7 @@ class RoundManager:
         bb_ask_check = not is_preflop or not bb_ask_once
         return (
             bb_ask_check
-            and player.paid_sum() == max_pay
+            and paid == max_pay
             and len(player.action_histories) != 0
         ) or player.pay_info.status in [PayInfo.FOLDED, PayInfo.ALLIN]
 
@@ -277,13 +315,26 @@ class RoundManager:
             "table": table,
         }
 
+    @classmethod
+    def __fetch_ledger(self, state):
+        if state.get("ledger") is None:
+            state["ledger"] = BettingLedger.from_players(
+                state["table"].seats.players, state["small_blind_amount"]
+            )
+        return state["ledger"]
+
     @classmethod
     def __deep_copy_state(self, state):
         table_deepcopy = Table.deserialize(state["table"].serialize())
-        return {
+        copied = {
             "round_count": state["round_count"],
             "small_blind_amount": state["small_blind_amount"],
             "street": state["street"],
             "next_player": state["next_player"],
             "table": table_deepcopy,
         }
+        if state.get("ledger") is not None:
+            copied["ledger"] = state["ledger"].copy()
+        if state.get("delta"):
+            copied["delta"] = True
+        return copied
@@ -3,6 +3,8 @@ from pypokerengine.engine.player import Player
 
 class Seats:
 
+  __slots__ = ["players"]
+
   def __init__(self):
     self.players = []
 
@@ -4,6 +4,8 @@ from pypokerengine.engine.deck import Deck
 
 class Table:
 
+  __slots__ = ["dealer_btn", "_blind_pos", "seats", "deck", "_community_card"]
+
   def __init__(self, cheat_deck=None):
     self.dealer_btn = 0
     self._blind_pos = None
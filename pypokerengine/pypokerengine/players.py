@@ -1,5 +1,7 @@
 from func_timeout import func_set_timeout
 
+from pypokerengine.utils.round_state_utils import RoundStateTracker, delta_from_update_message
+
 class BasePokerPlayer(object):
     """Base Poker client implementation
 
@@ -12,8 +14,16 @@ class BasePokerPlayer(object):
     - receive_street_start_message
     - receive_game_update_message
     - receive_round_result_message
+
+    A player which sets receives_delta = True is told about each action by
+    receive_game_update_delta(delta) with only what the action changed
+    ("action", "history", "seat", "pot", "next_player"). rebuild_round_state()
+    returns the full round_state on demand. When every player of a game
+    opts in, the engine skips encoding round_state for each action.
     """
 
+    receives_delta = False
+
     def __init__(self):
         pass
 
@@ -41,14 +51,33 @@ class BasePokerPlayer(object):
         err_msg = self.__build_err_msg("receive_round_result_message")
         raise NotImplementedError(err_msg)
 
+    def receive_game_update_delta(self, delta):
+        """Called instead of receive_game_update_message when receives_delta is set"""
+        self.receive_game_update_message(delta["action"], self.rebuild_round_state())
+
+    def rebuild_round_state(self):
+        """round_state of the last message, rebuilt from the deltas received so far"""
+        return self.__round_state_tracker().round_state()
+
     def set_uuid(self, uuid):
         self.uuid = uuid
 
     @func_set_timeout(1)
     def respond_to_ask(self, message):
         """Called from Dealer when ask message received from RoundManager"""
+        return self._respond_to_ask(message)
+
+    @func_set_timeout(1)
+    def receive_notification(self, message):
+        """Called from Dealer when notification received from RoundManager"""
+        self._receive_notification(message)
+
+    def _respond_to_ask(self, message):
+        """respond_to_ask without the time limit, called directly by FastDealer"""
         try:
             valid_actions, hole_card, round_state = self.__parse_ask_message(message)
+            if self.receives_delta:
+                round_state = self.__track_ask_message(message)
             action, amount = self.declare_action(valid_actions, hole_card, round_state)
             # FIX: some player did not handle the raise -1 case
             # decay to a call
@@ -61,9 +90,8 @@ class BasePokerPlayer(object):
             print(f"Error in respond_to_ask: {e}")
             return "fold", 0
 
-    @func_set_timeout(1)
-    def receive_notification(self, message):
-        """Called from Dealer when notification received from RoundManager"""
+    def _receive_notification(self, message):
+        """receive_notification without the time limit, called directly by FastDealer"""
         msg_type = message["message_type"]
 
         if msg_type == "game_start_message":
@@ -76,23 +104,48 @@ class BasePokerPlayer(object):
 
         elif msg_type == "street_start_message":
             street, state = self.__parse_street_start_message(message)
+            if self.receives_delta: self.__round_state_tracker().load(state)
             self.receive_street_start_message(street, state)
 
         elif msg_type == "game_update_message":
             new_action, round_state = self.__parse_game_update_message(message)
-            self.receive_game_update_message(new_action, round_state)
+            if self.receives_delta:
+                self.__round_state_tracker().load(round_state)
+                self.receive_game_update_delta(delta_from_update_message(message))
+            else:
+                self.receive_game_update_message(new_action, round_state)
+
+        elif msg_type == "game_update_delta_message":
+            delta = self.__parse_game_update_delta_message(message)
+            self.__round_state_tracker().apply_update(delta)
+            self.receive_game_update_delta(delta)
 
         elif msg_type == "round_result_message":
             winners, hand_info, state = self.__parse_round_result_message(message)
+            if self.receives_delta: self.__round_state_tracker().load(state)
             self.receive_round_result_message(winners, hand_info, state)
 
+    def __round_state_tracker(self):
+        # subclasses do not always call __init__
+        if not hasattr(self, "_round_state_tracker"):
+            self._round_state_tracker = RoundStateTracker()
+        return self._round_state_tracker
+
+    def __track_ask_message(self, message):
+        tracker = self.__round_state_tracker()
+        if "round_state" in message:
+            tracker.load(message["round_state"])
+            return message["round_state"]
+        tracker.apply_ask(message)
+        return tracker.round_state()
+
     def __build_err_msg(self, msg):
         return "Your client does not implement [ {0} ] method".format(msg)
 
     def __parse_ask_message(self, message):
         hole_card = message["hole_card"]
         valid_actions = message["valid_actions"]
-        round_state = message["round_state"]
+        round_state = message.get("round_state")
         return valid_actions, hole_card, round_state
 
     def __parse_game_start_message(self, message):
@@ -115,6 +168,10 @@ class BasePokerPlayer(object):
         round_state = message["round_state"]
         return new_action, round_state
 
+    def __parse_game_update_delta_message(self, message):
+        keys = ["action", "history", "seat", "pot", "next_player"]
+        return { key: message[key] for key in keys }
+
     def __parse_round_result_message(self, message):
         winners = message["winners"]
         hand_info = message["hand_info"]
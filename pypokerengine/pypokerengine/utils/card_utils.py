@@ -1,24 +1,211 @@
 import random
+import time
+from collections import OrderedDict
+from itertools import combinations
+from math import comb, sqrt
+
+import numpy as np
 
 from pypokerengine.engine.card import Card
 from pypokerengine.engine.deck import Deck
-from pypokerengine.engine.hand_evaluator import HandEvaluator
+from pypokerengine.engine.hand_evaluator import HandEvaluator, BoardEvaluator
+from pypokerengine.utils.preflop_equity_table import PREFLOP_EQUITY
+from pypokerengine.utils.sampling_utils import combination_array, encode_card_ids, draw_unused_card_ids, to_np_rng
 
 def gen_cards(cards_str):
     return [Card.from_str(s) for s in cards_str]
 
-def estimate_hole_card_win_rate(nb_simulation, nb_player, hole_card, community_card=None):
+# estimate_hole_card_win_rate switches to exact_hole_card_win_rate heads-up
+# when the enumeration needs at most this many hand evaluations (turn and river).
+EXACT_ENUMERATION_THRESHOLD = 20000
+# exact_hole_card_win_rate refuses larger enumerations (the flop needs 179446)
+EXACT_ENUMERATION_LIMIT = 200000
+
+def estimate_hole_card_win_rate(nb_simulation, nb_player, hole_card, community_card=None, rng=None,
+        exact_threshold=EXACT_ENUMERATION_THRESHOLD, use_preflop_table=True):
+    """Estimate the probability that hole_card ties or beats nb_player-1 random hands.
+
+    Preflop the precomputed preflop_equity is returned when use_preflop_table
+    is set. Heads-up (nb_player == 2), when exact enumeration costs at most
+    exact_threshold evaluations, the exact result of exact_hole_card_win_rate
+    is returned instead of sampling (pass exact_threshold=0 to always
+    sample). Multiway queries are always sampled.
+
+    Otherwise all nb_simulation deals are drawn and evaluated at once with
+    numpy. rng may be a seed or a numpy Generator. When it is omitted the
+    generator is seeded from the random module, so random.seed still makes
+    results reproducible.
+    """
     if not community_card: community_card = []
-    win_count = sum([_montecarlo_simulation(nb_player, hole_card, community_card) for _ in range(nb_simulation)])
+    if use_preflop_table and not community_card and 2 <= nb_player <= PREFLOP_MAX_PLAYER:
+        return preflop_equity(hole_card, nb_player)
+    if nb_player == 2 and _exact_enumeration_size(hole_card, community_card) <= min(exact_threshold, EXACT_ENUMERATION_LIMIT):
+        return exact_hole_card_win_rate(nb_player, hole_card, community_card)
+    win_count = _vectorized_montecarlo_win_count(
+            nb_simulation, nb_player, hole_card, community_card, to_np_rng(rng))
     return 1.0 * win_count / nb_simulation
 
+def adaptive_hole_card_win_rate(nb_player, hole_card, community_card=None, target_stderr=0.01,
+        threshold=None, z_score=1.96, batch_size=200, max_simulation=5000, rng=None):
+    """Monte Carlo win rate that samples in batches and stops early.
+
+    Sampling stops once the standard error drops to target_stderr, or, when
+    threshold (e.g. the pot odds) is given, once the estimate is more than
+    z_score standard errors away from it. It also stops at max_simulation.
+    Returns (win_rate, stderr, nb_simulation).
+    """
+    if not community_card: community_card = []
+    def is_decided(win_rate, stderr):
+        if stderr <= target_stderr: return True
+        return threshold is not None and abs(win_rate - threshold) > z_score * stderr
+    return _sample_win_rate_in_batches(nb_player, hole_card, community_card,
+            batch_size, max_simulation, to_np_rng(rng), is_decided)
+
+def timed_hole_card_win_rate(nb_player, hole_card, community_card=None, time_budget=None,
+        deadline=None, batch_size=200, max_simulation=100000, rng=None):
+    """Monte Carlo win rate that samples until a wall-clock limit.
+
+    Pass either time_budget (seconds from now) or deadline (an absolute
+    time.perf_counter() value). Batches are sampled until the next one is
+    expected to end after the deadline, using the duration of the previous
+    batch. The first batch always runs. Returns (win_rate, stderr,
+    nb_simulation) like adaptive_hole_card_win_rate.
+    """
+    if (time_budget is None) == (deadline is None):
+        raise ValueError("Pass exactly one of time_budget or deadline")
+    if not community_card: community_card = []
+    batch_start = [time.perf_counter()]
+    if deadline is None: deadline = batch_start[0] + time_budget
+    def is_out_of_time(win_rate, stderr):
+        now = time.perf_counter()
+        batch_duration, batch_start[0] = now - batch_start[0], now
+        return now + batch_duration > deadline
+    return _sample_win_rate_in_batches(nb_player, hole_card, community_card,
+            batch_size, max_simulation, to_np_rng(rng), is_out_of_time)
+
+def exact_hole_card_win_rate(nb_player, hole_card, community_card):
+    """Heads-up win rate of estimate_hole_card_win_rate computed by full enumeration.
+
+    Every completion of the board and every opponent holding is enumerated,
+    so nb_player must be 2 and community_card must have 3 to 5 cards (a
+    preflop enumeration would not fit in memory). ValueError is raised
+    otherwise, or when the enumeration needs more than
+    EXACT_ENUMERATION_LIMIT hand evaluations.
+
+    Hand values only depend on the set of cards, so each distinct set of
+    (missing board cards + opponent hole) is evaluated once and shared by
+    all the ways to split it into board and hole.
+    """
+    if nb_player != 2:
+        raise ValueError("exact enumeration is only done heads-up (nb_player=2) but got nb_player=%s" % nb_player)
+    if not 3 <= len(community_card) <= 5:
+        raise ValueError("community_card must have 3 to 5 cards but got %d" % len(community_card))
+    enumeration_size = _exact_enumeration_size(hole_card, community_card)
+    if enumeration_size > EXACT_ENUMERATION_LIMIT:
+        raise ValueError("exact enumeration needs %d evaluations (limit is %d)" % (enumeration_size, EXACT_ENUMERATION_LIMIT))
+    need_num = 5 - len(community_card)
+    hole_ids = [card.to_id() for card in hole_card]
+    community_ids = [card.to_id() for card in community_card]
+    unused = np.setdiff1d(np.arange(1, 53), hole_ids + community_ids)
+
+    boards = combination_array(unused, need_num)
+    my_hands = np.hstack([np.tile(np.array(hole_ids + community_ids, dtype=np.int64), (len(boards), 1)), boards])
+    my_score = HandEvaluator.eval_hand_batch(my_hands)
+    board_index = np.zeros(53 ** need_num, dtype=np.int64)
+    board_index[encode_card_ids(boards)] = np.arange(len(boards))
+
+    extra_cards = combination_array(unused, need_num + 2)
+    extra_hands = np.hstack([np.tile(np.array(community_ids, dtype=np.int64), (len(extra_cards), 1)), extra_cards])
+    extra_score = HandEvaluator.eval_hand_batch(extra_hands)
+
+    not_beaten = np.zeros(len(boards))
+    for board_cols in combinations(range(need_num + 2), need_num):
+        board_of_extra = board_index[encode_card_ids(extra_cards[:, list(board_cols)])]
+        is_not_beaten = extra_score <= my_score[board_of_extra]
+        not_beaten += np.bincount(board_of_extra, weights=is_not_beaten, minlength=len(boards))
+
+    not_beaten_rate = not_beaten / comb(len(unused) - need_num, 2)
+    return float(np.mean(not_beaten_rate))
+
+PREFLOP_MAX_PLAYER = 10
+
+def preflop_equity(hole_card, nb_player):
+    """Preflop win rate of hole_card against nb_player-1 random hands (2 <= nb_player <= 10).
+
+    Looked up by starting hand class (e.g. "AKs") from a table generated by
+    scripts/gen_preflop_equity_table.py with the win definition of
+    estimate_hole_card_win_rate.
+    """
+    if not 2 <= nb_player <= PREFLOP_MAX_PLAYER:
+        raise ValueError("nb_player must be between 2 and %d (but got %s)" % (PREFLOP_MAX_PLAYER, nb_player))
+    return PREFLOP_EQUITY[_preflop_hand_class(hole_card)][nb_player - 2]
+
+def canonicalize_situation(hole_card, community_card, nb_player):
+    """Key of (hole_card, community_card, nb_player) that is equal for every
+    suit permutation of the cards, e.g. AhKh on 2c7d9s and AsKs on 2h7c9d.
+
+    Suits are renamed in the order of their (board ranks, hole ranks)
+    signature. Suits with the same signature are interchangeable, so any
+    order among them gives the same key.
+    """
+    signature = lambda suit: (
+            sorted([card.rank for card in community_card if card.suit == suit]),
+            sorted([card.rank for card in hole_card if card.suit == suit]))
+    suits = sorted([Card.CLUB, Card.DIAMOND, Card.HEART, Card.SPADE], key=signature)
+    suit_index = { suit: idx for idx, suit in enumerate(suits) }
+    canonical = lambda cards: tuple(sorted([(card.rank, suit_index[card.suit]) for card in cards]))
+    return canonical(hole_card), canonical(community_card), nb_player
+
+class WinRateCache(object):
+    """Bounded LRU cache in front of estimate_hole_card_win_rate.
+
+    Queries that are the same situation up to suit permutation share one
+    entry (see canonicalize_situation). hits and misses count lookups.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def estimate_hole_card_win_rate(self, nb_simulation, nb_player, hole_card, community_card=None):
+        if not community_card: community_card = []
+        key = canonicalize_situation(hole_card, community_card, nb_player) + (nb_simulation,)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        self.misses += 1
+        win_rate = estimate_hole_card_win_rate(nb_simulation, nb_player, hole_card, community_card)
+        self._entries[key] = win_rate
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return win_rate
+
+    def size(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+_default_win_rate_cache = WinRateCache()
+
+def cached_estimate_hole_card_win_rate(nb_simulation, nb_player, hole_card, community_card=None):
+    """estimate_hole_card_win_rate through the module level WinRateCache"""
+    return _default_win_rate_cache.estimate_hole_card_win_rate(nb_simulation, nb_player, hole_card, community_card)
+
+def get_win_rate_cache():
+    return _default_win_rate_cache
+
 def gen_deck(exclude_cards=None):
     deck_ids = range(1, 53)
     if exclude_cards:
         assert isinstance(exclude_cards, list)
         if isinstance(exclude_cards[0], str):
             exclude_cards = [Card.from_str(s) for s in exclude_cards]
-        exclude_ids = [card.to_id() for card in exclude_cards]
+        exclude_ids = set([card.to_id() for card in exclude_cards])
         deck_ids = [i for i in deck_ids if not i in exclude_ids]
     return Deck(deck_ids)
 
@@ -34,16 +221,73 @@ def _montecarlo_simulation(nb_player, hole_card, community_card):
     community_card = _fill_community_card(community_card, used_card=hole_card+community_card)
     unused_cards = _pick_unused_card((nb_player-1)*2, hole_card + community_card)
     opponents_hole = [unused_cards[2*i:2*i+2] for i in range(nb_player-1)]
-    opponents_score = [HandEvaluator.eval_hand(hole, community_card) for hole in opponents_hole]
-    my_score = HandEvaluator.eval_hand(hole_card, community_card)
+    board = BoardEvaluator(community_card)
+    opponents_score = [board.eval_hole(hole) for hole in opponents_hole]
+    my_score = board.eval_hole(hole_card)
     return 1 if my_score >= max(opponents_score) else 0
 
+def _vectorized_montecarlo_win_count(nb_simulation, nb_player, hole_card, community_card, rng):
+    nb_opponent = nb_player - 1
+    need_num = 5 - len(community_card)
+    hole_ids = [card.to_id() for card in hole_card]
+    community_ids = [card.to_id() for card in community_card]
+    drawn = draw_unused_card_ids(rng, nb_simulation, need_num + 2 * nb_opponent, hole_ids + community_ids)
+    if need_num == 0:
+        return _river_montecarlo_win_count(nb_simulation, nb_opponent, hole_ids, community_card, drawn)
+
+    boards = np.hstack([np.tile(np.array(community_ids, dtype=np.int64), (nb_simulation, 1)), drawn[:, :need_num]])
+    my_hands = np.hstack([np.tile(np.array(hole_ids, dtype=np.int64), (nb_simulation, 1)), boards])
+    my_score = HandEvaluator.eval_hand_batch(my_hands)
+
+    opponents_hole = drawn[:, need_num:].reshape(nb_simulation, nb_opponent, 2)
+    opponents_board = np.broadcast_to(boards[:, None, :], (nb_simulation, nb_opponent, 5))
+    opponents_hands = np.concatenate([opponents_hole, opponents_board], axis=2).reshape(-1, 7)
+    opponents_score = HandEvaluator.eval_hand_batch(opponents_hands).reshape(nb_simulation, nb_opponent)
+    return int(np.count_nonzero(my_score >= opponents_score.max(axis=1)))
+
+def _river_montecarlo_win_count(nb_simulation, nb_opponent, hole_ids, community_card, drawn):
+    # every simulation shares the board, so holdings are scored by one BoardEvaluator
+    board = BoardEvaluator(community_card)
+    my_score = board.eval_card_ids_batch(np.array([hole_ids], dtype=np.int64))[0]
+    opponents_score = board.eval_card_ids_batch(drawn.reshape(-1, 2)).reshape(nb_simulation, nb_opponent)
+    return int(np.count_nonzero(my_score >= opponents_score.max(axis=1)))
+
+def _sample_win_rate_in_batches(nb_player, hole_card, community_card, batch_size, max_simulation, rng, should_stop):
+    if batch_size <= 0 or max_simulation <= 0:
+        raise ValueError("batch_size and max_simulation must be positive (but got %s and %s)" % (batch_size, max_simulation))
+    win_count, nb_simulation = 0, 0
+    while nb_simulation < max_simulation:
+        nb_batch = min(batch_size, max_simulation - nb_simulation)
+        win_count += _vectorized_montecarlo_win_count(nb_batch, nb_player, hole_card, community_card, rng)
+        nb_simulation += nb_batch
+        win_rate, stderr = _win_rate_with_stderr(win_count, nb_simulation)
+        if should_stop(win_rate, stderr): break
+    return win_rate, stderr, nb_simulation
+
+def _win_rate_with_stderr(win_count, nb_simulation):
+    # the stderr uses add-one smoothing so that 0 or nb_simulation wins
+    # do not report a zero error after a single batch
+    smoothed = (win_count + 1.0) / (nb_simulation + 2.0)
+    return 1.0 * win_count / nb_simulation, sqrt(smoothed * (1 - smoothed) / nb_simulation)
+
+def _preflop_hand_class(hole_card):
+    high, low = sorted(hole_card, key=lambda card: card.rank, reverse=True)
+    hand_class = Card.RANK_MAP[high.rank] + Card.RANK_MAP[low.rank]
+    if high.rank == low.rank:
+        return hand_class
+    return hand_class + ("s" if high.suit == low.suit else "o")
+
+def _exact_enumeration_size(hole_card, community_card):
+    need_num = 5 - len(community_card)
+    unused_num = 52 - len(hole_card) - len(community_card)
+    return comb(unused_num, need_num) + comb(unused_num, need_num + 2)
+
 def _fill_community_card(base_cards, used_card):
     need_num = 5 - len(base_cards)
     return base_cards + _pick_unused_card(need_num, used_card)
 
 def _pick_unused_card(card_num, used_card):
-    used = [card.to_id() for card in used_card]
+    used = set([card.to_id() for card in used_card])
     unused = [card_id for card_id in range(1, 53) if card_id not in used]
     choiced = random.sample(unused, card_num)
     return [Card.from_id(card_id) for card_id in choiced]
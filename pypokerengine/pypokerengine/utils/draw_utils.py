@@ -0,0 +1,132 @@
+"""Exact draw odds on the flop and the turn.
+
+Only the hand category matters, and it only depends on the rank and suit
+counts of the seven cards. Every remaining turn and river card is
+enumerated and the categories of all runouts are computed from those
+counts in a few numpy passes, without scoring the hands.
+"""
+from itertools import product
+
+import numpy as np
+
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+
+# hand category names from the weakest (HIGHCARD) to the strongest (STRAIGHTFLASH)
+CATEGORIES = [HandEvaluator.HAND_STRENGTH_MAP[flg] for flg in sorted(HandEvaluator.HAND_STRENGTH_MAP)]
+(_HIGHCARD, _ONEPAIR, _TWOPAIR, _THREECARD, _STRAIGHT,
+        _FLASH, _FULLHOUSE, _FOURCARD, _STRAIGHTFLASH) = range(len(CATEGORIES))
+
+# rank (0 for 2, ..., 12 for A) and suit (0 to 3) of each card id
+_RANK_BY_ID = np.array([0] + [Card.from_id(cid).rank - 2 for cid in range(1, 53)], dtype=np.int64)
+_SUIT_BY_ID = np.array([0] + [[2, 4, 8, 16].index(Card.from_id(cid).suit) for cid in range(1, 53)], dtype=np.int64)
+
+def _gen_straight_table():
+    """Whether a 13 bit rank mask (bit 0 is rank 2, bit 12 is A) contains a straight"""
+    masks = np.arange(1 << 13)
+    windows = [0b11111 << low for low in range(9)] + [1 << 12 | 0b1111]
+    return np.any([masks & window == window for window in windows], axis=0)
+
+_HAS_STRAIGHT = _gen_straight_table()
+_RANK_BITS = 1 << np.arange(13)
+
+# every ordered rank pattern of 0, 1 and 2 runout cards in one table: rank
+# counts of the patterns (one row each) and the first row of each length
+_RANK_PATTERNS = [np.array(list(product(range(13), repeat=n)), dtype=np.int64).reshape(13 ** n, n) for n in range(3)]
+_RANK_PATTERN_COUNTS = np.vstack([(patterns[:, :, None] == np.arange(13)).sum(axis=1) for patterns in _RANK_PATTERNS])
+_PATTERN_OFFSETS = [0, 1, 14]
+_PATTERN_WEIGHTS = [13 ** np.arange(n - 1, -1, -1) for n in range(3)]
+
+def _gen_category_by_signature():
+    """Category without straights and flushes of c2 + 4 * c3 + 12 * c4, where cN is
+    the number of ranks held at least N times (7 cards: c2 <= 3, c3 <= 2, c4 <= 1)"""
+    table = [_HIGHCARD] * 24
+    for c2, c3, c4 in product(range(4), range(3), range(2)):
+        if c4: category = _FOURCARD
+        elif c3 and c2 >= 2: category = _FULLHOUSE
+        elif c3: category = _THREECARD
+        elif c2 >= 2: category = _TWOPAIR
+        else: category = _ONEPAIR if c2 else _HIGHCARD
+        table[c2 + 4 * c3 + 12 * c4] = category
+    return np.array(table, dtype=np.int64)
+
+_CATEGORY_BY_SIGNATURE = _gen_category_by_signature()
+
+def calc_draw_odds(hole_card, community_card):
+    """Exact odds of the hand category reached by the river.
+
+    Returns a dict with
+      "hand"          : category of the current hand
+      "improve"       : probability that the river hand is of a better category
+      "probabilities" : { category : probability that the river hand is of this category }
+      "outs"          : { category : cards which reach this better category as the next card }
+    """
+    if not 3 <= len(community_card) <= 5:
+        raise ValueError(_community_size_err_msg % len(community_card))
+    need_num = 5 - len(community_card)
+    known = np.array([card.to_id() for card in hole_card + community_card], dtype=np.int64)
+    is_unused = np.ones(53, dtype=bool)
+    is_unused[0] = is_unused[known] = False
+    unused = np.flatnonzero(is_unused)
+    rank_categories = _categorize_rank_patterns(known)
+
+    current = _categorize_hands(known, _NO_RUNOUT, rank_categories)[0]
+    next_category = _categorize_hands(known, unused[:, None], rank_categories) if need_num > 0 else None
+    if need_num == 2:
+        river_category = _categorize_hands(known, unused[_pair_indices(len(unused))], rank_categories)
+    else:
+        river_category = next_category if need_num == 1 else np.array([current])
+    counts = np.bincount(river_category, minlength=len(CATEGORIES)) / float(len(river_category))
+
+    outs = {}
+    if need_num > 0:
+        for category in sorted(set(next_category[next_category > current].tolist())):
+            outs[CATEGORIES[category]] = [Card.from_id(cid) for cid in unused[next_category == category]]
+
+    return {
+        "hand": CATEGORIES[current],
+        "improve": float(counts[current + 1:].sum()),
+        "probabilities": { name: float(p) for name, p in zip(CATEGORIES, counts) },
+        "outs": outs
+    }
+
+_NO_RUNOUT = np.zeros((1, 0), dtype=np.int64)
+
+def _pair_indices(size):
+    """Index pairs (i < j) of size cards => (C(size, 2), 2) array"""
+    if size not in _PAIR_INDICES:
+        _PAIR_INDICES[size] = np.stack(np.triu_indices(size, 1), axis=1)
+    return _PAIR_INDICES[size]
+
+_PAIR_INDICES = {}
+
+def _categorize_rank_patterns(known_ids):
+    """Category without flushes of known_ids + each rank pattern of _RANK_PATTERN_COUNTS"""
+    rank_counts = np.bincount(_RANK_BY_ID[known_ids], minlength=13) + _RANK_PATTERN_COUNTS
+    signature = (rank_counts >= 2).sum(axis=1) + 4 * (rank_counts >= 3).sum(axis=1) + 12 * (rank_counts >= 4).sum(axis=1)
+    straight = _HAS_STRAIGHT[(rank_counts > 0) @ _RANK_BITS]
+    # a straight beats three of a kind and loses to a full house
+    return np.maximum(_CATEGORY_BY_SIGNATURE[signature], straight * _STRAIGHT)
+
+def _categorize_hands(known_ids, runouts, rank_categories):
+    """Index in CATEGORIES of the hand known_ids + each row of runouts"""
+    need_num = runouts.shape[1]
+    runout_ranks = _RANK_BY_ID[runouts]
+    category = rank_categories[_PATTERN_OFFSETS[need_num] + runout_ranks @ _PATTERN_WEIGHTS[need_num]]
+
+    # only a suit with at least 5 - need_num known cards can make a flush, and there is at most one
+    known_suits = _SUIT_BY_ID[known_ids]
+    suit_counts = np.bincount(known_suits, minlength=4)
+    flush_suit = int(suit_counts.argmax())
+    if suit_counts[flush_suit] + need_num < 5:
+        return category
+    in_suit = _SUIT_BY_ID[runouts] == flush_suit
+    flush = suit_counts[flush_suit] + in_suit.sum(axis=1) >= 5
+    # cards of one suit have distinct ranks, so the sum of their bits is their rank mask
+    flush_mask = _RANK_BITS[_RANK_BY_ID[known_ids[known_suits == flush_suit]]].sum() + \
+            np.where(in_suit, _RANK_BITS[runout_ranks], 0).sum(axis=1)
+    # a flush and a full house (or four of a kind) need more than 7 cards
+    category = np.where(flush, _FLASH, category)
+    return np.where(flush & _HAS_STRAIGHT[flush_mask], _STRAIGHTFLASH, category)
+
+_community_size_err_msg = "community_card must have 3 to 5 cards but got %d"
@@ -6,6 +6,7 @@ from pypokerengine.engine.card import Card
 from pypokerengine.engine.deck import Deck
 from pypokerengine.engine.player import Player
 from pypokerengine.engine.pay_info import PayInfo
+from pypokerengine.engine.action_history import ActionHistory
 from pypokerengine.engine.data_encoder import DataEncoder
 from pypokerengine.engine.poker_constants import PokerConstants as Const
 
@@ -81,11 +82,8 @@ def _restore_community_card_on_table(table, card_data):
         table.add_community_card(Card.from_str(str_card))
 
 def _restore_deck(str_exclude_cards):
-    deck = Deck()
-    exclude_ids = [Card.to_id(Card.from_str(s)) for s in str_exclude_cards]
-    deck_cards = [Card.from_id(cid) for cid in range(1, 53) if cid not in exclude_ids]
-    deck.deck = deck_cards
-    return deck
+    exclude_ids = set([Card.to_id(Card.from_str(s)) for s in str_exclude_cards])
+    return Deck([cid for cid in range(1, 53) if cid not in exclude_ids])
 
 def _restore_seats(seats_info, action_histories):
     players = [Player(info["uuid"], info["stack"], info["name"]) for info in seats_info]
@@ -108,12 +106,12 @@ def _restore_action_histories_on_players(players, round_action_histories):
         for player in players: player.round_action_histories[street_flg] = []
         for action_history in action_histories:
             player = _find_user_by_uuid(players, action_history["uuid"])
-            player.round_action_histories[street_flg].append(action_history)
+            player.round_action_histories[street_flg].append(ActionHistory.from_dict(action_history))
 
     # resotre action_histories
     for action_history in round_action_histories[current_street_name]:
         player = _find_user_by_uuid(players, action_history["uuid"])
-        player.action_histories.append(action_history)
+        player.action_histories.append(ActionHistory.from_dict(action_history))
 
 def _restore_pay_info_on_players(players, players_state, round_action_histories):
     _restore_pay_info_status_on_players(players, players_state)
@@ -0,0 +1,110 @@
+"""Hand strength (HS), hand potential (PPot / NPot) and effective hand strength (EHS).
+
+These are the measures of Billings et al. for the flop and the turn. Every
+opponent holding is classified as ahead, tied or behind now and again after
+the remaining board cards are dealt (two card lookahead on the flop).
+
+The lookahead is enumerated exactly by default. An opponent's final hand
+only depends on the set of their hole cards and the runout, so each distinct
+set is evaluated once and shared by all the ways to split it, as in
+card_utils.exact_hole_card_win_rate. With nb_simulation, that many
+(opponent holding, runout) pairs are sampled instead.
+"""
+from itertools import combinations
+
+import numpy as np
+
+from pypokerengine.engine.hand_evaluator import HandEvaluator, BoardEvaluator
+from pypokerengine.utils.sampling_utils import combination_array, encode_card_ids, draw_unused_card_ids, to_np_rng
+
+AHEAD, TIED, BEHIND = 0, 1, 2
+
+def calc_hand_strength(hole_card, community_card, nb_player=2, nb_simulation=None, rng=None):
+    """Return { "hs", "ppot", "npot", "ehs" } of hole_card on a flop or turn community_card.
+
+    hs is the probability of being ahead of one random holding (ties count
+    half), raised to the number of opponents. ehs = hs * (1 - npot) + (1 - hs) * ppot.
+    """
+    if len(community_card) not in [3, 4]:
+        raise ValueError(_community_size_err_msg % len(community_card))
+    need_num = 5 - len(community_card)
+    hole_ids = [card.to_id() for card in hole_card]
+    community_ids = [card.to_id() for card in community_card]
+    unused = np.setdiff1d(np.arange(1, 53), hole_ids + community_ids)
+
+    board = BoardEvaluator(community_card)
+    my_now = board.eval_hole(hole_card)
+    holdings = combination_array(unused, 2)
+    now_state = _compare(my_now, board.eval_card_ids_batch(holdings))
+    now_count = np.bincount(now_state, minlength=3)
+
+    if nb_simulation is None:
+        transition = _enumerate_transition(hole_card, community_card, unused, holdings, now_state, need_num)
+    else:
+        transition = _sample_transition(hole_ids, community_ids, board, my_now, need_num, nb_simulation, to_np_rng(rng))
+
+    hs = (now_count[AHEAD] + now_count[TIED] / 2.0) / now_count.sum()
+    hs = hs ** (nb_player - 1)
+    ppot, npot = _hand_potential(transition)
+    return {
+        "hs": float(hs),
+        "ppot": ppot,
+        "npot": npot,
+        "ehs": float(hs * (1 - npot) + (1 - hs) * ppot)
+    }
+
+def _enumerate_transition(hole_card, community_card, unused, holdings, now_state, need_num):
+    """3 x 3 counts of (state now, state at the river) over every holding and runout"""
+    community_ids = [card.to_id() for card in community_card]
+    holding_index = np.zeros(53 ** 2, dtype=np.int64)
+    holding_index[encode_card_ids(holdings)] = np.arange(len(holdings))
+
+    runouts = combination_array(unused, need_num)
+    my_final = _eval_my_runouts(hole_card, community_card, runouts)
+    runout_index = np.zeros(53 ** need_num, dtype=np.int64)
+    runout_index[encode_card_ids(runouts)] = np.arange(len(runouts))
+
+    extra_cards = combination_array(unused, need_num + 2)
+    extra_hands = np.hstack([np.tile(np.array(community_ids, dtype=np.int64), (len(extra_cards), 1)), extra_cards])
+    opponent_final = HandEvaluator.eval_hand_batch(extra_hands)
+
+    transition = np.zeros(9, dtype=np.int64)
+    for hole_cols in combinations(range(need_num + 2), 2):
+        runout_cols = [col for col in range(need_num + 2) if col not in hole_cols]
+        holding = holding_index[encode_card_ids(extra_cards[:, list(hole_cols)])]
+        runout = runout_index[encode_card_ids(extra_cards[:, runout_cols])]
+        final_state = _compare(my_final[runout], opponent_final)
+        transition += np.bincount(now_state[holding] * 3 + final_state, minlength=9)
+    return transition.reshape(3, 3)
+
+def _sample_transition(hole_ids, community_ids, board, my_now, need_num, nb_simulation, rng):
+    drawn = draw_unused_card_ids(rng, nb_simulation, 2 + need_num, hole_ids + community_ids)
+    community = np.tile(np.array(community_ids, dtype=np.int64), (nb_simulation, 1))
+    my_final = HandEvaluator.eval_hand_batch(
+            np.hstack([np.tile(np.array(hole_ids, dtype=np.int64), (nb_simulation, 1)), community, drawn[:, 2:]]))
+    opponent_final = HandEvaluator.eval_hand_batch(np.hstack([community, drawn]))
+    now_state = _compare(my_now, board.eval_card_ids_batch(drawn[:, :2]))
+    final_state = _compare(my_final, opponent_final)
+    return np.bincount(now_state * 3 + final_state, minlength=9).reshape(3, 3)
+
+def _eval_my_runouts(hole_card, community_card, runouts):
+    if runouts.shape[1] == 2:
+        return BoardEvaluator(hole_card + community_card).eval_card_ids_batch(runouts)
+    known = np.array([card.to_id() for card in hole_card + community_card], dtype=np.int64)
+    return HandEvaluator.eval_hand_batch(np.hstack([np.tile(known, (len(runouts), 1)), runouts]))
+
+def _hand_potential(transition):
+    total = transition.sum(axis=1)
+    ppot_base = total[BEHIND] + total[TIED] / 2.0
+    npot_base = total[AHEAD] + total[TIED] / 2.0
+    ppot = (transition[BEHIND][AHEAD] + transition[BEHIND][TIED] / 2.0 + transition[TIED][AHEAD] / 2.0) / ppot_base \
+            if ppot_base else 0.0
+    npot = (transition[AHEAD][BEHIND] + transition[TIED][BEHIND] / 2.0 + transition[AHEAD][TIED] / 2.0) / npot_base \
+            if npot_base else 0.0
+    return float(ppot), float(npot)
+
+def _compare(my_score, opponent_score):
+    """AHEAD, TIED or BEHIND of my_score against each opponent score"""
+    return np.where(my_score > opponent_score, AHEAD, np.where(my_score == opponent_score, TIED, BEHIND))
+
+_community_size_err_msg = "community_card must have 3 (flop) or 4 (turn) cards but got %d"
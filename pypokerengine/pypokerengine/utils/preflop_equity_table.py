@@ -0,0 +1,174 @@
+"""Generated by scripts/gen_preflop_equity_table.py (nb_simulation=100000, seed=2026). Do not edit."""
+
+# hand class => win rate against 1, 2, ..., 9 random opponents
+PREFLOP_EQUITY = {
+    "AA": (0.8546, 0.7345, 0.6383, 0.5584, 0.4917, 0.4351, 0.3865, 0.3470, 0.3108),
+    "AKs": (0.6795, 0.5194, 0.4257, 0.3635, 0.3188, 0.2858, 0.2581, 0.2354, 0.2158),
+    "AKo": (0.6598, 0.4917, 0.3969, 0.3345, 0.2900, 0.2548, 0.2262, 0.2021, 0.1816),
+    "AQs": (0.6718, 0.5053, 0.4118, 0.3499, 0.3054, 0.2723, 0.2456, 0.2227, 0.2049),
+    "AQo": (0.6521, 0.4815, 0.3837, 0.3200, 0.2749, 0.2394, 0.2117, 0.1887, 0.1694),
+    "AJs": (0.6632, 0.4934, 0.3978, 0.3352, 0.2910, 0.2574, 0.2319, 0.2111, 0.1935),
+    "AJo": (0.6469, 0.4696, 0.3702, 0.3054, 0.2606, 0.2262, 0.1988, 0.1772, 0.1586),
+    "ATs": (0.6583, 0.4848, 0.3878, 0.3263, 0.2825, 0.2512, 0.2259, 0.2058, 0.1886),
+    "ATo": (0.6378, 0.4570, 0.3548, 0.2906, 0.2470, 0.2135, 0.1876, 0.1671, 0.1499),
+    "A9s": (0.6397, 0.4588, 0.3584, 0.2957, 0.2526, 0.2231, 0.1994, 0.1802, 0.1647),
+    "A9o": (0.6221, 0.4358, 0.3315, 0.2651, 0.2197, 0.1881, 0.1642, 0.1447, 0.1287),
+    "A8s": (0.6366, 0.4553, 0.3551, 0.2929, 0.2505, 0.2198, 0.1961, 0.1783, 0.1630),
+    "A8o": (0.6123, 0.4213, 0.3176, 0.2544, 0.2100, 0.1778, 0.1538, 0.1352, 0.1207),
+    "A7s": (0.6259, 0.4433, 0.3427, 0.2824, 0.2420, 0.2137, 0.1915, 0.1744, 0.1596),
+    "A7o": (0.6046, 0.4126, 0.3096, 0.2464, 0.2042, 0.1736, 0.1501, 0.1325, 0.1175),
+    "A6s": (0.6179, 0.4329, 0.3339, 0.2761, 0.2369, 0.2084, 0.1878, 0.1708, 0.1571),
+    "A6o": (0.5943, 0.4011, 0.2967, 0.2354, 0.1939, 0.1660, 0.1444, 0.1276, 0.1141),
+    "A5s": (0.6176, 0.4368, 0.3385, 0.2807, 0.2414, 0.2140, 0.1927, 0.1767, 0.1626),
+    "A5o": (0.5940, 0.4044, 0.3034, 0.2424, 0.2023, 0.1735, 0.1517, 0.1350, 0.1203),
+    "A4s": (0.6094, 0.4275, 0.3310, 0.2746, 0.2375, 0.2103, 0.1895, 0.1723, 0.1587),
+    "A4o": (0.5835, 0.3925, 0.2915, 0.2323, 0.1935, 0.1661, 0.1451, 0.1280, 0.1148),
+    "A3s": (0.6015, 0.4191, 0.3254, 0.2687, 0.2318, 0.2061, 0.1864, 0.1704, 0.1576),
+    "A3o": (0.5743, 0.3815, 0.2821, 0.2255, 0.1878, 0.1618, 0.1414, 0.1253, 0.1122),
+    "A2s": (0.5900, 0.4044, 0.3097, 0.2561, 0.2211, 0.1956, 0.1758, 0.1601, 0.1474),
+    "A2o": (0.5703, 0.3742, 0.2747, 0.2179, 0.1820, 0.1560, 0.1359, 0.1199, 0.1064),
+    "KK": (0.8289, 0.6945, 0.5879, 0.5010, 0.4328, 0.3773, 0.3336, 0.2969, 0.2656),
+    "KQs": (0.6451, 0.4854, 0.3975, 0.3408, 0.2988, 0.2671, 0.2411, 0.2193, 0.2008),
+    "KQo": (0.6236, 0.4555, 0.3639, 0.3052, 0.2629, 0.2288, 0.2030, 0.1810, 0.1628),
+    "KJs": (0.6374, 0.4723, 0.3818, 0.3226, 0.2810, 0.2497, 0.2249, 0.2049, 0.1876),
+    "KJo": (0.6172, 0.4451, 0.3513, 0.2919, 0.2484, 0.2157, 0.1896, 0.1680, 0.1509),
+    "KTs": (0.6281, 0.4602, 0.3687, 0.3120, 0.2717, 0.2417, 0.2179, 0.1984, 0.1830),
+    "KTo": (0.6081, 0.4335, 0.3388, 0.2786, 0.2371, 0.2061, 0.1813, 0.1616, 0.1452),
+    "K9s": (0.6133, 0.4388, 0.3453, 0.2860, 0.2462, 0.2167, 0.1942, 0.1760, 0.1619),
+    "K9o": (0.5940, 0.4097, 0.3130, 0.2530, 0.2109, 0.1801, 0.1568, 0.1375, 0.1222),
+    "K8s": (0.5981, 0.4191, 0.3250, 0.2688, 0.2306, 0.2029, 0.1818, 0.1657, 0.1517),
+    "K8o": (0.5767, 0.3900, 0.2903, 0.2308, 0.1908, 0.1620, 0.1402, 0.1237, 0.1098),
+    "K7s": (0.5944, 0.4120, 0.3185, 0.2611, 0.2234, 0.1963, 0.1751, 0.1589, 0.1464),
+    "K7o": (0.5712, 0.3816, 0.2843, 0.2251, 0.1853, 0.1567, 0.1356, 0.1188, 0.1058),
+    "K6s": (0.5833, 0.4017, 0.3099, 0.2557, 0.2192, 0.1929, 0.1725, 0.1568, 0.1438),
+    "K6o": (0.5644, 0.3726, 0.2752, 0.2188, 0.1797, 0.1517, 0.1312, 0.1160, 0.1036),
+    "K5s": (0.5767, 0.3962, 0.3031, 0.2489, 0.2137, 0.1884, 0.1689, 0.1538, 0.1411),
+    "K5o": (0.5561, 0.3616, 0.2645, 0.2080, 0.1709, 0.1449, 0.1258, 0.1108, 0.0993),
+    "K4s": (0.5693, 0.3865, 0.2962, 0.2420, 0.2080, 0.1832, 0.1645, 0.1500, 0.1385),
+    "K4o": (0.5451, 0.3523, 0.2563, 0.2011, 0.1655, 0.1400, 0.1215, 0.1070, 0.0950),
+    "K3s": (0.5596, 0.3773, 0.2881, 0.2379, 0.2037, 0.1803, 0.1627, 0.1484, 0.1370),
+    "K3o": (0.5360, 0.3426, 0.2477, 0.1937, 0.1589, 0.1342, 0.1164, 0.1025, 0.0915),
+    "K2s": (0.5511, 0.3696, 0.2810, 0.2296, 0.1977, 0.1744, 0.1577, 0.1433, 0.1326),
+    "K2o": (0.5265, 0.3350, 0.2409, 0.1883, 0.1548, 0.1313, 0.1144, 0.1009, 0.0900),
+    "QQ": (0.8012, 0.6523, 0.5380, 0.4510, 0.3818, 0.3286, 0.2863, 0.2532, 0.2266),
+    "QJs": (0.6122, 0.4542, 0.3681, 0.3131, 0.2743, 0.2436, 0.2197, 0.1994, 0.1834),
+    "QJo": (0.5926, 0.4264, 0.3392, 0.2827, 0.2417, 0.2102, 0.1862, 0.1661, 0.1504),
+    "QTs": (0.6069, 0.4458, 0.3609, 0.3065, 0.2671, 0.2364, 0.2132, 0.1949, 0.1800),
+    "QTo": (0.5873, 0.4183, 0.3282, 0.2704, 0.2294, 0.1986, 0.1759, 0.1575, 0.1429),
+    "Q9s": (0.5929, 0.4239, 0.3349, 0.2792, 0.2401, 0.2114, 0.1893, 0.1718, 0.1578),
+    "Q9o": (0.5668, 0.3886, 0.2971, 0.2405, 0.2017, 0.1721, 0.1501, 0.1325, 0.1188),
+    "Q8s": (0.5735, 0.4022, 0.3140, 0.2595, 0.2209, 0.1945, 0.1737, 0.1579, 0.1454),
+    "Q8o": (0.5526, 0.3713, 0.2794, 0.2235, 0.1855, 0.1582, 0.1374, 0.1206, 0.1077),
+    "Q7s": (0.5656, 0.3869, 0.2971, 0.2440, 0.2079, 0.1830, 0.1640, 0.1500, 0.1376),
+    "Q7o": (0.5361, 0.3497, 0.2560, 0.2009, 0.1652, 0.1396, 0.1202, 0.1053, 0.0937),
+    "Q6s": (0.5547, 0.3774, 0.2889, 0.2366, 0.2022, 0.1773, 0.1588, 0.1443, 0.1330),
+    "Q6o": (0.5295, 0.3429, 0.2505, 0.1960, 0.1601, 0.1350, 0.1162, 0.1025, 0.0915),
+    "Q5s": (0.5463, 0.3683, 0.2815, 0.2301, 0.1966, 0.1724, 0.1545, 0.1411, 0.1300),
+    "Q5o": (0.5223, 0.3347, 0.2434, 0.1909, 0.1562, 0.1311, 0.1130, 0.0988, 0.0880),
+    "Q4s": (0.5396, 0.3609, 0.2742, 0.2246, 0.1919, 0.1691, 0.1517, 0.1380, 0.1274),
+    "Q4o": (0.5132, 0.3249, 0.2343, 0.1826, 0.1497, 0.1274, 0.1096, 0.0961, 0.0858),
+    "Q3s": (0.5292, 0.3507, 0.2652, 0.2168, 0.1847, 0.1623, 0.1461, 0.1335, 0.1232),
+    "Q3o": (0.5062, 0.3182, 0.2287, 0.1775, 0.1454, 0.1233, 0.1067, 0.0935, 0.0840),
+    "Q2s": (0.5225, 0.3447, 0.2591, 0.2118, 0.1814, 0.1598, 0.1430, 0.1304, 0.1197),
+    "Q2o": (0.4961, 0.3065, 0.2191, 0.1708, 0.1403, 0.1186, 0.1031, 0.0906, 0.0809),
+    "JJ": (0.7766, 0.6138, 0.4947, 0.4058, 0.3392, 0.2892, 0.2516, 0.2220, 0.1989),
+    "JTs": (0.5904, 0.4366, 0.3548, 0.3024, 0.2643, 0.2353, 0.2128, 0.1945, 0.1804),
+    "JTo": (0.5640, 0.4033, 0.3209, 0.2668, 0.2283, 0.1989, 0.1758, 0.1584, 0.1442),
+    "J9s": (0.5719, 0.4108, 0.3275, 0.2753, 0.2389, 0.2106, 0.1897, 0.1731, 0.1599),
+    "J9o": (0.5482, 0.3807, 0.2941, 0.2392, 0.2003, 0.1729, 0.1515, 0.1355, 0.1228),
+    "J8s": (0.5570, 0.3897, 0.3069, 0.2559, 0.2194, 0.1930, 0.1732, 0.1585, 0.1463),
+    "J8o": (0.5319, 0.3592, 0.2732, 0.2183, 0.1833, 0.1569, 0.1376, 0.1211, 0.1094),
+    "J7s": (0.5425, 0.3746, 0.2918, 0.2416, 0.2072, 0.1824, 0.1634, 0.1487, 0.1366),
+    "J7o": (0.5161, 0.3379, 0.2516, 0.2000, 0.1651, 0.1410, 0.1216, 0.1080, 0.0971),
+    "J6s": (0.5282, 0.3541, 0.2715, 0.2230, 0.1906, 0.1670, 0.1500, 0.1372, 0.1265),
+    "J6o": (0.4949, 0.3137, 0.2283, 0.1796, 0.1478, 0.1249, 0.1083, 0.0955, 0.0858),
+    "J5s": (0.5222, 0.3498, 0.2658, 0.2183, 0.1853, 0.1626, 0.1465, 0.1335, 0.1231),
+    "J5o": (0.4956, 0.3120, 0.2260, 0.1776, 0.1451, 0.1230, 0.1071, 0.0946, 0.0842),
+    "J4s": (0.5122, 0.3381, 0.2567, 0.2099, 0.1795, 0.1585, 0.1427, 0.1301, 0.1196),
+    "J4o": (0.4846, 0.3051, 0.2194, 0.1700, 0.1397, 0.1180, 0.1019, 0.0900, 0.0806),
+    "J3s": (0.5062, 0.3324, 0.2505, 0.2057, 0.1761, 0.1563, 0.1401, 0.1280, 0.1178),
+    "J3o": (0.4757, 0.2932, 0.2103, 0.1637, 0.1338, 0.1127, 0.0975, 0.0858, 0.0768),
+    "J2s": (0.4940, 0.3207, 0.2443, 0.1997, 0.1713, 0.1512, 0.1363, 0.1245, 0.1155),
+    "J2o": (0.4667, 0.2853, 0.2033, 0.1580, 0.1301, 0.1105, 0.0959, 0.0851, 0.0764),
+    "TT": (0.7530, 0.5781, 0.4563, 0.3680, 0.3049, 0.2576, 0.2231, 0.1972, 0.1776),
+    "T9s": (0.5566, 0.4052, 0.3273, 0.2764, 0.2396, 0.2127, 0.1915, 0.1757, 0.1632),
+    "T9o": (0.5353, 0.3759, 0.2948, 0.2434, 0.2071, 0.1801, 0.1588, 0.1427, 0.1303),
+    "T8s": (0.5402, 0.3847, 0.3061, 0.2572, 0.2225, 0.1974, 0.1779, 0.1634, 0.1519),
+    "T8o": (0.5153, 0.3520, 0.2693, 0.2190, 0.1834, 0.1580, 0.1381, 0.1239, 0.1129),
+    "T7s": (0.5249, 0.3640, 0.2853, 0.2370, 0.2050, 0.1815, 0.1632, 0.1499, 0.1388),
+    "T7o": (0.4990, 0.3302, 0.2501, 0.1997, 0.1655, 0.1409, 0.1237, 0.1109, 0.1009),
+    "T6s": (0.5114, 0.3485, 0.2704, 0.2231, 0.1915, 0.1683, 0.1518, 0.1394, 0.1288),
+    "T6o": (0.4844, 0.3128, 0.2321, 0.1842, 0.1520, 0.1290, 0.1128, 0.1006, 0.0911),
+    "T5s": (0.4955, 0.3299, 0.2522, 0.2065, 0.1775, 0.1568, 0.1411, 0.1296, 0.1203),
+    "T5o": (0.4658, 0.2924, 0.2111, 0.1652, 0.1363, 0.1154, 0.0997, 0.0888, 0.0799),
+    "T4s": (0.4878, 0.3221, 0.2452, 0.1994, 0.1708, 0.1509, 0.1357, 0.1245, 0.1157),
+    "T4o": (0.4610, 0.2855, 0.2052, 0.1599, 0.1318, 0.1112, 0.0965, 0.0854, 0.0766),
+    "T3s": (0.4787, 0.3126, 0.2363, 0.1932, 0.1660, 0.1460, 0.1317, 0.1207, 0.1117),
+    "T3o": (0.4494, 0.2747, 0.1969, 0.1529, 0.1259, 0.1069, 0.0933, 0.0824, 0.0743),
+    "T2s": (0.4712, 0.3059, 0.2309, 0.1894, 0.1631, 0.1439, 0.1301, 0.1193, 0.1102),
+    "T2o": (0.4405, 0.2662, 0.1896, 0.1475, 0.1209, 0.1027, 0.0890, 0.0797, 0.0717),
+    "99": (0.7251, 0.5414, 0.4168, 0.3308, 0.2705, 0.2281, 0.1986, 0.1767, 0.1608),
+    "98s": (0.5289, 0.3791, 0.3009, 0.2520, 0.2182, 0.1933, 0.1745, 0.1599, 0.1482),
+    "98o": (0.4996, 0.3439, 0.2654, 0.2155, 0.1794, 0.1545, 0.1357, 0.1216, 0.1109),
+    "97s": (0.5158, 0.3628, 0.2851, 0.2368, 0.2049, 0.1810, 0.1637, 0.1498, 0.1384),
+    "97o": (0.4862, 0.3263, 0.2469, 0.1980, 0.1641, 0.1405, 0.1240, 0.1109, 0.1015),
+    "96s": (0.4982, 0.3437, 0.2692, 0.2220, 0.1907, 0.1688, 0.1524, 0.1397, 0.1298),
+    "96o": (0.4668, 0.3048, 0.2276, 0.1809, 0.1492, 0.1273, 0.1117, 0.1001, 0.0908),
+    "95s": (0.4792, 0.3209, 0.2452, 0.2007, 0.1716, 0.1513, 0.1355, 0.1242, 0.1148),
+    "95o": (0.4531, 0.2855, 0.2084, 0.1638, 0.1345, 0.1138, 0.0992, 0.0881, 0.0799),
+    "94s": (0.4629, 0.3023, 0.2297, 0.1875, 0.1598, 0.1412, 0.1270, 0.1159, 0.1071),
+    "94o": (0.4322, 0.2659, 0.1913, 0.1490, 0.1206, 0.1019, 0.0878, 0.0771, 0.0698),
+    "93s": (0.4552, 0.2980, 0.2270, 0.1851, 0.1571, 0.1381, 0.1243, 0.1139, 0.1052),
+    "93o": (0.4256, 0.2610, 0.1857, 0.1431, 0.1164, 0.0975, 0.0847, 0.0747, 0.0667),
+    "92s": (0.4474, 0.2898, 0.2185, 0.1775, 0.1514, 0.1336, 0.1197, 0.1093, 0.1008),
+    "92o": (0.4147, 0.2500, 0.1776, 0.1376, 0.1114, 0.0939, 0.0807, 0.0709, 0.0632),
+    "88": (0.6950, 0.5056, 0.3810, 0.2993, 0.2453, 0.2082, 0.1823, 0.1635, 0.1498),
+    "87s": (0.5023, 0.3561, 0.2816, 0.2357, 0.2037, 0.1813, 0.1645, 0.1512, 0.1411),
+    "87o": (0.4732, 0.3230, 0.2482, 0.2004, 0.1684, 0.1457, 0.1291, 0.1163, 0.1067),
+    "86s": (0.4892, 0.3396, 0.2684, 0.2238, 0.1932, 0.1710, 0.1556, 0.1428, 0.1331),
+    "86o": (0.4575, 0.3045, 0.2294, 0.1836, 0.1542, 0.1330, 0.1172, 0.1063, 0.0974),
+    "85s": (0.4701, 0.3217, 0.2491, 0.2059, 0.1777, 0.1578, 0.1427, 0.1311, 0.1220),
+    "85o": (0.4396, 0.2831, 0.2098, 0.1663, 0.1383, 0.1189, 0.1044, 0.0935, 0.0857),
+    "84s": (0.4531, 0.3028, 0.2327, 0.1898, 0.1633, 0.1445, 0.1308, 0.1199, 0.1113),
+    "84o": (0.4229, 0.2655, 0.1927, 0.1496, 0.1218, 0.1028, 0.0895, 0.0794, 0.0718),
+    "83s": (0.4366, 0.2834, 0.2153, 0.1755, 0.1494, 0.1320, 0.1193, 0.1096, 0.1017),
+    "83o": (0.4027, 0.2433, 0.1730, 0.1332, 0.1086, 0.0915, 0.0796, 0.0707, 0.0636),
+    "82s": (0.4265, 0.2769, 0.2100, 0.1713, 0.1458, 0.1279, 0.1153, 0.1058, 0.0980),
+    "82o": (0.3950, 0.2364, 0.1677, 0.1289, 0.1045, 0.0877, 0.0757, 0.0672, 0.0602),
+    "77": (0.6690, 0.4726, 0.3509, 0.2747, 0.2258, 0.1921, 0.1689, 0.1526, 0.1411),
+    "76s": (0.4793, 0.3378, 0.2671, 0.2234, 0.1933, 0.1714, 0.1559, 0.1437, 0.1349),
+    "76o": (0.4487, 0.3026, 0.2303, 0.1863, 0.1560, 0.1358, 0.1205, 0.1095, 0.1008),
+    "75s": (0.4639, 0.3199, 0.2504, 0.2079, 0.1799, 0.1592, 0.1450, 0.1338, 0.1252),
+    "75o": (0.4353, 0.2857, 0.2133, 0.1699, 0.1428, 0.1229, 0.1096, 0.0997, 0.0921),
+    "74s": (0.4453, 0.2998, 0.2315, 0.1928, 0.1661, 0.1479, 0.1341, 0.1237, 0.1153),
+    "74o": (0.4150, 0.2657, 0.1948, 0.1532, 0.1273, 0.1095, 0.0965, 0.0874, 0.0798),
+    "73s": (0.4279, 0.2836, 0.2171, 0.1780, 0.1529, 0.1356, 0.1223, 0.1123, 0.1040),
+    "73o": (0.3954, 0.2436, 0.1767, 0.1375, 0.1124, 0.0954, 0.0840, 0.0754, 0.0681),
+    "72s": (0.4071, 0.2628, 0.1974, 0.1599, 0.1369, 0.1208, 0.1096, 0.1009, 0.0938),
+    "72o": (0.3759, 0.2239, 0.1594, 0.1226, 0.0997, 0.0847, 0.0738, 0.0655, 0.0594),
+    "66": (0.6391, 0.4397, 0.3234, 0.2509, 0.2057, 0.1768, 0.1570, 0.1439, 0.1339),
+    "65s": (0.4575, 0.3193, 0.2530, 0.2118, 0.1848, 0.1659, 0.1511, 0.1404, 0.1312),
+    "65o": (0.4274, 0.2862, 0.2152, 0.1726, 0.1453, 0.1273, 0.1142, 0.1040, 0.0963),
+    "64s": (0.4411, 0.3037, 0.2363, 0.1968, 0.1707, 0.1526, 0.1396, 0.1291, 0.1203),
+    "64o": (0.4097, 0.2659, 0.1978, 0.1577, 0.1328, 0.1157, 0.1036, 0.0945, 0.0873),
+    "63s": (0.4218, 0.2828, 0.2188, 0.1806, 0.1568, 0.1408, 0.1283, 0.1190, 0.1108),
+    "63o": (0.3908, 0.2482, 0.1817, 0.1423, 0.1187, 0.1019, 0.0905, 0.0816, 0.0746),
+    "62s": (0.4021, 0.2624, 0.2001, 0.1646, 0.1421, 0.1262, 0.1142, 0.1054, 0.0980),
+    "62o": (0.3715, 0.2279, 0.1624, 0.1256, 0.1025, 0.0872, 0.0766, 0.0689, 0.0629),
+    "55": (0.6094, 0.4061, 0.2941, 0.2313, 0.1922, 0.1670, 0.1503, 0.1387, 0.1303),
+    "54s": (0.4443, 0.3099, 0.2435, 0.2037, 0.1784, 0.1619, 0.1485, 0.1379, 0.1292),
+    "54o": (0.4131, 0.2720, 0.2045, 0.1641, 0.1396, 0.1227, 0.1110, 0.1019, 0.0950),
+    "53s": (0.4262, 0.2930, 0.2284, 0.1903, 0.1658, 0.1498, 0.1377, 0.1281, 0.1199),
+    "53o": (0.3932, 0.2546, 0.1878, 0.1491, 0.1252, 0.1097, 0.0985, 0.0901, 0.0835),
+    "52s": (0.4082, 0.2760, 0.2124, 0.1756, 0.1533, 0.1377, 0.1258, 0.1166, 0.1094),
+    "52o": (0.3748, 0.2361, 0.1716, 0.1359, 0.1126, 0.0977, 0.0876, 0.0796, 0.0733),
+    "44": (0.5760, 0.3734, 0.2677, 0.2101, 0.1769, 0.1563, 0.1428, 0.1329, 0.1255),
+    "43s": (0.4172, 0.2859, 0.2207, 0.1828, 0.1588, 0.1433, 0.1312, 0.1217, 0.1137),
+    "43o": (0.3821, 0.2442, 0.1791, 0.1422, 0.1193, 0.1044, 0.0931, 0.0850, 0.0782),
+    "42s": (0.3969, 0.2666, 0.2046, 0.1704, 0.1482, 0.1334, 0.1218, 0.1131, 0.1057),
+    "42o": (0.3622, 0.2248, 0.1626, 0.1283, 0.1074, 0.0936, 0.0839, 0.0758, 0.0696),
+    "33": (0.5434, 0.3424, 0.2449, 0.1944, 0.1659, 0.1487, 0.1368, 0.1281, 0.1214),
+    "32s": (0.3887, 0.2579, 0.1971, 0.1638, 0.1421, 0.1270, 0.1162, 0.1074, 0.1002),
+    "32o": (0.3545, 0.2165, 0.1537, 0.1196, 0.0991, 0.0862, 0.0766, 0.0694, 0.0631),
+    "22": (0.5125, 0.3131, 0.2240, 0.1808, 0.1579, 0.1439, 0.1349, 0.1273, 0.1213),
+}
@@ -0,0 +1,156 @@
+"""Equity against weighted hand ranges.
+
+A range is a dict from a two card combo to its weight, e.g.
+{ ("SA", "HA"): 1.0, ("SA", "SK"): 0.5 }. Cards of a combo may be given as
+strings or Card objects. Combos that share a card with the board (or with the
+other range's combo) are removed and the remaining weights renormalized.
+
+Like estimate_hole_card_win_rate, a tie counts as a win for the first range.
+"""
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.hand_evaluator import HandEvaluator, BoardEvaluator
+from pypokerengine.utils.sampling_utils import to_np_rng
+
+SUITS = "CDHS"
+
+# exact enumeration is used when it needs at most this many evaluations
+RANGE_EXACT_THRESHOLD = 200000
+
+def range_from_hand_classes(hand_classes, weight=1.0):
+    """Range holding every combo of the given starting hand classes, e.g. ["AA", "AKs", "KQo"]"""
+    hand_range = {}
+    for hand_class in hand_classes:
+        for combo in _expand_hand_class(hand_class):
+            hand_range[combo] = weight
+    return hand_range
+
+def hand_vs_range_win_rate(hole_card, opponent_range, community_card=None, nb_simulation=1000,
+        rng=None, exact_threshold=RANGE_EXACT_THRESHOLD):
+    """Probability that hole_card ties or beats one opponent holding a hand of opponent_range"""
+    return range_vs_range_win_rate({ tuple(hole_card): 1.0 }, opponent_range, community_card,
+            nb_simulation, rng, exact_threshold)
+
+def range_vs_range_win_rate(hero_range, opponent_range, community_card=None, nb_simulation=1000,
+        rng=None, exact_threshold=RANGE_EXACT_THRESHOLD):
+    """Probability that a hand of hero_range ties or beats a hand of opponent_range.
+
+    Combos are paired with probability proportional to the product of their
+    weights among pairs that share no card. The board is enumerated exactly
+    when that costs at most exact_threshold evaluations (always on the
+    river, usually on the turn). Otherwise nb_simulation deals are sampled.
+    """
+    if not community_card: community_card = []
+    community_ids = [_to_card_id(card) for card in community_card]
+    hero_combos, hero_weights = _range_to_arrays(hero_range, community_ids)
+    opponent_combos, opponent_weights = _range_to_arrays(opponent_range, community_ids)
+    need_num = 5 - len(community_ids)
+    nb_board = comb(52 - len(community_ids), need_num)
+    if nb_board * (len(hero_combos) + len(opponent_combos)) <= exact_threshold:
+        return _exact_range_win_rate(hero_combos, hero_weights, opponent_combos, opponent_weights, community_ids)
+    return _sampled_range_win_rate(hero_combos, hero_weights, opponent_combos, opponent_weights,
+            community_ids, nb_simulation, to_np_rng(rng))
+
+def _exact_range_win_rate(hero_combos, hero_weights, opponent_combos, opponent_weights, community_ids):
+    hero_masks, opponent_masks = _combo_masks(hero_combos), _combo_masks(opponent_combos)
+    pair_weights = np.outer(hero_weights, opponent_weights)
+    pair_weights[(hero_masks[:, None] & opponent_masks[None, :]) != 0] = 0
+    unused = np.setdiff1d(np.arange(1, 53), community_ids)
+    win_weight, total_weight = 0.0, 0.0
+    for board_rest in _combinations(unused, 5 - len(community_ids)):
+        board = np.array(community_ids + board_rest, dtype=np.int64)
+        board_mask = int(_card_mask(board))
+        hero_valid = (hero_masks & board_mask) == 0
+        opponent_valid = (opponent_masks & board_mask) == 0
+        weights = pair_weights[hero_valid][:, opponent_valid]
+        hero_score = _eval_combos_on_board(hero_combos[hero_valid], board)
+        opponent_score = _eval_combos_on_board(opponent_combos[opponent_valid], board)
+        win_weight += weights[hero_score[:, None] >= opponent_score[None, :]].sum()
+        total_weight += weights.sum()
+    if total_weight == 0:
+        raise ValueError(_no_valid_pair_msg)
+    return float(win_weight / total_weight)
+
+def _sampled_range_win_rate(hero_combos, hero_weights, opponent_combos, opponent_weights,
+        community_ids, nb_simulation, rng):
+    hero_idx, opponent_idx = _sample_disjoint_pairs(
+            hero_combos, hero_weights, opponent_combos, opponent_weights, nb_simulation, rng)
+    hero_hole, opponent_hole = hero_combos[hero_idx], opponent_combos[opponent_idx]
+
+    # draw the rest of the board from the cards left by each sampled pair
+    keys = rng.random((nb_simulation, 53))
+    keys[:, 0] = np.inf
+    keys[:, community_ids] = np.inf
+    rows = np.arange(nb_simulation)[:, None]
+    keys[rows, hero_hole] = np.inf
+    keys[rows, opponent_hole] = np.inf
+    board_rest = np.argsort(keys, axis=1)[:, :5 - len(community_ids)]
+    boards = np.hstack([np.tile(np.array(community_ids, dtype=np.int64), (nb_simulation, 1)), board_rest])
+
+    hero_score = HandEvaluator.eval_hand_batch(np.hstack([hero_hole, boards]))
+    opponent_score = HandEvaluator.eval_hand_batch(np.hstack([opponent_hole, boards]))
+    return float(np.mean(hero_score >= opponent_score))
+
+def _sample_disjoint_pairs(hero_combos, hero_weights, opponent_combos, opponent_weights, nb_simulation, rng):
+    """Rejection sampling of nb_simulation (hero, opponent) combo index pairs sharing no card"""
+    hero_masks, opponent_masks = _combo_masks(hero_combos), _combo_masks(opponent_combos)
+    hero_p, opponent_p = hero_weights / hero_weights.sum(), opponent_weights / opponent_weights.sum()
+    hero_idx, opponent_idx = [], []
+    nb_sampled, nb_drawn = 0, 0
+    while nb_sampled < nb_simulation:
+        if nb_drawn > 100 * nb_simulation:
+            raise ValueError(_no_valid_pair_msg)
+        nb_draw = 2 * (nb_simulation - nb_sampled)
+        h = rng.choice(len(hero_combos), size=nb_draw, p=hero_p)
+        o = rng.choice(len(opponent_combos), size=nb_draw, p=opponent_p)
+        disjoint = (hero_masks[h] & opponent_masks[o]) == 0
+        hero_idx.append(h[disjoint])
+        opponent_idx.append(o[disjoint])
+        nb_sampled += int(disjoint.sum())
+        nb_drawn += nb_draw
+    return np.concatenate(hero_idx)[:nb_simulation], np.concatenate(opponent_idx)[:nb_simulation]
+
+def _eval_combos_on_board(combos, board):
+    return BoardEvaluator([Card.from_id(card_id) for card_id in board]).eval_card_ids_batch(combos)
+
+def _range_to_arrays(hand_range, dead_ids):
+    dead_mask = int(_card_mask(np.array(dead_ids, dtype=np.int64)))
+    combos, weights = [], []
+    for combo, weight in hand_range.items():
+        card_ids = [_to_card_id(card) for card in combo]
+        if len(set(card_ids)) != 2:
+            raise ValueError("A combo needs 2 different cards (but got %s)" % (combo,))
+        if weight > 0 and (1 << card_ids[0] | 1 << card_ids[1]) & dead_mask == 0:
+            combos.append(card_ids)
+            weights.append(weight)
+    if len(combos) == 0:
+        raise ValueError("The range has no combo left after removing dead cards")
+    return np.array(combos, dtype=np.int64), np.array(weights, dtype=np.float64)
+
+def _combo_masks(combos):
+    return (np.int64(1) << combos[:, 0]) | (np.int64(1) << combos[:, 1])
+
+def _card_mask(card_ids):
+    return np.bitwise_or.reduce(np.int64(1) << card_ids) if len(card_ids) else np.int64(0)
+
+def _combinations(card_ids, size):
+    return [list(combo) for combo in combinations(card_ids.tolist(), size)]
+
+def _to_card_id(card):
+    return (Card.from_str(card) if isinstance(card, str) else card).to_id()
+
+def _expand_hand_class(hand_class):
+    high, low = hand_class[0], hand_class[1]
+    if high == low:
+        return [(s1 + high, s2 + low) for i, s1 in enumerate(SUITS) for s2 in SUITS[i+1:]]
+    if hand_class.endswith("s"):
+        return [(suit + high, suit + low) for suit in SUITS]
+    if hand_class.endswith("o"):
+        return [(s1 + high, s2 + low) for s1 in SUITS for s2 in SUITS if s1 != s2]
+    return _expand_hand_class(hand_class + "s") + _expand_hand_class(hand_class + "o")
+
+_no_valid_pair_msg = "Every pair of combos from the two ranges shares a card"
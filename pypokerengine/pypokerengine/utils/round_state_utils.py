@@ -0,0 +1,77 @@
+"""Rebuild round_state from the delta notification stream.
+
+Players which set BasePokerPlayer.receives_delta get a full round_state
+only at the start of each street and with the round result. Actions in
+between come as deltas (see MessageBuilder.build_game_update_delta_message)
+and ask messages come without round_state. RoundStateTracker applies them
+to the last full round_state and rebuilds the round_state the engine would
+have encoded on demand.
+"""
+import copy
+from itertools import chain, zip_longest
+
+_STREETS = ["preflop", "flop", "turn", "river"]
+
+class RoundStateTracker(object):
+
+    def __init__(self):
+        self._round_state = None
+        self._current_street = None
+        self._seat_histories = None
+
+    def load(self, round_state):
+        """Start over from a full round_state"""
+        self._round_state = copy.deepcopy(round_state)
+        histories = self._round_state["action_histories"]
+        self._current_street = [street for street in _STREETS if street in histories][-1]
+        uuids = [seat["uuid"] for seat in self._round_state["seats"]]
+        self._seat_histories = [[] for _ in uuids]
+        for history in histories[self._current_street]:
+            self._seat_histories[uuids.index(history["uuid"])].append(history)
+
+    def apply_update(self, delta):
+        """Apply a delta of game_update_delta_message (or delta_from_update_message)"""
+        self.__check_loaded()
+        pos = delta["next_player"]
+        self._seat_histories[pos].append(copy.deepcopy(delta["history"]))
+        self._round_state["seats"][pos] = copy.deepcopy(delta["seat"])
+        self._round_state["pot"] = copy.deepcopy(delta["pot"])
+        self._round_state["next_player"] = pos
+
+    def apply_ask(self, message):
+        """Apply an ask message without round_state"""
+        self.__check_loaded()
+        self._round_state["next_player"] = message["next_player"]
+
+    def round_state(self):
+        """The round_state as the engine would encode it now"""
+        self.__check_loaded()
+        round_state = dict(self._round_state)
+        round_state["action_histories"] = dict(round_state["action_histories"])
+        round_state["action_histories"][self._current_street] = self.__ordered_histories()
+        return copy.deepcopy(round_state)
+
+    def __ordered_histories(self):
+        # same order as DataEncoder: i-th action of every seat from the small blind, then the (i+1)-th, ...
+        sb_pos = self._round_state["small_blind_pos"]
+        seat_histories = self._seat_histories[sb_pos:] + self._seat_histories[:sb_pos]
+        return [history for history in chain.from_iterable(zip_longest(*seat_histories)) if history is not None]
+
+    def __check_loaded(self):
+        if self._round_state is None:
+            raise ValueError("No round_state is loaded yet. A street start message comes first.")
+
+def delta_from_update_message(message):
+    """The delta of a full game_update_message"""
+    round_state = message["round_state"]
+    pos = round_state["next_player"]
+    seat = round_state["seats"][pos]
+    current_street = [street for street in _STREETS if street in round_state["action_histories"]][-1]
+    history = [h for h in round_state["action_histories"][current_street] if h["uuid"] == seat["uuid"]][-1]
+    return {
+        "action": message["action"],
+        "history": history,
+        "seat": seat,
+        "pot": round_state["pot"],
+        "next_player": pos
+    }
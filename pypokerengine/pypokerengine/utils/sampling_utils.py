@@ -0,0 +1,33 @@
+"""NumPy helpers shared by the samplers and the exact enumerations of the utils modules.
+
+Kept free of the other utils modules so that scripts/gen_preflop_equity_table.py
+can sample without importing card_utils, which imports the generated table.
+"""
+import random
+from itertools import combinations
+
+import numpy as np
+
+def to_np_rng(rng):
+    """numpy Generator of rng (a seed or a Generator). None seeds it from the random module."""
+    if rng is None:
+        rng = random.getrandbits(64)
+    return np.random.default_rng(rng)
+
+def draw_unused_card_ids(rng, nb_simulation, card_num, used_ids):
+    """Draw card_num distinct unused card ids for each simulation => (nb_simulation, card_num) array"""
+    unused = np.setdiff1d(np.arange(1, 53), used_ids)
+    order = np.argsort(rng.random((nb_simulation, len(unused))), axis=1)
+    return unused[order[:, :card_num]]
+
+def combination_array(card_ids, size):
+    """All size-card combinations of sorted card_ids => (C(n, size), size) array"""
+    combos = list(combinations(card_ids.tolist(), size))
+    return np.array(combos, dtype=np.int64).reshape(len(combos), size)
+
+def encode_card_ids(card_ids):
+    """Encode each row of sorted card ids as one integer (base 53)"""
+    code = np.zeros(len(card_ids), dtype=np.int64)
+    for col in range(card_ids.shape[1]):
+        code = code * 53 + card_ids[:, col]
+    return code
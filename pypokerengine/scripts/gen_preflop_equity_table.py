@@ -0,0 +1,69 @@
+"""Generate pypokerengine/utils/preflop_equity_table.py
+
+Usage: python -m scripts.gen_preflop_equity_table [nb_simulation] [seed]
+
+For each of the 169 starting hand classes a representative hole card is dealt
+against 9 random opponents nb_simulation times. Deal k is used for every
+player count: the hand wins against n opponents when it ties or beats the
+first n of them, the same definition as estimate_hole_card_win_rate.
+"""
+import os
+import sys
+
+import numpy as np
+
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+from pypokerengine.utils.sampling_utils import draw_unused_card_ids
+
+NB_SIMULATION = 100000
+SEED = 2026
+MAX_OPPONENT = 9
+RANKS = "AKQJT98765432"
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), os.pardir,
+        "pypokerengine", "utils", "preflop_equity_table.py")
+
+def hand_classes():
+    classes = []
+    for i, high in enumerate(RANKS):
+        for low in RANKS[i:]:
+            if high == low:
+                classes.append(high + low)
+            else:
+                classes += [high + low + "s", high + low + "o"]
+    return classes
+
+def representative_hole_card(hand_class):
+    high_suit = "S"
+    low_suit = "S" if hand_class.endswith("s") else "H"
+    return [Card.from_str(high_suit + hand_class[0]), Card.from_str(low_suit + hand_class[1])]
+
+def simulate(hole_card, nb_simulation, rng):
+    hole_ids = [card.to_id() for card in hole_card]
+    drawn = draw_unused_card_ids(rng, nb_simulation, 5 + 2 * MAX_OPPONENT, hole_ids)
+    boards = drawn[:, :5]
+    my_score = HandEvaluator.eval_hand_batch(np.hstack([np.tile(hole_ids, (nb_simulation, 1)), boards]))
+    opponents_hole = drawn[:, 5:].reshape(nb_simulation, MAX_OPPONENT, 2)
+    opponents_board = np.broadcast_to(boards[:, None, :], (nb_simulation, MAX_OPPONENT, 5))
+    opponents_hands = np.concatenate([opponents_hole, opponents_board], axis=2).reshape(-1, 7)
+    opponents_score = HandEvaluator.eval_hand_batch(opponents_hands).reshape(nb_simulation, MAX_OPPONENT)
+    best_opponents_score = np.maximum.accumulate(opponents_score, axis=1)
+    return (my_score[:, None] >= best_opponents_score).mean(axis=0)
+
+def main(nb_simulation=NB_SIMULATION, seed=SEED):
+    rng = np.random.default_rng(seed)
+    lines = [
+        '"""Generated by scripts/gen_preflop_equity_table.py (nb_simulation=%d, seed=%d). Do not edit."""' % (nb_simulation, seed),
+        "",
+        "# hand class => win rate against 1, 2, ..., %d random opponents" % MAX_OPPONENT,
+        "PREFLOP_EQUITY = {",
+    ]
+    for hand_class in hand_classes():
+        win_rates = simulate(representative_hole_card(hand_class), nb_simulation, rng)
+        lines.append('    "%s": (%s),' % (hand_class, ", ".join(["%.4f" % rate for rate in win_rates])))
+    lines.append("}")
+    with open(OUTPUT_PATH, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -9,13 +9,14 @@ setup(
     license = 'MIT',
     keywords = 'python poker emgine ai',
     url = 'https://github.com/ishikota/PyPokerEngine',
-    packages = [pkg for pkg in find_packages() if pkg != "tests"],
+    packages = find_packages(exclude=["tests*", "benchmarks*", "scripts*"]),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "License :: OSI Approved :: MIT License",
     ],
     install_requires=[
-        "func_timeout"
+        "func_timeout",
+        "numpy"
     ],
     )
 
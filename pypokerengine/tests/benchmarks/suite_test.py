@@ -0,0 +1,29 @@
+import json
+import os
+import tempfile
+
+from mock import patch
+from tests.base_unittest import BaseUnitTest
+import benchmarks.suite as S
+
+class SuiteTest(BaseUnitTest):
+
+    def test_compare(self):
+        baseline = { "a": 100.0, "b": 100.0, "c": 100.0, "removed": 100.0 }
+        results = { "a": 95.0, "b": 89.0, "c": 150.0, "added": 1.0 }
+        self.eq([("b", 100.0, 89.0)], S.compare(results, baseline))
+        self.eq([], S.compare(results, baseline, max_regression_percent=20))
+        self.eq([("a", 100.0, 95.0), ("b", 100.0, 89.0)], sorted(S.compare(results, baseline, max_regression_percent=1)))
+
+    def test_main_exit_code(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            baseline_path = os.path.join(tmpdir, "baseline.json")
+            output_path = os.path.join(tmpdir, "results.json")
+            S.save_results(baseline_path, { "a": 100.0, "b": 100.0 })
+            with patch('benchmarks.suite.run', return_value={ "a": 100.0, "b": 95.0 }), patch('builtins.print'):
+                self.eq(0, S.main(["-b", baseline_path, "-o", output_path]))
+                self.eq(1, S.main(["-b", baseline_path, "-t", "1"]))
+            with open(output_path) as f:
+                self.eq({ "a": 100.0, "b": 95.0 }, json.load(f)["results"])
+            with patch('benchmarks.suite.run', return_value={ "a": 1.0 }), patch('builtins.print'):
+                self.eq(0, S.main([]))
@@ -3,6 +3,11 @@ import pypokerengine.api.game as G
 from nose.tools import raises
 from tests.base_unittest import BaseUnitTest
 from examples.players.fold_man import FoldMan
+from examples.players.fish_player import FishPlayer
+from examples.players.random_player import RandomPlayer
+import contextlib
+import io
+import random
 
 class GameTest(BaseUnitTest):
 
@@ -38,6 +43,31 @@ class GameTest(BaseUnitTest):
         self.eq(115, p1["stack"])
         self.eq(85, p2["stack"])
 
+    def test_start_poker_fast_mode_plays_same_game(self):
+        results = []
+        for mode in ["normal", "fast"]:
+            random.seed(2026)
+            config = G.setup_config(30, 1000, 5)
+            for i in range(4):
+                player = RandomPlayer()
+                player.set_action_ratio(2, 10, 1)
+                config.register_player("random%d" % i, player)
+            config.register_player("fish", FishPlayer())
+            config.set_blind_structure({ 10: { "ante":2, "small_blind":10 } })
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                results.append(G.start_poker(config, verbose=0, mode=mode))
+            printed = output.getvalue()
+        self.eq(results[0], results[1])
+        self.eq("", printed)
+
+    def test_start_poker_unknown_mode(self):
+        config = G.setup_config(1, 100, 10)
+        config.register_player("p1", FoldMan())
+        config.register_player("p2", FoldMan())
+        with self.assertRaises(ValueError):
+            G.start_poker(config, mode="turbo")
+
     def test_start_poker_validation_when_no_player(self):
         config = G.setup_config(1, 100, 10)
         with self.assertRaises(Exception) as e:
@@ -0,0 +1,151 @@
+import random
+
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.api.poker_env import PokerEnv, ALLIN
+from pypokerengine.engine.poker_constants import PokerConstants as Const
+
+from examples.players.fold_man import FoldMan
+
+class PokerEnvTest(BaseUnitTest):
+
+    def test_reset(self):
+        env = PokerEnv(seed=1)
+        obs = env.reset()
+        # heads-up the dealer (seat 0) is the big blind and the small blind has called
+        self.eq(0, obs["player"])
+        self.eq(0, obs["dealer_btn"])
+        self.eq(2, len(obs["hole_card"]))
+        self.eq([], obs["community_card"])
+        self.eq(Const.Street.PREFLOP, obs["street"])
+        self.eq([90, 90], obs["stacks"])
+        self.eq(20, obs["pot"])
+        self.eq(10, obs["call_amount"])
+        self.eq(15, obs["min_raise"])
+        self.eq(100, obs["max_raise"])
+        self.eq([True] * 6, obs["legal_actions"])
+        self.eq(6, env.nb_action)
+
+    def test_fold(self):
+        env = PokerEnv(seed=1)
+        env.reset()
+        obs, reward, done, info = env.step(PokerEnv.FOLD)
+        self.eq(-10, reward)
+        self.true(done)
+        self.eq({ "action": "fold", "amount": 0, "stacks": [90, 110] }, info)
+
+    def test_call_down(self):
+        env = PokerEnv(seed=1)
+        obs = env.reset()
+        streets = []
+        done = False
+        while not done:
+            streets.append(obs["street"])
+            obs, reward, done, info = env.step(PokerEnv.CALL)
+        self.eq([Const.Street.PREFLOP, Const.Street.FLOP, Const.Street.TURN, Const.Street.RIVER], streets)
+        self.true(reward in [-10, 0, 10])
+        self.eq(200, sum(info["stacks"]))
+
+    def test_decode_action(self):
+        env = PokerEnv(raise_sizes=(0.5, 1.0, ALLIN), seed=1)
+        env.reset()
+        self.eq(("fold", 0), env.decode_action(PokerEnv.FOLD))
+        self.eq(("call", 10), env.decode_action(PokerEnv.CALL))
+        self.eq(("raise", 20), env.decode_action(2))
+        self.eq(("raise", 30), env.decode_action(3))
+        self.eq(("raise", 100), env.decode_action(4))
+
+    def test_raise_is_call_when_player_cannot_raise(self):
+        env = PokerEnv(opponents=[lambda obs: len(PokerEnv.RAISE_SIZES) + 1], seed=1)
+        obs = env.reset()
+        self.eq(100, obs["call_amount"])
+        self.eq(-1, obs["min_raise"])
+        self.eq([True, True, False, False, False, False], obs["legal_actions"])
+        self.eq(("call", 100), env.decode_action(2))
+        obs, reward, done, info = env.step(2)
+        self.true(done)
+        self.eq("call", info["action"])
+
+    def test_callable_opponent(self):
+        observed = []
+        def raise_policy(obs):
+            observed.append(obs)
+            return 2 if obs["legal_actions"][2] else PokerEnv.CALL
+        env = PokerEnv(opponents=[raise_policy], raise_sizes=(1.0,), seed=1)
+        obs = env.reset()
+        self.eq(1, observed[0]["player"])
+        self.eq(observed[0]["hole_card"], [card.to_id() for card in env.table.seats.players[1].hole_card])
+        self.eq(30, obs["call_amount"])
+        self.eq([90, 70], obs["stacks"])
+
+    def test_base_poker_player_opponent(self):
+        env = PokerEnv(opponents=[FoldMan()], seed=1)
+        obs = env.reset()
+        # the first hand is over when the small blind folds, so the hero acts first in the second one
+        self.eq(2, env.round_count)
+        self.eq(1, obs["dealer_btn"])
+        # the small blind won in the skipped hand is reported apart from the episode
+        self.eq((5, 1), (env.skipped_reward, env.nb_skipped_hands))
+        obs, reward, done, info = env.step(PokerEnv.CALL)
+        self.true(done)
+        self.eq(10, reward)
+        self.eq(1, env.nb_skipped_hands)
+        # each reset reports only the hands it skipped
+        env.reset()
+        self.eq(4, env.round_count)
+        self.eq((5, 1), (env.skipped_reward, env.nb_skipped_hands))
+
+    def test_many_players(self):
+        rng = random.Random(1)
+        policy = lambda obs: rng.choice([a for a, legal in enumerate(obs["legal_actions"]) if legal])
+        env = PokerEnv(opponents=[policy] * 5, nb_player=6, hero_pos=2, seed=1)
+        for _ in range(50):
+            obs, done = env.reset(), False
+            self.eq(2, obs["player"])
+            while not done:
+                obs, reward, done, info = env.step(policy(obs))
+            self.eq(info["stacks"][2] - 100, reward)
+            self.true(sum(info["stacks"]) <= 600)
+
+    def test_same_seed_same_hand(self):
+        first = self.__call_down(PokerEnv(nb_player=3, seed=5), None)
+        self.eq(first, self.__call_down(PokerEnv(nb_player=3, seed=5), None))
+        env = PokerEnv(nb_player=3, seed=3)
+        for _ in range(2):
+            self.__call_down(env, None)
+        # the button and the hand count go back too, not only the deck
+        self.eq(first, self.__call_down(env, 5))
+        self.eq(1, env.round_count)
+
+    def test_step_after_done(self):
+        env = PokerEnv(seed=1)
+        with self.assertRaises(ValueError):
+            env.step(PokerEnv.CALL)
+        env.reset()
+        env.step(PokerEnv.FOLD)
+        with self.assertRaises(ValueError):
+            env.step(PokerEnv.CALL)
+
+    def test_invalid_action(self):
+        env = PokerEnv(seed=1)
+        env.reset()
+        with self.assertRaises(ValueError):
+            env.step(env.nb_action)
+
+    def test_invalid_hero_pos(self):
+        with self.assertRaises(ValueError):
+            PokerEnv(nb_player=3, hero_pos=5)
+        with self.assertRaises(ValueError):
+            PokerEnv(hero_pos=-1)
+
+    def test_invalid_opponents(self):
+        with self.assertRaises(ValueError):
+            PokerEnv(opponents=[FoldMan()], nb_player=3)
+        with self.assertRaises(TypeError):
+            PokerEnv(opponents=["hoge"])
+
+    def __call_down(self, env, seed):
+        observations, done = [env.reset(seed=seed)], False
+        while not done:
+            obs, reward, done, info = env.step(PokerEnv.CALL)
+            observations.append(obs)
+        return observations, reward, info
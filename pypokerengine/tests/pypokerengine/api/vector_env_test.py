@@ -0,0 +1,128 @@
+import numpy as np
+
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.api.vector_env import VectorPokerEnv
+from pypokerengine.engine.deck import Deck
+from pypokerengine.engine.player import Player
+from pypokerengine.engine.poker_constants import PokerConstants as Const
+from pypokerengine.engine.round_manager import RoundManager
+from pypokerengine.engine.table import Table
+
+ACTION_STRS = { Const.Action.FOLD: "fold", Const.Action.CALL: "call", Const.Action.RAISE: "raise" }
+
+class VectorPokerEnvTest(BaseUnitTest):
+
+    def test_reset(self):
+        env = VectorPokerEnv(4, nb_player=3, initial_stack=100, small_blind_amount=5, seed=1)
+        obs = env.reset()
+        self.eq([0, 0, 0, 0], obs["player"].tolist())
+        self.eq([[100, 95, 90]] * 4, obs["stacks"].tolist())
+        self.eq([15] * 4, obs["pot"].tolist())
+        self.eq([10] * 4, obs["call_amount"].tolist())
+        self.eq([15] * 4, obs["min_raise"].tolist())
+        self.eq([100] * 4, obs["max_raise"].tolist())
+        self.eq([[0] * 5] * 4, obs["community_card"].tolist())
+        self.eq((4, 2), obs["hole_card"].shape)
+        for table in range(4):
+            cards = env.hole_card[table].flatten().tolist() + env.board[table].tolist()
+            self.eq(len(cards), len(set(cards)))
+
+    def test_fold_to_big_blind(self):
+        env = VectorPokerEnv(2, nb_player=2, initial_stack=100, small_blind_amount=5, seed=1)
+        env.reset()
+        obs, rewards, dones = env.step([Const.Action.FOLD, Const.Action.CALL])
+        self.eq([True, False], dones.tolist())
+        # heads-up the dealer is the big blind and the small blind acts first
+        self.eq([[5, -5], [0, 0]], rewards.tolist())
+        self.eq([1, 0], obs["dealer_btn"].tolist())
+        self.eq([95, 90], obs["stacks"][0].tolist())
+        self.eq(0, obs["player"][1])
+        self.eq(Const.Street.PREFLOP, obs["street"][1])
+
+    def test_illegal_raise_is_fold(self):
+        env = VectorPokerEnv(1, nb_player=3, initial_stack=100, small_blind_amount=5, seed=1)
+        env.reset()
+        obs, _, _ = env.step(Const.Action.RAISE, 12)
+        self.true(obs["folded"][0, 0])
+        self.eq(1, obs["player"][0])
+
+    def test_invalid_action(self):
+        env = VectorPokerEnv(1)
+        env.reset()
+        with self.assertRaises(ValueError):
+            env.step(3)
+
+    def test_initial_stack_per_seat(self):
+        env = VectorPokerEnv(2, nb_player=2, initial_stack=[[30, 100], [100, 50]], small_blind_amount=5, seed=1)
+        obs = env.reset()
+        self.eq([[20, 95], [90, 45]], obs["stacks"].tolist())
+        obs, rewards, dones = env.step(Const.Action.RAISE, [30, 50])
+        self.eq([False, True], obs["allin"][:, 1].tolist())
+        self.eq([0, 0], obs["player"].tolist())
+        obs, rewards, dones = env.step(Const.Action.CALL)
+        self.eq([True, True], dones.tolist())
+        self.eq([0, 0], rewards.sum(axis=1).tolist())
+        self.eq([30, 50], np.abs(rewards).max(axis=1).tolist())
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            VectorPokerEnv(1, nb_player=11)
+        with self.assertRaises(ValueError):
+            VectorPokerEnv(1, initial_stack=10, small_blind_amount=5)
+
+    def test_same_results_as_round_manager(self):
+        for nb_player in [2, 3, 6]:
+            self.__check_with_round_manager(nb_table=32, nb_player=nb_player, nb_step=200, seed=nb_player)
+
+    def __check_with_round_manager(self, nb_table, nb_player, nb_step, seed):
+        rng = np.random.RandomState(seed)
+        # different stacks per seat to make side pots
+        initial_stack = rng.randint(20, 120, size=(nb_table, nb_player))
+        env = VectorPokerEnv(nb_table, nb_player, initial_stack=initial_stack, small_blind_amount=5, seed=seed)
+        obs = env.reset()
+        hands = [self.__hand_record(env, table) for table in range(nb_table)]
+        nb_checked = 0
+        for _ in range(nb_step):
+            actions, amounts = self.__choose_actions(obs, rng)
+            for table in range(nb_table):
+                amount = obs["call_amount"][table] if actions[table] == Const.Action.CALL else amounts[table]
+                hands[table]["actions"].append((obs["player"][table], ACTION_STRS[actions[table]], int(amount)))
+            obs, rewards, dones = env.step(actions, amounts)
+            for table in np.flatnonzero(dones):
+                self.eq(self.__replay(hands[table], initial_stack[table]), rewards[table].tolist())
+                hands[table] = self.__hand_record(env, table)
+                nb_checked += 1
+        self.true(nb_checked > nb_table)
+
+    def __choose_actions(self, obs, rng):
+        n = len(obs["player"])
+        r = rng.random_sample(n)
+        actions = np.where(r < 0.1, Const.Action.FOLD, np.where(r < 0.7, Const.Action.CALL, Const.Action.RAISE))
+        can_raise = obs["min_raise"] != -1
+        amounts = np.where(can_raise,
+                obs["min_raise"] + (rng.random_sample(n) * (obs["max_raise"] - obs["min_raise"] + 1)).astype(int), 0)
+        # some all-in raises, and some illegal ones which must become folds
+        amounts = np.where(rng.random_sample(n) < 0.2, obs["max_raise"], amounts)
+        amounts = np.where(rng.random_sample(n) < 0.05, obs["call_amount"] + 1, amounts)
+        return actions, amounts
+
+    def __hand_record(self, env, table):
+        return {
+            "card_ids": env.hole_card[table].flatten().tolist() + env.board[table].tolist(),
+            "dealer_btn": int(env.dealer_btn[table]),
+            "actions": []
+        }
+
+    def __replay(self, hand, initial_stack):
+        nb_player = len(initial_stack)
+        table = Table(cheat_deck=Deck(cheat=True, cheat_card_ids=hand["card_ids"]))
+        for i, stack in enumerate(initial_stack):
+            table.seats.sitdown(Player("uuid%d" % i, int(stack), "p%d" % i))
+        table.dealer_btn = hand["dealer_btn"]
+        table.set_blind_pos((table.dealer_btn + 1) % nb_player, (table.dealer_btn + 2) % nb_player)
+        state, _ = RoundManager.start_new_round(1, 5, 0, table, inplace=True, quiet=True)
+        for player_pos, action, amount in hand["actions"]:
+            self.eq(state["next_player"], player_pos)
+            state, _ = RoundManager.apply_action(state, action, amount, inplace=True)
+        self.eq(Const.Street.FINISHED, state["street"])
+        return [player.stack - stack for player, stack in zip(state["table"].seats.players, initial_stack)]
@@ -2,6 +2,7 @@ from tests.base_unittest import BaseUnitTest
 from pypokerengine.engine.player import Player
 from pypokerengine.engine.poker_constants import PokerConstants as Const
 from pypokerengine.engine.action_checker import ActionChecker
+from pypokerengine.engine.betting_ledger import BettingLedger
 
 class ActionCheckerTest(BaseUnitTest):
 
@@ -191,6 +192,15 @@ class ActionCheckerTest(BaseUnitTest):
   def __setup_clean_players(self):
     return [Player("uuid", 100) for  _ in range(2)]
 
+  def test_read_ledger(self):
+    players = self.__setup_blind_players()
+    ledger = BettingLedger.from_players(players, 2.5)
+    self.eq(ActionChecker.legal_actions(players, 0, 2.5), ActionChecker.legal_actions(players, 0, 2.5, ledger))
+    ledger.current_bet, ledger.min_raise = 20, 30
+    self.eq(20, ActionChecker.agree_amount(players, ledger))
+    self.eq({ "min": 30, "max": 100 }, ActionChecker.legal_actions(players, 0, 2.5, ledger)[2]["amount"])
+    self.eq(("fold", 0), ActionChecker.correct_action(players, 0, 2.5, "raise", 25, ledger))
+
   def __setup_blind_players(self):
     return [self.__create_blind_player(flg) for flg in [True, False]]
 
@@ -0,0 +1,35 @@
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.engine.action_history import ActionHistory
+
+class ActionHistoryTest(BaseUnitTest):
+
+  def setUp(self):
+    self.history = ActionHistory("RAISE", 20, 15, 10, "uuid1")
+
+  def test_read_like_dict(self):
+    self.eq("RAISE", self.history["action"])
+    self.eq(15, self.history["paid"])
+    self.true("add_amount" in self.history)
+    self.eq(10, self.history.get("add_amount"))
+
+  def test_missing_field(self):
+    history = ActionHistory("FOLD", uuid="uuid1")
+    self.false("amount" in history)
+    self.eq(None, history.get("amount"))
+    with self.assertRaises(KeyError):
+      history["amount"]
+
+  def test_to_dict(self):
+    self.eq({"action": "FOLD", "uuid": "uuid1"}, ActionHistory("FOLD", uuid="uuid1").to_dict())
+    expected = {"action": "RAISE", "amount": 20, "paid": 15, "add_amount": 10, "uuid": "uuid1"}
+    self.eq(expected, self.history.to_dict())
+    self.eq(self.history, ActionHistory.from_dict(expected))
+
+  def test_compare_with_dict(self):
+    self.true(self.history == {"action": "RAISE", "amount": 20, "paid": 15, "add_amount": 10, "uuid": "uuid1"})
+    self.true({"action": "RAISE", "amount": 20, "paid": 15, "add_amount": 10, "uuid": "uuid1"} == self.history)
+    self.neq({"action": "RAISE", "amount": 20, "uuid": "uuid1"}, self.history)
+    self.neq(ActionHistory("CALL", 20, 15, uuid="uuid1"), self.history)
+
+  def test_no_instance_dict(self):
+    self.false(hasattr(self.history, "__dict__"))
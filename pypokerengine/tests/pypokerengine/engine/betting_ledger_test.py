@@ -0,0 +1,99 @@
+import contextlib
+import io
+import random
+
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.engine.player import Player
+from pypokerengine.engine.table import Table
+from pypokerengine.engine.round_manager import RoundManager
+from pypokerengine.engine.action_checker import ActionChecker
+from pypokerengine.engine.betting_ledger import BettingLedger
+from pypokerengine.engine.poker_constants import PokerConstants as Const
+
+class BettingLedgerTest(BaseUnitTest):
+
+  def setUp(self):
+    self.players = [Player("uuid%d" % i, 100) for i in range(3)]
+    self.ledger = BettingLedger(3, 5)
+
+  def test_initial_state(self):
+    self.eq(0, self.ledger.current_bet)
+    self.eq(0, self.ledger.last_raise)
+    self.eq(10, self.ledger.min_raise)
+    self.eq([0, 0, 0], self.ledger.contributions)
+
+  def test_record_blinds_and_raise(self):
+    self.__add(0, Const.Action.SMALL_BLIND, sb_amount=5)
+    self.__add(1, Const.Action.BIG_BLIND, sb_amount=5)
+    self.eq(10, self.ledger.current_bet)
+    self.eq(15, self.ledger.min_raise)
+    self.__add(2, Const.Action.RAISE, 30, 20)
+    self.eq(30, self.ledger.current_bet)
+    self.eq(20, self.ledger.last_raise)
+    self.eq(50, self.ledger.min_raise)
+    self.__add(0, Const.Action.CALL, 30)
+    self.__add(1, Const.Action.FOLD)
+    self.eq([30, 10, 30], self.ledger.contributions)
+    self.eq(30, self.ledger.max_contribution())
+
+  def test_ante_is_not_contribution(self):
+    self.__add(0, Const.Action.ANTE, 3)
+    self.eq([0, 0, 0], self.ledger.contributions)
+
+  def test_new_street(self):
+    self.__add(2, Const.Action.RAISE, 30, 20)
+    self.ledger.new_street()
+    self.eq(0, self.ledger.current_bet)
+    self.eq(10, self.ledger.min_raise)
+    self.eq([0, 0, 0], self.ledger.contributions)
+
+  def test_copy(self):
+    self.__add(2, Const.Action.RAISE, 30, 20)
+    copied = self.ledger.copy()
+    self.__add(0, Const.Action.RAISE, 60, 30)
+    self.eq(30, copied.current_bet)
+    self.eq([0, 0, 30], copied.contributions)
+
+  def test_from_players(self):
+    self.__add(0, Const.Action.SMALL_BLIND, sb_amount=5)
+    self.__add(1, Const.Action.BIG_BLIND, sb_amount=5)
+    self.__add(2, Const.Action.RAISE, 30, 20)
+    self.__eq_ledger(self.ledger, BettingLedger.from_players(self.players, 5))
+
+  def test_same_amount_raise_of_lower_seat_counts(self):
+    self.__add(2, Const.Action.RAISE, 30, 20)
+    self.__add(0, Const.Action.RAISE, 30, 0)
+    self.eq(30, self.ledger.min_raise)
+    self.__eq_ledger(self.ledger, BettingLedger.from_players(self.players, 5))
+
+  def test_matches_histories_in_random_rounds(self):
+    rng = random.Random(7)
+    for _ in range(20):
+      table = Table()
+      for i in range(4):
+        table.seats.sitdown(Player("uuid%d" % i, rng.randint(20, 200)))
+      table.set_blind_pos(0, 1)
+      with contextlib.redirect_stdout(io.StringIO()):
+        state, _ = RoundManager.start_new_round(1, 5, 1, table, inplace=True)
+        while state["street"] not in [Const.Street.SHOWDOWN, Const.Street.FINISHED]:
+          players = state["table"].seats.players
+          self.__eq_ledger(BettingLedger.from_players(players, 5), state["ledger"])
+          action, amount = self.__choose_action(players, state, rng)
+          state, _ = RoundManager.apply_action(state, action, amount, inplace=True)
+
+  def __choose_action(self, players, state, rng):
+    valid_actions = ActionChecker.legal_actions(players, state["next_player"], 5)
+    r = rng.random()
+    if r < 0.1: return "fold", 0
+    if r < 0.6 or valid_actions[2]["amount"]["min"] == -1: return "call", valid_actions[1]["amount"]
+    amount = valid_actions[2]["amount"]
+    return "raise", rng.choice([amount["min"], amount["max"]])
+
+  def __add(self, pos, kind, chip_amount=None, add_amount=None, sb_amount=None):
+    self.players[pos].add_action_history(kind, chip_amount, add_amount, sb_amount)
+    self.ledger.record(pos, self.players[pos].action_histories[-1])
+
+  def __eq_ledger(self, expected, target):
+    fields = lambda l: (l.current_bet, l.last_raise, l.min_raise, l.contributions)
+    self.eq(fields(expected), fields(target))
+
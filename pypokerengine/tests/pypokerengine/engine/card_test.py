@@ -29,3 +29,28 @@ class CardTest(BaseUnitTest):
     self.eq(Card(Card.HEART, 10), Card.from_str("HT"))
     self.eq(Card(Card.SPADE, 9), Card.from_str("S9"))
     self.eq(Card(Card.DIAMOND, 12), Card.from_str("DQ"))
+
+  def test_cards_are_interned(self):
+    card = Card(Card.HEART, 3)
+    self.true(card is Card.from_id(29))
+    self.true(card is Card.from_str("H3"))
+    self.true(Card(Card.SPADE, 1) is Card(Card.SPADE, 14))
+    self.eq(52, len(set(Card.all_cards())))
+    self.eq(list(range(1, 53)), [card.to_id() for card in Card.all_cards()])
+
+  def test_card_is_immutable(self):
+    card = Card.from_id(1)
+    with self.assertRaises(AttributeError):
+      card.rank = 2
+    with self.assertRaises(AttributeError):
+      card.foo = 2
+
+  def test_invalid_card(self):
+    with self.assertRaises(ValueError):
+      Card(3, 5)
+
+  def test_pickle_and_copy_keep_identity(self):
+    import copy, pickle
+    card = Card.from_id(40)
+    self.true(pickle.loads(pickle.dumps(card)) is card)
+    self.true(copy.deepcopy([card])[0] is card)
@@ -101,6 +101,12 @@ class DataEncoderTest(BaseUnitTest):
         self.assertFalse("turn" in hsty)
         self.assertFalse("river" in hsty)
 
+    def test_encode_action_histories_as_dicts(self):
+        table = setup_table()
+        hsty = DataEncoder.encode_action_histories(table)["action_histories"]
+        self.true(all([type(h) == dict for histories in hsty.values() for h in histories]))
+        self.eq({"action": "FOLD", "uuid": "uuid0"}, hsty["preflop"][1])
+
     def test_encode_winners(self):
         winners = [setup_player() for _ in range(2)]
         hsh = DataEncoder.encode_winners(winners)
@@ -1,9 +1,11 @@
 from tests.base_unittest import BaseUnitTest
 from mock import patch
-from pypokerengine.engine.dealer import Dealer
+from pypokerengine.engine.dealer import Dealer, FastDealer
 from examples.players.fold_man import FoldMan
 from pypokerengine.engine.pay_info import PayInfo
 from pypokerengine.engine.table import Table
+from pypokerengine.players import BasePokerPlayer
+import random
 
 class DealerTest(BaseUnitTest):
 
@@ -50,6 +52,20 @@ class DealerTest(BaseUnitTest):
     for i, expected in enumerate(second_player_expected):
       self.eq(expected, algos[1].received_msgs[i])
 
+  def test_delta_players_see_same_round_states(self):
+    observations = []
+    for algo_class in [StateRecordMan, DeltaStateRecordMan]:
+      random.seed(1)
+      dealer = Dealer(5, 100)
+      algos = [algo_class() for _ in range(3)]
+      [dealer.register_player(name, algo) for name, algo in zip(["a", "b", "c"], algos)]
+      with patch('builtins.print'):
+        result = dealer.start_game(3)
+      observations.append(([algo.observed for algo in algos], result))
+    self.eq(observations[0], observations[1])
+    self.true(dealer.message_handler.all_receive_delta())
+    self.true(len(observations[0][0][0]) > 10)
+
   def test_play_a_round(self):
     algos = [FoldMan() for _ in range(2)]
     [self.dealer.register_player(name, algo) for name, algo in zip(["hoge", "fuga"], algos)]
@@ -60,6 +76,20 @@ class DealerTest(BaseUnitTest):
     self.eq(95, player_state[0]["stack"])
     self.eq(105, player_state[1]["stack"])
 
+  def test_fast_dealer_play_a_round(self):
+    dealer = FastDealer(5, 100)
+    algos = [RecordMan() for _ in range(2)]
+    [dealer.register_player(name, algo) for name, algo in zip(["hoge", "fuga"], algos)]
+    dealer.table.dealer_btn = 1
+    with patch('builtins.print') as print_mock:
+      summary = dealer.start_game(1)
+    self.false(print_mock.called)
+    player_state = summary["message"]["game_information"]["seats"]
+    self.eq(95, player_state[0]["stack"])
+    self.eq(105, player_state[1]["stack"])
+    self.eq("declare_action", algos[0].received_msgs[3])
+    self.eq("receive_round_result_message", algos[1].received_msgs[-1])
+
   def test_play_two_round(self):
     algos = [FoldMan() for _ in range(2)]
     [self.dealer.register_player(name, algo) for name, algo in zip(["hoge", "fuga"], algos)]
@@ -180,3 +210,34 @@ class RecordMan(FoldMan):
   def receive_round_result_message(self, winners, hand_info, round_state):
     self.received_msgs.append("receive_round_result_message")
 
+
+class StateRecordMan(BasePokerPlayer):
+
+  def __init__(self):
+    self.observed = []
+
+  def declare_action(self, valid_actions, hole_card, round_state):
+    self.observed.append(("declare_action", round_state))
+    raise_amount = valid_actions[2]["amount"]
+    if len(self.observed) % 3 == 0 and raise_amount["min"] != -1:
+      return "raise", raise_amount["min"]
+    return "call", valid_actions[1]["amount"]
+
+  def receive_game_start_message(self, game_info):
+    pass
+
+  def receive_round_start_message(self, round_count, hole_card, seats):
+    pass
+
+  def receive_street_start_message(self, street, round_state):
+    self.observed.append((street, round_state))
+
+  def receive_game_update_message(self, new_action, round_state):
+    self.observed.append((new_action, round_state))
+
+  def receive_round_result_message(self, winners, hand_info, round_state):
+    self.observed.append((winners, round_state))
+
+class DeltaStateRecordMan(StateRecordMan):
+
+  receives_delta = True
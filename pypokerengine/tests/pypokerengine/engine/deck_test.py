@@ -1,3 +1,5 @@
+import random
+
 from tests.base_unittest import BaseUnitTest
 from pypokerengine.engine.card import Card
 from pypokerengine.engine.deck import Deck
@@ -51,4 +53,42 @@ class DeckTest(BaseUnitTest):
     self.eq(cheat.cheat, restored.cheat)
     self.eq(cheat.cheat_card_ids, restored.cheat_card_ids)
 
+  def test_contains_and_mask(self):
+    card = self.deck.draw_card()
+    self.false(card in self.deck)
+    self.true(Card.from_str("SQ") in self.deck)
+    self.eq(51, bin(self.deck.mask).count("1"))
+    self.eq(0, self.deck.mask >> card.to_id() & 1)
+
+  def test_remove(self):
+    self.deck.shuffle()
+    dead = [Card.from_str("HA"), Card.from_str("C2")]
+    for card in dead:
+      self.deck.remove(card)
+    self.eq(50, self.deck.size())
+    drawn = self.deck.draw_cards(50)
+    self.eq(50, len(set(drawn)))
+    self.true(all([card not in drawn for card in dead]))
+    with self.assertRaises(ValueError):
+      self.deck.remove(dead[0])
+
+  def test_sample(self):
+    self.deck.remove(Card.from_str("HA"))
+    cards = self.deck.sample(51, random.Random(1))
+    self.eq(51, len(set(cards)))
+    self.false(Card.from_str("HA") in cards)
+    self.eq(51, self.deck.size())
+
+  def test_put_card(self):
+    card = self.deck.draw_card()
+    self.deck.put_card(card)
+    self.eq(52, self.deck.size())
+    self.eq(card, self.deck.draw_card())
+    self.deck.deck.append(Card.from_str("C7"))
+    self.eq(51, self.deck.size())
+    self.eq("C7", str(self.deck.draw_card()))
 
+  def test_draw_from_empty_deck(self):
+    self.deck.draw_cards(52)
+    with self.assertRaises(IndexError):
+      self.deck.draw_card()
@@ -3,6 +3,8 @@ from functools import reduce
 from tests.base_unittest import BaseUnitTest
 from mock import patch
 import pypokerengine.engine.hand_evaluator
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.hand_evaluator import HandEvaluator
 from pypokerengine.engine.player import Player
 from pypokerengine.engine.pay_info import PayInfo
 from pypokerengine.engine.table import Table
@@ -99,6 +101,28 @@ class GameEvaluatorTest(BaseUnitTest):
       self.true(dummy_players[2] in winner)
 
 
+  def test_judge_scores_each_hand_once_with_sidepots(self):
+    players = [
+        self.__create_player_with_pay_info("A", 5, PayInfo.ALLIN),
+        self.__create_player_with_pay_info("B", 10, PayInfo.PAY_TILL_END),
+        self.__create_player_with_pay_info("C", 8, PayInfo.ALLIN),
+        self.__create_player_with_pay_info("D", 10, PayInfo.PAY_TILL_END),
+        self.__create_player_with_pay_info("E", 2, PayInfo.FOLDED)
+    ]
+    holes = [["SK", "HK"], ["D3", "D4"], ["HQ", "CQ"], ["S2", "H2"], ["SA", "HA"]]
+    for player, hole in zip(players, holes):
+      player.add_holecard([Card.from_str(s) for s in hole])
+    table = self.__setup_table(players)
+    for card in ["C2", "D7", "H9", "SJ", "CK"]:
+      table.add_community_card(Card.from_str(card))
+    eval_hand = HandEvaluator.eval_hand
+    with patch('pypokerengine.engine.hand_evaluator.HandEvaluator.eval_hand', side_effect=eval_hand) as mock:
+      winner, hand_info, prize_map = GameEvaluator.judge(table)
+      self.eq(4, mock.call_count)
+    self.eq([players[0]], winner)
+    self.eq(4, len(hand_info))
+    self.eq({0: 22, 1: 0, 2: 0, 3: 13, 4: 0}, prize_map)
+
   def __setup_table(self, players):
     table = Table()
     for player in players:
@@ -1,6 +1,10 @@
+import random
+
+import numpy as np
+
 from tests.base_unittest import BaseUnitTest
 from pypokerengine.engine.card import Card
-from pypokerengine.engine.hand_evaluator import HandEvaluator
+from pypokerengine.engine.hand_evaluator import HandEvaluator, BoardEvaluator
 
 class HandEvaluatorTest(BaseUnitTest):
 
@@ -284,3 +288,90 @@ class HandEvaluatorTest(BaseUnitTest):
     self.eq(14, HandEvaluator._HandEvaluator__mask_hole_high_rank(bit))
     self.eq(5, HandEvaluator._HandEvaluator__mask_hole_low_rank(bit))
   
+
+  def test_eval_card_ids_matches_eval_hand(self):
+    hole = [Card(Card.HEART, 10), Card(Card.HEART, 1)]
+    community = [
+        Card(Card.DIAMOND, 4),
+        Card(Card.DIAMOND, 5),
+        Card(Card.HEART, 11),
+        Card(Card.HEART, 12),
+        Card(Card.HEART, 13)
+        ]
+    card_ids = [card.to_id() for card in hole + community]
+    self.eq(HandEvaluator.eval_hand(hole, community), HandEvaluator.eval_card_ids(card_ids))
+    self.eq(HandEvaluator.eval_hand(hole, community[:3]), HandEvaluator.eval_card_ids(card_ids[:5]))
+
+  def test_eval_card_ids_ordering(self):
+    royal_flush = [Card.from_str(s).to_id() for s in ["HA", "HK", "HQ", "HJ", "HT", "C2", "D3"]]
+    four_card = [Card.from_str(s).to_id() for s in ["HA", "SA", "CA", "DA", "HT", "C2", "D3"]]
+    wheel = [Card.from_str(s).to_id() for s in ["HA", "S2", "C3", "D4", "H5", "C9", "DJ"]]
+    high_card = [Card.from_str(s).to_id() for s in ["HA", "S2", "C3", "D4", "H7", "C9", "DJ"]]
+    scores = [HandEvaluator.eval_card_ids(ids) for ids in [royal_flush, four_card, wheel, high_card]]
+    self.eq(sorted(scores, reverse=True), scores)
+
+  def test_eval_hand_batch(self):
+    import numpy as np
+    hands = [
+        [Card.from_str(s).to_id() for s in ["HA", "HK", "HQ", "HJ", "HT", "C2", "D3"]],
+        [Card.from_str(s).to_id() for s in ["HA", "SA", "CA", "DA", "HT", "C2", "D3"]],
+        [Card.from_str(s).to_id() for s in ["HA", "S2", "C3", "D4", "H5", "C9", "DJ"]],
+        [Card.from_str(s).to_id() for s in ["HA", "S2", "C3", "D4", "H7", "C9", "DJ"]],
+        [Card.from_str(s).to_id() for s in ["C2", "C5", "C9", "CJ", "CK", "HK", "DK"]]
+        ]
+    expected = [HandEvaluator.eval_card_ids(hand) for hand in hands]
+    self.eq(expected, list(HandEvaluator.eval_hand_batch(np.array(hands))))
+    expected = [HandEvaluator.eval_card_ids(hand[:5]) for hand in hands]
+    self.eq(expected, list(HandEvaluator.eval_hand_batch(np.array(hands)[:, :5])))
+
+  def test_eval_hand_batch_with_wrong_shape(self):
+    with self.assertRaises(ValueError):
+      HandEvaluator.eval_hand_batch([1, 2, 3, 4, 5])
+    with self.assertRaises(ValueError):
+      HandEvaluator.eval_hand_batch([[1, 2, 3, 4]])
+
+  def test_gen_hand_info_straight(self):
+    community = [Card.from_str(s) for s in ["C3", "C7", "D2", "D5", "D6"]]
+    hole = [Card.from_str(s) for s in ["C4", "D5"]]
+    info = HandEvaluator.gen_hand_rank_info(hole, community)
+    self.eq({"strength": "STRAIGHT", "high": 3, "low": 0}, info["hand"])
+    self.eq({"high": 5, "low": 4}, info["hole"])
+
+  def test_gen_hand_info_flash_with_one_suited_hole_card(self):
+    community = [Card.from_str(s) for s in ["H2", "H7", "H9", "HJ", "C3"]]
+    hole = [Card.from_str(s) for s in ["H4", "SK"]]
+    info = HandEvaluator.gen_hand_rank_info(hole, community)
+    self.eq({"strength": "FLASH", "high": 11, "low": 0}, info["hand"])
+    self.eq({"high": 4, "low": 13}, info["hole"])
+
+  def test_gen_hand_info_fullhouse_with_two_threecards(self):
+    community = [Card.from_str(s) for s in ["H2", "D2", "S9", "H9", "C3"]]
+    hole = [Card.from_str(s) for s in ["C2", "C9"]]
+    info = HandEvaluator.gen_hand_rank_info(hole, community)
+    self.eq({"strength": "FULLHOUSE", "high": 9, "low": 2}, info["hand"])
+    self.eq({"high": 9, "low": 2}, info["hole"])
+
+  def test_board_evaluator_matches_eval_hand(self):
+    rng = random.Random(7)
+    for board_size in [3, 4, 5]:
+      for _ in range(200):
+        ids = rng.sample(range(1, 53), board_size + 6)
+        community = [Card.from_id(cid) for cid in ids[:board_size]]
+        holes = np.array(ids[board_size:]).reshape(3, 2)
+        board = BoardEvaluator(community)
+        expected = [HandEvaluator.eval_card_ids(list(hole) + ids[:board_size]) for hole in holes]
+        self.eq(expected, [board.eval_hole([Card.from_id(cid) for cid in hole]) for hole in holes])
+        self.eq(expected, board.eval_card_ids_batch(holes).tolist())
+
+  def test_board_evaluator_flush(self):
+    board = BoardEvaluator([Card.from_str(s) for s in ["H2", "H7", "H9", "HJ", "C3"]])
+    flush = [Card.from_str(s) for s in ["H4", "SK"]]
+    pair = [Card.from_str(s) for s in ["SJ", "CK"]]
+    self.true(board.eval_hole(flush) > board.eval_hole(pair))
+
+  def test_board_evaluator_with_wrong_size(self):
+    with self.assertRaises(ValueError):
+      BoardEvaluator([Card.from_str(s) for s in ["H2", "H7"]])
+    board = BoardEvaluator([Card.from_str(s) for s in ["H2", "H7", "H9"]])
+    with self.assertRaises(ValueError):
+      board.eval_card_ids_batch([[1, 2, 3]])
@@ -61,6 +61,16 @@ class MessageBuilderTest(BaseUnitTest):
     self.eq(DataEncoder.encode_round_state(state), msg["round_state"])
     self.eq(DataEncoder.encode_action_histories(table), msg["action_histories"])
 
+  def test_messages_share_encoded_round_state(self):
+    state = self.__setup_state()
+    round_state = DataEncoder.encode_round_state(state)
+    ask = MessageBuilder.build_ask_message(1, state, round_state)["message"]
+    update = MessageBuilder.build_game_update_message(1, "call", 10, state, round_state)["message"]
+    street = MessageBuilder.build_street_start_message(state, round_state)["message"]
+    self.true(all([msg["round_state"] is round_state for msg in [ask, update, street]]))
+    self.eq(DataEncoder.encode_action_histories(state["table"]), ask["action_histories"])
+    self.eq(DataEncoder.encode_action_histories(state["table"]), update["action_histories"])
+
   def test_round_result_message(self):
     state = self.__setup_state()
     winners = state["table"].seats.players[1:2]
@@ -1,4 +1,5 @@
 from tests.base_unittest import BaseUnitTest
+from pypokerengine.engine.action_history import ActionHistory
 from pypokerengine.engine.card import Card
 from pypokerengine.engine.player import Player
 from pypokerengine.engine.poker_constants import PokerConstants as Const
@@ -175,6 +176,22 @@ class PlayerTest(BaseUnitTest):
     self.eq(player.pay_info.amount, restored.pay_info.amount)
     self.eq(player.pay_info.status, restored.pay_info.status)
 
+  def test_serialize_histories_as_dicts(self):
+    player = self.__setup_player_for_serialization()
+    serial = player.serialize()
+    self.true(all(type(h) is dict for h in serial[4]))
+    self.eq([{ "action": "SMALLBLIND", "amount": 5, "add_amount": 5, "uuid": "uuid" }], serial[6][Const.Street.PREFLOP])
+    self.assertIsNone(serial[6][Const.Street.FLOP])
+    restored = Player.deserialize(serial)
+    self.true(isinstance(restored.action_histories[0], ActionHistory))
+    self.true(restored.action_histories[0] is not player.action_histories[0])
+    self.eq(10, restored.paid_sum())
+    self.eq("SMALLBLIND", restored.round_action_histories[Const.Street.PREFLOP][-1].action)
+
+  def test_no_instance_dict(self):
+    self.false(hasattr(self.player, "__dict__"))
+    self.false(hasattr(self.player.pay_info, "__dict__"))
+
   def __setup_player_for_serialization(self):
     player = Player("uuid", 50, "hoge")
     player.add_holecard([Card.from_id(cid) for cid in range(1,3)])
@@ -1,6 +1,7 @@
 from tests.base_unittest import BaseUnitTest
 from mock import patch
 from pypokerengine.engine.round_manager import RoundManager
+from pypokerengine.engine.data_encoder import DataEncoder
 from pypokerengine.engine.game_evaluator import GameEvaluator
 from pypokerengine.engine.poker_constants import PokerConstants as Const
 from pypokerengine.engine.player import Player
@@ -363,6 +364,47 @@ class RoundManagerTest(BaseUnitTest):
     [check(key) for key in ["round_count", "small_blind_amount", "street", "next_player"]]
 
 
+  def test_apply_action_keeps_original_state(self):
+    state, _ = self.__start_round()
+    next_state, _ = RoundManager.apply_action(state, "fold", 0)
+    self.neq(state["table"], next_state["table"])
+    self.eq(PayInfo.PAY_TILL_END, state["table"].seats.players[2].pay_info.status)
+    self.eq(PayInfo.FOLDED, next_state["table"].seats.players[2].pay_info.status)
+
+  def test_inplace_mode(self):
+    table = self.__setup_table()
+    state, _ = RoundManager.start_new_round(1, 5, 0, table, inplace=True)
+    self.true(state["table"] is table)
+    next_state, _ = RoundManager.apply_action(state, "fold", 0, inplace=True)
+    self.true(next_state is state)
+    state, _ = RoundManager.apply_action(state, "call", 10, inplace=True)
+    state, _ = RoundManager.apply_action(state, "call", 10, inplace=True)
+    self.eq(Const.Street.FLOP, state["street"])
+    self.eq([Card.from_id(cid) for cid in range(7,10)], table.get_community_card())
+
+  def test_inplace_mode_plays_like_copy_mode(self):
+    actions = [("fold", 0), ("call", 10), ("call", 10)] + [("call", 0)] * 6
+    states = []
+    for inplace in [False, True]:
+      state, _ = RoundManager.start_new_round(1, 5, 0, self.__setup_table(), inplace=inplace)
+      for action, amount in actions:
+        state, msgs = RoundManager.apply_action(state, action, amount, inplace=inplace)
+      states.append((state["street"], state["table"].serialize(), msgs))
+    self.eq(states[0], states[1])
+
+  def test_round_state_of_messages(self):
+    state, _ = self.__start_round()
+    state, msgs = RoundManager.apply_action(state, "call", 10)
+    update_state, ask_state = [msg[1]["message"]["round_state"] for msg in msgs]
+    self.eq(DataEncoder.encode_round_state(state), ask_state)
+    self.eq(2, update_state["next_player"])
+    self.eq(0, ask_state["next_player"])
+    state, msgs = RoundManager.apply_action(state, "call", 10)
+    state, msgs = RoundManager.apply_action(state, "call", 10)
+    street_state, ask_state = [msg[1]["message"]["round_state"] for msg in msgs[1:]]
+    self.eq("flop", street_state["street"])
+    self.eq(DataEncoder.encode_round_state(state), ask_state)
+
   def __start_round(self):
     table = self.__setup_table()
     round_count = 1
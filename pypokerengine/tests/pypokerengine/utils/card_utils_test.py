@@ -4,6 +4,7 @@ from mock import patch
 from tests.base_unittest import BaseUnitTest
 from pypokerengine.engine.card import Card
 from pypokerengine.engine.deck import Deck
+from pypokerengine.engine.hand_evaluator import HandEvaluator
 
 class CardUtilsTest(BaseUnitTest):
 
@@ -31,6 +32,153 @@ class CardUtilsTest(BaseUnitTest):
             self.eq(0, U._montecarlo_simulation(3, my_cards, community))
             U._pick_unused_card.assert_called_with(4, Any(list))
 
+    def test_estimate_hole_card_win_rate(self):
+        hole = U.gen_cards(["SA", "HA"])
+        community = U.gen_cards(["CA", "DA", "S2"])
+        self.eq(1.0, U.estimate_hole_card_win_rate(100, 3, hole, community, rng=1))
+        hole = U.gen_cards(["C2", "D7"])
+        community = U.gen_cards(["SA", "SK", "SQ", "SJ", "ST"])
+        self.eq(1.0, U.estimate_hole_card_win_rate(100, 9, hole, community, rng=1))
+
+    def test_estimate_hole_card_win_rate_with_seed(self):
+        hole = U.gen_cards(["D6", "D2"])
+        community = U.gen_cards(["D5", "D9", "H6"])
+        rate = U.estimate_hole_card_win_rate(300, 4, hole, community, rng=7)
+        self.eq(rate, U.estimate_hole_card_win_rate(300, 4, hole, community, rng=7))
+        self.true(0.0 < rate < 1.0)
+
+    def test_montecarlo_win_count_on_river(self):
+        import numpy as np
+        hole = U.gen_cards(["HA", "HK"])
+        community = U.gen_cards(["H2", "H7", "C9", "SK", "D3"])
+        community_ids = [card.to_id() for card in community]
+        my_score = HandEvaluator.eval_hand(hole, community)
+        drawn = U.draw_unused_card_ids(np.random.default_rng(1), 500, 10, [card.to_id() for card in hole] + community_ids)
+        opponents = np.hstack([drawn.reshape(-1, 2), np.tile(community_ids, (2500, 1))])
+        opponents_score = HandEvaluator.eval_hand_batch(opponents).reshape(500, 5)
+        expected = int(np.count_nonzero(my_score >= opponents_score.max(axis=1)))
+        self.eq(expected, U._vectorized_montecarlo_win_count(500, 6, hole, community, np.random.default_rng(1)))
+
+    def test_exact_hole_card_win_rate_on_river(self):
+        hole = U.gen_cards(["D6", "D2"])
+        community = U.gen_cards(["D5", "D9", "H6", "CK", "S2"])
+        used = [card.to_id() for card in hole + community]
+        unused = [cid for cid in range(1, 53) if cid not in used]
+        my_score = HandEvaluator.eval_hand(hole, community)
+        not_beaten = [
+            HandEvaluator.eval_card_ids([a, b] + [card.to_id() for card in community]) <= my_score
+            for i, a in enumerate(unused) for b in unused[i+1:]
+            ]
+        expected = 1.0 * sum(not_beaten) / len(not_beaten)
+        self.assertAlmostEqual(expected, U.exact_hole_card_win_rate(2, hole, community))
+
+    def test_exact_hole_card_win_rate_with_invalid_args(self):
+        hole = U.gen_cards(["D6", "D2"])
+        community = U.gen_cards(["D5", "D9", "H6", "CK", "S2"])
+        with self.assertRaises(ValueError):
+            U.exact_hole_card_win_rate(2, hole, [])
+        with self.assertRaises(ValueError):
+            U.exact_hole_card_win_rate(2, hole, community[:2])
+        with self.assertRaises(ValueError):
+            U.exact_hole_card_win_rate(4, hole, community)
+        with patch("pypokerengine.utils.card_utils.EXACT_ENUMERATION_LIMIT", 1000):
+            with self.assertRaises(ValueError):
+                U.exact_hole_card_win_rate(2, hole, community[:4])
+
+    def test_estimate_hole_card_win_rate_switches_to_exact(self):
+        hole = U.gen_cards(["C8", "C9"])
+        community = U.gen_cards(["CT", "CJ", "H2", "S3"])
+        exact = U.exact_hole_card_win_rate(2, hole, community)
+        self.eq(exact, U.estimate_hole_card_win_rate(10, 2, hole, community))
+        self.neq(exact, U.estimate_hole_card_win_rate(10, 2, hole, community, exact_threshold=0))
+        # multiway queries are sampled
+        self.neq(exact ** 2, U.estimate_hole_card_win_rate(10, 3, hole, community))
+
+    def test_preflop_equity(self):
+        aces = U.preflop_equity(U.gen_cards(["SA", "HA"]), 2)
+        self.assertAlmostEqual(0.85, aces, delta=0.01)
+        self.true(aces > U.preflop_equity(U.gen_cards(["C7", "D2"]), 2))
+        self.true(aces > U.preflop_equity(U.gen_cards(["SA", "HA"]), 10))
+        self.true(U.preflop_equity(U.gen_cards(["HK", "HA"]), 6) > U.preflop_equity(U.gen_cards(["SK", "HA"]), 6))
+        self.eq(U.preflop_equity(U.gen_cards(["D9", "DT"]), 3), U.preflop_equity(U.gen_cards(["CT", "C9"]), 3))
+        self.eq(169, len(U.PREFLOP_EQUITY))
+        with self.assertRaises(ValueError):
+            U.preflop_equity(U.gen_cards(["SA", "HA"]), 11)
+
+    def test_estimate_hole_card_win_rate_uses_preflop_table(self):
+        hole = U.gen_cards(["SA", "HA"])
+        self.eq(U.preflop_equity(hole, 4), U.estimate_hole_card_win_rate(10, 4, hole))
+        self.neq(U.preflop_equity(hole, 4), U.estimate_hole_card_win_rate(10, 4, hole, use_preflop_table=False))
+
+    def test_adaptive_hole_card_win_rate(self):
+        hole = U.gen_cards(["D6", "D2"])
+        community = U.gen_cards(["D5", "D9", "H6"])
+        rate, stderr, nb_simulation = U.adaptive_hole_card_win_rate(4, hole, community, target_stderr=0.02, rng=3)
+        self.true(stderr <= 0.02)
+        self.true(nb_simulation < 5000)
+        self.eq((rate, stderr, nb_simulation),
+                U.adaptive_hole_card_win_rate(4, hole, community, target_stderr=0.02, rng=3))
+
+    def test_adaptive_hole_card_win_rate_stops_on_clear_decision(self):
+        hole = U.gen_cards(["SA", "HA"])
+        community = U.gen_cards(["CA", "DA", "S2"])
+        rate, stderr, nb_simulation = U.adaptive_hole_card_win_rate(
+                3, hole, community, target_stderr=0.0001, threshold=0.3, batch_size=100, rng=3)
+        self.eq((1.0, 100), (rate, nb_simulation))
+        rate, stderr, nb_simulation = U.adaptive_hole_card_win_rate(
+                3, hole, community, target_stderr=0.0001, batch_size=100, max_simulation=300, rng=3)
+        self.eq(300, nb_simulation)
+
+    def test_adaptive_hole_card_win_rate_with_invalid_sizes(self):
+        hole = U.gen_cards(["SA", "HA"])
+        community = U.gen_cards(["CA", "DA", "S2"])
+        with self.assertRaises(ValueError):
+            U.adaptive_hole_card_win_rate(3, hole, community, max_simulation=0)
+        with self.assertRaises(ValueError):
+            U.adaptive_hole_card_win_rate(3, hole, community, batch_size=0)
+        with self.assertRaises(ValueError):
+            U.timed_hole_card_win_rate(3, hole, community, time_budget=1, batch_size=-1)
+
+    def test_timed_hole_card_win_rate(self):
+        hole = U.gen_cards(["D6", "D2"])
+        community = U.gen_cards(["D5", "D9", "H6"])
+        # the fake clock advances 10ms per reading, i.e. per batch
+        with patch('pypokerengine.utils.card_utils.time.perf_counter', side_effect=[0.01 * i for i in range(100)]):
+            rate, stderr, nb_simulation = U.timed_hole_card_win_rate(4, hole, community, time_budget=0.05, rng=1)
+        # the 5th batch ends at 0.05 and a 6th one would end after the deadline
+        self.eq(1000, nb_simulation)
+        self.true(0 < rate < 1)
+        with patch('pypokerengine.utils.card_utils.time.perf_counter', side_effect=[0.01 * i for i in range(100)]):
+            _, _, nb_simulation = U.timed_hole_card_win_rate(
+                    4, hole, community, time_budget=1, batch_size=50, max_simulation=120, rng=1)
+        self.eq(120, nb_simulation)
+        with patch('pypokerengine.utils.card_utils.time.perf_counter', side_effect=[10.0, 10.5]):
+            rate, stderr, nb_simulation = U.timed_hole_card_win_rate(4, hole, community, deadline=9.0, batch_size=50)
+        self.eq(50, nb_simulation)
+        with self.assertRaises(ValueError):
+            U.timed_hole_card_win_rate(4, hole, community)
+
+    def test_canonicalize_situation(self):
+        key = U.canonicalize_situation(U.gen_cards(["HA", "HK"]), U.gen_cards(["C2", "D7", "S9"]), 3)
+        self.eq(key, U.canonicalize_situation(U.gen_cards(["SK", "SA"]), U.gen_cards(["H2", "C7", "D9"]), 3))
+        self.eq(key, U.canonicalize_situation(U.gen_cards(["DA", "DK"]), U.gen_cards(["S9", "H2", "C7"]), 3))
+        self.neq(key, U.canonicalize_situation(U.gen_cards(["HA", "HK"]), U.gen_cards(["C2", "D7", "S9"]), 4))
+        self.neq(key, U.canonicalize_situation(U.gen_cards(["HA", "SK"]), U.gen_cards(["C2", "D7", "S9"]), 3))
+        self.neq(key, U.canonicalize_situation(U.gen_cards(["HA", "HK"]), U.gen_cards(["H2", "D7", "S9"]), 3))
+
+    def test_win_rate_cache(self):
+        cache = U.WinRateCache(maxsize=2)
+        rate = cache.estimate_hole_card_win_rate(100, 3, U.gen_cards(["HA", "HK"]), U.gen_cards(["C2", "D7", "S9"]))
+        self.eq(rate, cache.estimate_hole_card_win_rate(100, 3, U.gen_cards(["SA", "SK"]), U.gen_cards(["H2", "C7", "D9"])))
+        self.eq((1, 1), (cache.hits, cache.misses))
+        cache.estimate_hole_card_win_rate(100, 3, U.gen_cards(["HA", "HK"]), U.gen_cards(["C2", "D7", "S8"]))
+        cache.estimate_hole_card_win_rate(100, 3, U.gen_cards(["HA", "HK"]), U.gen_cards(["C2", "D7", "S7"]))
+        self.eq(2, cache.size())
+        cache.estimate_hole_card_win_rate(100, 3, U.gen_cards(["HA", "HK"]), U.gen_cards(["C2", "D7", "S9"]))
+        self.eq((1, 4), (cache.hits, cache.misses))
+        cache.clear()
+        self.eq((0, 0, 0), (cache.hits, cache.misses, cache.size()))
+
     def test_gen_deck(self):
         deck = U.gen_deck()
         self.eq(list(range(1, 53)), [card.to_id() for card in deck.deck])
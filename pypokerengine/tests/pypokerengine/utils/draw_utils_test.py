@@ -0,0 +1,61 @@
+import numpy as np
+
+import pypokerengine.utils.draw_utils as U
+
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+from pypokerengine.utils.card_utils import gen_cards
+
+class DrawUtilsTest(BaseUnitTest):
+
+    def test_flush_draw_on_turn(self):
+        hole = gen_cards(["HA", "HK"])
+        community = gen_cards(["H2", "H7", "C9", "SJ"])
+        odds = U.calc_draw_odds(hole, community)
+        self.eq("HIGHCARD", odds["hand"])
+        self.eq(9, len(odds["outs"]["FLASH"]))
+        # a pair of A, K or any board card that is not a heart
+        self.eq(16, len(odds["outs"]["ONEPAIR"]))
+        self.assertAlmostEqual(9 / 46.0, odds["probabilities"]["FLASH"])
+        self.assertAlmostEqual(25 / 46.0, odds["improve"])
+
+    def test_open_ended_straight_draw_on_flop(self):
+        hole = gen_cards(["C8", "D9"])
+        community = gen_cards(["HT", "SJ", "C2"])
+        odds = U.calc_draw_odds(hole, community)
+        self.eq(["C7", "CQ", "D7", "DQ", "H7", "HQ", "S7", "SQ"], sorted([str(c) for c in odds["outs"]["STRAIGHT"]]))
+        self.assertAlmostEqual(1.0, sum(odds["probabilities"].values()))
+        # 8 outs twice: 1 - (39 * 38) / (47 * 46) of hitting an out on the turn or the river
+        straight = odds["probabilities"]["STRAIGHT"]
+        self.true(straight >= 1 - (39 * 38) / (47 * 46.0) - 0.01)
+
+    def test_made_hand_on_river(self):
+        hole = gen_cards(["SA", "HA"])
+        community = gen_cards(["DA", "C7", "H9", "SJ", "C2"])
+        odds = U.calc_draw_odds(hole, community)
+        self.eq("THREECARD", odds["hand"])
+        self.eq(1.0, odds["probabilities"]["THREECARD"])
+        self.eq(0.0, odds["improve"])
+        self.eq({}, odds["outs"])
+
+    def test_invalid_community_size(self):
+        with self.assertRaises(ValueError):
+            U.calc_draw_odds(gen_cards(["SA", "HA"]), [])
+
+    def test_categories_match_hand_evaluator(self):
+        rng = np.random.RandomState(1)
+        hands = [gen_cards(strs) for strs in [
+            ["HA", "H2", "H3", "H4", "H5", "SA", "DA"],     # wheel straight flush
+            ["SA", "HA", "DA", "CA", "H5", "S5", "D5"],     # four of a kind
+            ["H9", "H2", "H3", "H4", "HK", "S9", "D9"],     # flush over three of a kind
+            ["SA", "D2", "C3", "H4", "S5", "H9", "H8"]      # wheel
+        ]]
+        for card_num in [5, 6, 7]:
+            hands += [[Card.from_id(int(cid)) for cid in rng.choice(np.arange(1, 53), card_num, replace=False)]
+                    for _ in range(300)]
+        for cards in hands:
+            ids = np.array([card.to_id() for card in cards])
+            category = U._categorize_hands(ids[:5], ids[None, 5:], U._categorize_rank_patterns(ids[:5]))[0]
+            strength = HandEvaluator.gen_hand_rank_info(cards[:2], cards[2:])["hand"]["strength"]
+            self.eq(strength, U.CATEGORIES[category])
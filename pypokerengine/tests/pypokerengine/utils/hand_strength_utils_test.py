@@ -0,0 +1,60 @@
+import pypokerengine.utils.hand_strength_utils as U
+
+from itertools import combinations
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+from pypokerengine.utils.card_utils import gen_cards
+
+class HandStrengthUtilsTest(BaseUnitTest):
+
+    def test_matches_nested_enumeration_on_turn(self):
+        hole = gen_cards(["H4", "H5"])
+        community = gen_cards(["H9", "H6", "C7", "SK"])
+        result = U.calc_hand_strength(hole, community)
+        hs, ppot, npot = self.__naive_hand_strength(hole, community)
+        self.assertAlmostEqual(hs, result["hs"])
+        self.assertAlmostEqual(ppot, result["ppot"])
+        self.assertAlmostEqual(npot, result["npot"])
+        self.assertAlmostEqual(hs * (1 - npot) + (1 - hs) * ppot, result["ehs"])
+
+    def test_flop(self):
+        result = U.calc_hand_strength(gen_cards(["SA", "HA"]), gen_cards(["DA", "C7", "H2"]))
+        self.true(result["hs"] > 0.99)
+        self.eq(0.0, result["ppot"])
+        self.true(0 < result["npot"] < 0.05)
+
+    def test_nb_player(self):
+        hole, community = gen_cards(["SK", "HQ"]), gen_cards(["DK", "C7", "H2"])
+        heads_up = U.calc_hand_strength(hole, community)
+        self.assertAlmostEqual(heads_up["hs"] ** 3, U.calc_hand_strength(hole, community, nb_player=4)["hs"])
+
+    def test_sampled_lookahead(self):
+        hole, community = gen_cards(["H4", "H5"]), gen_cards(["H9", "H6", "C7"])
+        exact = U.calc_hand_strength(hole, community)
+        sampled = U.calc_hand_strength(hole, community, nb_simulation=20000, rng=3)
+        self.eq(exact["hs"], sampled["hs"])
+        self.assertAlmostEqual(exact["ppot"], sampled["ppot"], delta=0.02)
+        self.assertAlmostEqual(exact["npot"], sampled["npot"], delta=0.02)
+
+    def test_invalid_community_size(self):
+        with self.assertRaises(ValueError):
+            U.calc_hand_strength(gen_cards(["SA", "HA"]), gen_cards(["DA", "C7", "H2", "S3", "S4"]))
+
+    def __naive_hand_strength(self, hole, community):
+        hole_ids, community_ids = [c.to_id() for c in hole], [c.to_id() for c in community]
+        unused = [cid for cid in range(1, 53) if cid not in hole_ids + community_ids]
+        state = lambda mine, other: 0 if mine > other else (1 if mine == other else 2)
+        transition, now_count = [[0] * 3 for _ in range(3)], [0] * 3
+        my_now = HandEvaluator.eval_card_ids(hole_ids + community_ids)
+        for opponent in combinations(unused, 2):
+            now = state(my_now, HandEvaluator.eval_card_ids(list(opponent) + community_ids))
+            now_count[now] += 1
+            for river in [cid for cid in unused if cid not in opponent]:
+                mine = HandEvaluator.eval_card_ids(hole_ids + community_ids + [river])
+                other = HandEvaluator.eval_card_ids(list(opponent) + community_ids + [river])
+                transition[now][state(mine, other)] += 1
+        total = [sum(row) for row in transition]
+        hs = (now_count[0] + now_count[1] / 2.0) / sum(now_count)
+        ppot = (transition[2][0] + transition[2][1] / 2.0 + transition[1][0] / 2.0) / (total[2] + total[1] / 2.0)
+        npot = (transition[0][2] + transition[1][2] / 2.0 + transition[0][1] / 2.0) / (total[0] + total[1] / 2.0)
+        return hs, ppot, npot
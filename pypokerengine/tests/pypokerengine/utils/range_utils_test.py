@@ -0,0 +1,68 @@
+import pypokerengine.utils.range_utils as U
+
+from itertools import combinations
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.engine.card import Card
+from pypokerengine.utils.card_utils import gen_cards, exact_hole_card_win_rate
+
+class RangeUtilsTest(BaseUnitTest):
+
+    def test_range_from_hand_classes(self):
+        self.eq(6, len(U.range_from_hand_classes(["AA"])))
+        self.eq(4, len(U.range_from_hand_classes(["AKs"])))
+        self.eq(12, len(U.range_from_hand_classes(["AKo"])))
+        self.eq(16, len(U.range_from_hand_classes(["AK"])))
+        self.eq({ ("CA", "CK"): 0.5 }, { k: v for k, v in U.range_from_hand_classes(["AKs"], 0.5).items() if k[0] == "CA" })
+
+    def test_hand_vs_full_range_is_heads_up_win_rate(self):
+        hole = gen_cards(["SA", "HA"])
+        community = gen_cards(["D2", "C7", "HK", "S9"])
+        full_range = { (str(c1), str(c2)): 1 for c1, c2 in combinations(Card.all_cards(), 2) }
+        win_rate = U.hand_vs_range_win_rate(hole, full_range, community)
+        self.assertAlmostEqual(exact_hole_card_win_rate(2, hole, community), win_rate, delta=1e-9)
+
+    def test_hand_vs_range_on_river(self):
+        hole = gen_cards(["SA", "HA"])
+        community = gen_cards(["D2", "C7", "HK", "S9", "C3"])
+        self.eq(1.0, U.hand_vs_range_win_rate(hole, { ("SQ", "HQ"): 1 }, community))
+        self.eq(0.0, U.hand_vs_range_win_rate(hole, { ("SK", "DK"): 1 }, community))
+        # the set of kings gets 3 times the weight of the queens
+        opponent_range = { ("SQ", "HQ"): 1, ("SK", "DK"): 3 }
+        self.eq(0.25, U.hand_vs_range_win_rate(hole, opponent_range, community))
+
+    def test_card_removal(self):
+        hole = gen_cards(["SA", "HA"])
+        community = gen_cards(["D2", "C7", "HK", "S9", "C3"])
+        opponent_range = { ("SQ", "HQ"): 1, ("SK", "HK"): 100, ("SA", "DA"): 100 }
+        self.eq(1.0, U.hand_vs_range_win_rate(hole, opponent_range, community))
+
+    def test_range_vs_range_skips_overlapping_pairs(self):
+        community = gen_cards(["D2", "C7", "HK", "S9", "C3"])
+        hero_range = { ("SA", "HA"): 1, ("SQ", "HQ"): 1 }
+        opponent_range = { ("SA", "DA"): 1, ("SQ", "DQ"): 1 }
+        # only AA vs QQ and QQ vs AA survive card removal
+        self.eq(0.5, U.range_vs_range_win_rate(hero_range, opponent_range, community))
+
+    def test_sampled_win_rate(self):
+        hero_range = U.range_from_hand_classes(["AA"])
+        opponent_range = U.range_from_hand_classes(["72o"])
+        win_rate = U.range_vs_range_win_rate(hero_range, opponent_range, nb_simulation=2000, rng=1)
+        self.true(0.84 < win_rate < 0.91)
+        self.eq(win_rate, U.range_vs_range_win_rate(hero_range, opponent_range, nb_simulation=2000, rng=1))
+
+    def test_sampled_matches_exact(self):
+        hole = gen_cards(["SA", "HA"])
+        community = gen_cards(["D2", "C7", "HK"])
+        opponent_range = U.range_from_hand_classes(["KK", "77", "AKs"])
+        exact = U.hand_vs_range_win_rate(hole, opponent_range, community)
+        sampled = U.hand_vs_range_win_rate(hole, opponent_range, community, nb_simulation=5000, rng=2, exact_threshold=0)
+        self.assertAlmostEqual(exact, sampled, delta=0.03)
+
+    def test_invalid_range(self):
+        community = gen_cards(["SA", "HA", "C2"])
+        with self.assertRaises(ValueError):
+            U.hand_vs_range_win_rate(gen_cards(["SK", "HK"]), { ("SA", "DA"): 1 }, community)
+        with self.assertRaises(ValueError):
+            U.hand_vs_range_win_rate(gen_cards(["SK", "HK"]), { ("SQ", "SQ"): 1 }, community)
+        with self.assertRaises(ValueError):
+            U.range_vs_range_win_rate({ ("SK", "HK"): 1 }, { ("SK", "DK"): 1 }, community)
@@ -0,0 +1,67 @@
+import contextlib
+import io
+import random
+
+from tests.base_unittest import BaseUnitTest
+from pypokerengine.engine.player import Player
+from pypokerengine.engine.table import Table
+from pypokerengine.engine.round_manager import RoundManager
+from pypokerengine.engine.message_builder import MessageBuilder
+from pypokerengine.engine.poker_constants import PokerConstants as Const
+from pypokerengine.utils.round_state_utils import RoundStateTracker, delta_from_update_message
+
+DELTA_KEYS = ["action", "history", "seat", "pot", "next_player"]
+
+class RoundStateUtilsTest(BaseUnitTest):
+
+    def test_rebuild_round_state_from_deltas(self):
+        for seed in range(10):
+            full_msgs, delta_msgs = [self.__play_round(seed, delta) for delta in [False, True]]
+            self.eq(len(full_msgs), len(delta_msgs))
+            tracker = RoundStateTracker()
+            for full, delta in zip(full_msgs, delta_msgs):
+                message_type = delta["message_type"]
+                if message_type in [MessageBuilder.STREET_START_MESSAGE, MessageBuilder.ROUND_RESULT_MESSAGE]:
+                    self.eq(full, delta)
+                    tracker.load(delta["round_state"])
+                elif message_type == MessageBuilder.GAME_UPDATE_DELTA_MESSAGE:
+                    self.eq(delta_from_update_message(full), {k: delta[k] for k in DELTA_KEYS})
+                    tracker.apply_update(delta)
+                    self.eq(full["round_state"], tracker.round_state())
+                elif message_type == MessageBuilder.ASK_MESSAGE:
+                    self.false("round_state" in delta)
+                    self.eq(full["valid_actions"], delta["valid_actions"])
+                    tracker.apply_ask(delta)
+                    self.eq(full["round_state"], tracker.round_state())
+
+    def test_round_state_is_a_copy(self):
+        tracker = RoundStateTracker()
+        msgs = self.__play_round(0, True)
+        tracker.load(msgs[0]["round_state"])
+        tracker.round_state()["seats"][0]["stack"] = -1
+        self.neq(-1, tracker.round_state()["seats"][0]["stack"])
+
+    def test_not_loaded(self):
+        with self.assertRaises(ValueError):
+            RoundStateTracker().round_state()
+
+    def __play_round(self, seed, delta):
+        """Messages (except round start ones) of a round played with seeded random actions"""
+        random.seed(seed)
+        rng = random.Random(seed)
+        table = Table()
+        for i in range(5):
+            table.seats.sitdown(Player("uuid%d" % i, rng.choice([30, 100, 200]), "p%d" % i))
+        table.set_blind_pos(1, 2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            state, msgs = RoundManager.start_new_round(1, 5, 1, table, delta=delta)
+            messages = [m for _, m in msgs][5:]
+            while state["street"] != Const.Street.FINISHED:
+                valid_actions = messages[-1]["message"]["valid_actions"]
+                r = rng.random()
+                if r < 0.15: action, amount = "fold", 0
+                elif r < 0.7 or valid_actions[2]["amount"]["min"] == -1: action, amount = "call", valid_actions[1]["amount"]
+                else: action, amount = "raise", rng.choice(list(valid_actions[2]["amount"].values()))
+                state, msgs = RoundManager.apply_action(state, action, amount)
+                messages += [m for _, m in msgs]
+        return [m["message"] for m in messages]
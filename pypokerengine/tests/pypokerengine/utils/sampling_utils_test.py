@@ -0,0 +1,32 @@
+import numpy as np
+import pypokerengine.utils.sampling_utils as U
+
+from tests.base_unittest import BaseUnitTest
+
+class SamplingUtilsTest(BaseUnitTest):
+
+    def test_draw_unused_card_ids(self):
+        drawn = U.draw_unused_card_ids(np.random.default_rng(1), 50, 10, [1, 2, 52])
+        self.eq((50, 10), drawn.shape)
+        for row in drawn:
+            self.eq(10, len(set(row)))
+            self.false(set(row) & set([1, 2, 52]))
+
+    def test_draw_unused_card_ids_with_seed(self):
+        draw = lambda: U.draw_unused_card_ids(np.random.default_rng(7), 5, 3, [])
+        self.eq(draw().tolist(), draw().tolist())
+
+    def test_to_np_rng(self):
+        self.eq(U.to_np_rng(3).random(), U.to_np_rng(3).random())
+        rng = np.random.default_rng(1)
+        self.true(U.to_np_rng(rng) is rng)
+
+    def test_combination_array(self):
+        combos = U.combination_array(np.array([1, 5, 9, 12]), 2)
+        self.eq([[1, 5], [1, 9], [1, 12], [5, 9], [5, 12], [9, 12]], combos.tolist())
+        self.eq((1, 0), U.combination_array(np.array([1, 5]), 0).shape)
+
+    def test_encode_card_ids(self):
+        codes = U.encode_card_ids(U.combination_array(np.arange(1, 53), 2))
+        self.eq(1326, len(set(codes.tolist())))
+        self.eq([1 * 53 + 2], U.encode_card_ids(np.array([[1, 2]])).tolist())